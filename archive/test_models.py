@@ -1,10 +1,10 @@
 
-from anthropic import Anthropic
+import asyncio
+from anthropic import AsyncAnthropic
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
-client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
 # Try different model names
 models_to_test = [
@@ -13,13 +13,25 @@ models_to_test = [
     "claude-3-5-sonnet-20241022",
 ]
 
-for model in models_to_test:
+
+async def probe(client: AsyncAnthropic, model: str) -> str:
     try:
-        response = client.messages.create(
+        await client.messages.create(
             model=model,
             max_tokens=10,
             messages=[{"role": "user", "content": "Hi"}]
         )
-        print(f"✅ {model}: WORKS")
+        return f"✅ {model}: WORKS"
     except Exception as e:
-        print(f"❌ {model}: {str(e)[:50]}")
+        return f"❌ {model}: {str(e)[:50]}"
+
+
+async def main():
+    # All probes in flight at once: total time ~ slowest model, not the sum
+    client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    results = await asyncio.gather(*(probe(client, model) for model in models_to_test))
+    for line in results:
+        print(line)
+
+
+asyncio.run(main())
@@ -2,28 +2,32 @@
 Performance and load testing
 CRITICAL for production readiness
 """
+import asyncio
 import pytest
 import time
 from orchestrator import Orchestrator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """One Orchestrator for the whole module (graph compiled once)"""
+    return Orchestrator()
+
+
 class TestResponseTime:
     """Validate response times meet SLA"""
     
-    def test_text_query_response_under_5_seconds(self):
+    def test_text_query_response_under_5_seconds(self, orchestrator):
         """Text queries should respond < 5s"""
-        orchestrator = Orchestrator()
-        
         start = time.time()
         result = orchestrator.process(user_input="Quando scade l'IVA?")
         duration = time.time() - start
         
         assert duration < 5.0, f"Response took {duration}s (target: <5s)"
     
-    def test_booking_flow_response_under_8_seconds(self):
+    def test_booking_flow_response_under_8_seconds(self, orchestrator):
         """Booking (with DB write) should respond < 8s"""
-        orchestrator = Orchestrator()
-        
         start = time.time()
         result = orchestrator.process(
             user_input="Vorrei un appuntamento domani alle 15"
@@ -36,28 +40,31 @@ class TestResponseTime:
 class TestConcurrency:
     """Test system handles concurrent requests"""
     
-    def test_10_concurrent_queries(self):
+    def test_10_concurrent_queries(self, orchestrator):
         """System should handle 10 simultaneous queries"""
-        orchestrator = Orchestrator()
-        
-        def query():
-            return orchestrator.process(user_input="Test query")
+        async def run_all():
+            return await asyncio.gather(
+                *(orchestrator.aprocess(user_input="Test query") for _ in range(10))
+            )
         
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(query) for _ in range(10)]
-            results = [f.result() for f in as_completed(futures)]
+        results = asyncio.run(run_all())
         
         # All should succeed
         assert len(results) == 10
         assert all(r.get("response") for r in results)
     
-    def test_database_connection_pool(self):
+    def test_database_connection_pool(self, orchestrator):
         """Database should not exhaust connections"""
-        orchestrator = Orchestrator()
+        # 50 concurrent queries should not cause connection errors.
+        # Distinct inputs so the response cache cannot absorb the burst.
+        def query(i):
+            return orchestrator.process(user_input=f"A che ora chiudete? ({i})")
         
-        # 50 queries should not cause connection errors
-        for i in range(50):
-            result = orchestrator.process(
-                user_input="A che ora chiudete?"
-            )
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [executor.submit(query, i) for i in range(50)]
+            results = [f.result() for f in as_completed(futures)]
+        
+        assert len(results) == 50
+        for result in results:
+            assert result is not None
             assert "error" not in result or result["error"] is None
\ No newline at end of file
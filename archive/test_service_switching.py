@@ -12,11 +12,17 @@ This script validates:
 4. No crashes or unexpected behavior during switching
 
 Run: python test_service_switching.py
+ or: pytest test_service_switching.py
 """
+import importlib
 import os
+import re
 import sys
+from functools import partial
 from pathlib import Path
 
+import pytest
+
 # Color codes
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -25,128 +31,94 @@ BLUE = '\033[94m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Prebuilt output fragments (the helpers below only concatenate)
+_HEADER_BAR = f"{BOLD}{BLUE}{'─' * 70}{RESET}"
+_HEADER_TITLE = f"{BOLD}{BLUE}TEST: "
+_PASS_PREFIX = f"{GREEN}✅ PASS: "
+_FAIL_PREFIX = f"{RED}❌ FAIL: "
+_INFO_PREFIX = f"{BLUE}ℹ️  "
+
+# config's rejection message for a bad SERVICE_MODE
+_INVALID_MODE_RE = re.compile(r'Invalid SERVICE_MODE')
+
+# First active SERVICE_MODE assignment in a .env file
+_SERVICE_MODE_RE = re.compile(r'^\s*SERVICE_MODE\s*=\s*([^\s#]*)', re.M)
+
 def print_test_header(test_name):
     """Print test section header"""
-    print(f"\n{BOLD}{BLUE}{'─' * 70}{RESET}")
-    print(f"{BOLD}{BLUE}TEST: {test_name}{RESET}")
-    print(f"{BOLD}{BLUE}{'─' * 70}{RESET}")
+    print("\n" + _HEADER_BAR)
+    print(_HEADER_TITLE + test_name + RESET)
+    print(_HEADER_BAR)
 
 def print_pass(message):
     """Print test passed"""
-    print(f"{GREEN}✅ PASS: {message}{RESET}")
+    print(_PASS_PREFIX + message + RESET)
 
 def print_fail(message):
     """Print test failed"""
-    print(f"{RED}❌ FAIL: {message}{RESET}")
+    print(_FAIL_PREFIX + message + RESET)
 
 def print_info(message):
     """Print info message"""
-    print(f"{BLUE}ℹ️  {message}{RESET}")
+    print(_INFO_PREFIX + message + RESET)
 
-def test_default_mode():
-    """Test 1: Default SERVICE_MODE should be 'mock'"""
-    print_test_header("Default Mode (No Environment Variable)")
+def _reload_with_mode(mode):
+    """
+    Set SERVICE_MODE (None = unset) and re-execute config in place.
     
-    try:
-        # Clear environment
-        if 'SERVICE_MODE' in os.environ:
-            del os.environ['SERVICE_MODE']
-        
-        # Clear cached import
-        if 'config' in sys.modules:
-            del sys.modules['config']
-        
-        # Import config
-        import config
-        
-        print_info(f"SERVICE_MODE value: {config.SERVICE_MODE}")
-        
-        if config.SERVICE_MODE == "mock":
-            print_pass("Default mode is 'mock'")
-            return True
-        else:
-            print_fail(f"Expected 'mock', got '{config.SERVICE_MODE}'")
-            return False
-            
-    except Exception as e:
-        print_fail(f"Exception during test: {e}")
-        return False
-
-def test_mock_mode_explicit():
-    """Test 2: Explicit SERVICE_MODE=mock"""
-    print_test_header("Explicit Mock Mode (SERVICE_MODE=mock)")
+    The module object stays cached in sys.modules, so later reloads skip
+    the import machinery; a failed reload (invalid mode) propagates.
+    """
+    if mode is None:
+        os.environ.pop('SERVICE_MODE', None)
+    else:
+        os.environ['SERVICE_MODE'] = mode
     
-    try:
-        # Set environment
-        os.environ['SERVICE_MODE'] = 'mock'
-        
-        # Clear cached import
-        if 'config' in sys.modules:
-            del sys.modules['config']
-        
-        # Import config
+    config = sys.modules.get('config')
+    if config is None:
         import config
-        
-        print_info(f"SERVICE_MODE value: {config.SERVICE_MODE}")
-        
-        if config.SERVICE_MODE == "mock":
-            print_pass("Mock mode correctly set via environment")
-            return True
-        else:
-            print_fail(f"Expected 'mock', got '{config.SERVICE_MODE}'")
-            return False
-            
-    except Exception as e:
-        print_fail(f"Exception during test: {e}")
-        return False
+        return config
+    return importlib.reload(config)
+
+# (SERVICE_MODE to set, expected config.SERVICE_MODE, header)
+MODE_CASES = [
+    (None, "mock", "Default Mode (No Environment Variable)"),
+    ("mock", "mock", "Explicit Mock Mode (SERVICE_MODE=mock)"),
+    ("real", "real", "Real Mode (SERVICE_MODE=real)"),
+]
 
-def test_real_mode():
-    """Test 3: SERVICE_MODE=real"""
-    print_test_header("Real Mode (SERVICE_MODE=real)")
+def check_mode(mode, expected, header):
+    """SERVICE_MODE from the environment (or its default) reaches config"""
+    print_test_header(header)
     
     try:
-        # Set environment
-        os.environ['SERVICE_MODE'] = 'real'
-        
-        # Clear cached import
-        if 'config' in sys.modules:
-            del sys.modules['config']
-        
-        # Import config
-        import config
+        config = _reload_with_mode(mode)
         
         print_info(f"SERVICE_MODE value: {config.SERVICE_MODE}")
         
-        if config.SERVICE_MODE == "real":
-            print_pass("Real mode correctly set via environment")
+        if config.SERVICE_MODE == expected:
+            print_pass(f"SERVICE_MODE resolved to '{expected}'")
             return True
         else:
-            print_fail(f"Expected 'real', got '{config.SERVICE_MODE}'")
+            print_fail(f"Expected '{expected}', got '{config.SERVICE_MODE}'")
             return False
             
     except Exception as e:
         print_fail(f"Exception during test: {e}")
         return False
 
-def test_invalid_mode():
-    """Test 4: Invalid SERVICE_MODE should raise error"""
+def check_invalid_mode():
+    """Invalid SERVICE_MODE should raise error"""
     print_test_header("Invalid Mode (SERVICE_MODE=invalid)")
     
     try:
-        # Set environment to invalid value
-        os.environ['SERVICE_MODE'] = 'invalid'
-        
-        # Clear cached import
-        if 'config' in sys.modules:
-            del sys.modules['config']
-        
-        # Try to import config - should raise error
+        # Reload config with an invalid value - should raise error
         try:
-            import config
+            _reload_with_mode('invalid')
             print_fail("Config imported with invalid SERVICE_MODE (should raise error)")
             return False
         except ValueError as e:
-            if "Invalid SERVICE_MODE" in str(e):
+            if _INVALID_MODE_RE.search(str(e)):
                 print_pass("Invalid SERVICE_MODE correctly rejected")
                 return True
             else:
@@ -157,20 +129,15 @@ def test_invalid_mode():
         print_fail(f"Unexpected exception: {e}")
         return False
 
-def test_service_factory_integration():
-    """Test 5: Service factory responds to SERVICE_MODE"""
+def check_service_factory_integration():
+    """Service factory responds to SERVICE_MODE"""
     print_test_header("Service Factory Integration")
     
     try:
         # Test mock mode
-        os.environ['SERVICE_MODE'] = 'mock'
-        if 'config' in sys.modules:
-            del sys.modules['config']
-        if 'services.factory' in sys.modules:
-            del sys.modules['services.factory']
-        
-        import config
-        from services.factory import ServiceFactory
+        _reload_with_mode('mock')
+        import services.factory
+        ServiceFactory = importlib.reload(services.factory).ServiceFactory
         
         print_info("Testing mock mode service factory...")
         factory = ServiceFactory(mode="mock")
@@ -184,14 +151,8 @@ def test_service_factory_integration():
             print_info("Note: Service might not have 'Mock' in name, but should still be mock implementation")
         
         # Test real mode
-        os.environ['SERVICE_MODE'] = 'real'
-        if 'config' in sys.modules:
-            del sys.modules['config']
-        if 'services.factory' in sys.modules:
-            del sys.modules['services.factory']
-        
-        import config
-        from services.factory import ServiceFactory
+        _reload_with_mode('real')
+        ServiceFactory = importlib.reload(services.factory).ServiceFactory
         
         print_info("\nTesting real mode service factory...")
         factory = ServiceFactory(mode="real")
@@ -210,8 +171,8 @@ def test_service_factory_integration():
         print_fail(f"Exception during test: {e}")
         return False
 
-def test_dotenv_file():
-    """Test 6: .env file configuration"""
+def check_dotenv_file():
+    """.env file configuration"""
     print_test_header(".env File Configuration")
     
     env_path = Path(".env")
@@ -226,36 +187,52 @@ def test_dotenv_file():
     # Read .env content
     content = env_path.read_text(encoding='utf-8')
     
-    if 'SERVICE_MODE' in content:
-        # Extract value
-        for line in content.split('\n'):
-            if line.strip().startswith('SERVICE_MODE'):
-                print_info(f"Found: {line.strip()}")
-                
-                # Validate value
-                if '=' in line:
-                    value = line.split('=', 1)[1].strip()
-                    if value in ['mock', 'real']:
-                        print_pass(f"SERVICE_MODE correctly configured in .env: {value}")
-                        return True
-                    else:
-                        print_fail(f"Invalid SERVICE_MODE value in .env: {value}")
-                        return False
+    match = _SERVICE_MODE_RE.search(content)
+    if match:
+        print_info(f"Found: {match.group(0).strip()}")
+        
+        # Validate value
+        value = match.group(1)
+        if value in ['mock', 'real']:
+            print_pass(f"SERVICE_MODE correctly configured in .env: {value}")
+            return True
+        else:
+            print_fail(f"Invalid SERVICE_MODE value in .env: {value}")
+            return False
     else:
         print_info("SERVICE_MODE not configured in .env")
         print_info("Add this line to .env: SERVICE_MODE=mock")
         return True  # Not a failure, just info
 
+# ---------------------------------------------------------------------------
+# pytest entry points (the check_* functions above drive the script runner)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def service_mode_env(monkeypatch):
+    """Restore SERVICE_MODE and re-execute config after the test"""
+    yield monkeypatch
+    monkeypatch.undo()
+    _reload_with_mode(os.environ.get('SERVICE_MODE'))
+
+@pytest.mark.parametrize("mode,expected", [(mode, expected) for mode, expected, _ in MODE_CASES])
+def test_service_mode(mode, expected, service_mode_env):
+    if mode is None:
+        service_mode_env.delenv('SERVICE_MODE', raising=False)
+    else:
+        service_mode_env.setenv('SERVICE_MODE', mode)
+    assert _reload_with_mode(mode).SERVICE_MODE == expected
+
+def test_invalid_mode(service_mode_env):
+    service_mode_env.setenv('SERVICE_MODE', 'invalid')
+    with pytest.raises(ValueError, match=_INVALID_MODE_RE):
+        _reload_with_mode('invalid')
+
 def cleanup():
     """Clean up test environment"""
-    # Remove test environment variable
-    if 'SERVICE_MODE' in os.environ:
-        del os.environ['SERVICE_MODE']
-    
-    # Clear module cache
-    for module in ['config', 'services.factory']:
-        if module in sys.modules:
-            del sys.modules[module]
+    # Remove test environment variable; modules stay cached, since every
+    # test reloads config itself via _reload_with_mode()
+    os.environ.pop('SERVICE_MODE', None)
 
 def main():
     """Run all tests"""
@@ -267,12 +244,12 @@ def main():
     print(f"{RESET}\n")
     
     tests = [
-        ("Default mode (no env var)", test_default_mode),
-        ("Explicit mock mode", test_mock_mode_explicit),
-        ("Real mode", test_real_mode),
-        ("Invalid mode rejection", test_invalid_mode),
-        ("Service factory integration", test_service_factory_integration),
-        (".env file configuration", test_dotenv_file),
+        (header, partial(check_mode, mode, expected, header))
+        for mode, expected, header in MODE_CASES
+    ] + [
+        ("Invalid mode rejection", check_invalid_mode),
+        ("Service factory integration", check_service_factory_integration),
+        (".env file configuration", check_dotenv_file),
     ]
     
     results = []
@@ -1,21 +1,51 @@
 # test_voice_handler.py
 """
 Unit tests for voice_handler.py
-Run with: pytest test_voice_handler.py -v
+Run with: pytest test_voice_handler.py -v  (add -n auto to spread cases over workers)
 """
 
+import asyncio
+import os
+import re
 import pytest
+from contextlib import contextmanager
 from pathlib import Path
 from voice_handler import VoiceHandler
 import config
 
+# Expected validation error messages
+_RE_FORMAT = re.compile(r"Formato audio non supportato")
+_RE_TOO_LARGE = re.compile(r"troppo grande")
+_RE_EMPTY = re.compile(r"vuoto")
+
+@contextmanager
+def _synth(handler, text, **kwargs):
+    """Synthesize to a temp MP3 that is removed even if the test fails"""
+    path = Path(handler.synthesize(text, **kwargs))
+    try:
+        yield path
+    finally:
+        path.unlink(missing_ok=True)
+
 # Create test fixtures
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def temp_dir():
+    """Create the shared temp directory once per session"""
+    config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    return config.TEMP_DIR
+
+@pytest.fixture(scope="session")
 def voice_handler():
-    """Create VoiceHandler instance"""
+    """Shared VoiceHandler instance (holds no per-test state)"""
     return VoiceHandler()
 
 @pytest.fixture
+def tmp_handler(tmp_path, monkeypatch):
+    """VoiceHandler writing to an isolated temp dir, for destructive tests"""
+    monkeypatch.setattr(config, "TEMP_DIR", tmp_path)
+    return VoiceHandler()
+
+@pytest.fixture(scope="session")
 def sample_text():
     """Sample Italian text for TTS testing"""
     return "Buongiorno, sono un assistente fiscale AI per lo studio commercialista."
@@ -47,44 +77,89 @@ class TestTranscriptionValidation:
         invalid_file = tmp_path / "test.txt"
         invalid_file.write_text("dummy")
         
-        with pytest.raises(ValueError, match="Formato audio non supportato"):
+        with pytest.raises(ValueError, match=_RE_FORMAT):
             voice_handler.transcribe(str(invalid_file))
     
     def test_transcribe_file_too_large(self, voice_handler, tmp_path):
         """Should raise ValueError for files >25MB"""
-        # Create a 26MB dummy file
+        # Create a 26MB dummy file (sparse: only the size is checked)
         large_file = tmp_path / "large.wav"
-        large_file.write_bytes(b"0" * (26 * 1024 * 1024))
+        fd = os.open(large_file, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, 26 * 1024 * 1024)
+        finally:
+            os.close(fd)
         
-        with pytest.raises(ValueError, match="troppo grande"):
+        with pytest.raises(ValueError, match=_RE_TOO_LARGE):
             voice_handler.transcribe(str(large_file))
 
 
+class TestAsyncValidation:
+    """Async variants share the sync validations (no API call is made)"""
+    
+    def test_atranscribe_nonexistent_file(self, voice_handler):
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(voice_handler.atranscribe("nonexistent_file.wav"))
+    
+    def test_asynthesize_empty_text(self, voice_handler):
+        with pytest.raises(ValueError, match=_RE_EMPTY):
+            asyncio.run(voice_handler.asynthesize(""))
+    
+    def test_synthesize_many_empty_text(self, voice_handler):
+        with pytest.raises(ValueError, match=_RE_EMPTY):
+            asyncio.run(voice_handler.synthesize_many(["", "   "]))
+    
+    def test_prewarm_tts_cache_empty_text(self, voice_handler):
+        with pytest.raises(ValueError, match=_RE_EMPTY):
+            asyncio.run(voice_handler.prewarm_tts_cache(["Ciao.", ""]))
+    
+    def test_synthesize_long_empty_text(self, voice_handler):
+        with pytest.raises(ValueError, match=_RE_EMPTY):
+            asyncio.run(voice_handler.synthesize_long(" \n "))
+    
+    def test_synthesize_long_rejects_flac(self, voice_handler, sample_text):
+        with pytest.raises(ValueError, match=r"testi lunghi"):
+            asyncio.run(voice_handler.synthesize_long(sample_text, output_format="flac"))
+    
+    def test_split_sentences_packs_chunks(self):
+        text = "Prima frase. Seconda frase!\n" + "parola " * 200
+        chunks = VoiceHandler._split_sentences(text, max_chars=100)
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert chunks[0] == "Prima frase. Seconda frase!"
+        assert " ".join(chunks).split() == text.split()
+
+
 class TestSynthesisValidation:
     """Test input validation for synthesis"""
     
     def test_synthesize_empty_text(self, voice_handler):
         """Should raise ValueError for empty text"""
-        with pytest.raises(ValueError, match="vuoto"):
+        with pytest.raises(ValueError, match=_RE_EMPTY):
             voice_handler.synthesize("")
     
+    def test_synthesize_bytes_empty_text(self, voice_handler):
+        """In-memory variants share the same validation"""
+        with pytest.raises(ValueError, match=_RE_EMPTY):
+            voice_handler.synthesize_bytes("")
+    
+    def test_synthesize_stream_empty_text(self, voice_handler):
+        """Validation happens on call, before any chunk is requested"""
+        with pytest.raises(ValueError, match=_RE_EMPTY):
+            voice_handler.synthesize_stream("   ")
+    
     def test_synthesize_text_too_long(self, voice_handler):
         """Should truncate text >4096 chars instead of failing"""
         long_text = "a" * 5000
-        result_path = voice_handler.synthesize(long_text)
         
         # Should succeed (truncate, not fail)
-        assert Path(result_path).exists()
-        
-        # Cleanup
-        Path(result_path).unlink()
+        with _synth(voice_handler, long_text) as result_path:
+            assert os.stat(result_path).st_size > 0
     
     def test_synthesize_invalid_speed(self, voice_handler, sample_text):
         """Should default to 1.0 for invalid speed"""
         # Should not raise, should default
-        result_path = voice_handler.synthesize(sample_text, speed=10.0)
-        assert Path(result_path).exists()
-        Path(result_path).unlink()
+        with _synth(voice_handler, sample_text, speed=10.0) as result_path:
+            assert os.stat(result_path).st_size > 0
 
 
 class TestSynthesisSuccess:
@@ -92,36 +167,30 @@ class TestSynthesisSuccess:
     
     def test_synthesize_creates_file(self, voice_handler, sample_text):
         """Should create MP3 file"""
-        result_path = voice_handler.synthesize(sample_text)
-        
-        assert Path(result_path).exists()
-        assert Path(result_path).suffix == ".mp3"
-        assert Path(result_path).stat().st_size > 0
-        
-        # Cleanup
-        Path(result_path).unlink()
+        with _synth(voice_handler, sample_text) as result_path:
+            # One stat call: raises FileNotFoundError if the file is missing
+            st = os.stat(result_path)
+            assert result_path.suffix == ".mp3"
+            assert st.st_size > 0
     
-    def test_synthesize_different_voices(self, voice_handler, sample_text):
+    @pytest.mark.parametrize("voice", ["alloy", "echo", "nova"])
+    def test_synthesize_different_voices(self, voice_handler, sample_text, voice):
         """Should work with different voice profiles"""
-        voices = ["alloy", "echo", "nova"]
-        
-        for voice in voices:
-            result_path = voice_handler.synthesize(sample_text, voice=voice)
-            assert Path(result_path).exists()
-            Path(result_path).unlink()
+        with _synth(voice_handler, sample_text, voice=voice) as result_path:
+            assert os.stat(result_path).st_size > 0
 
 
 class TestTempFileCleanup:
     """Test temporary file cleanup"""
     
-    def test_cleanup_old_files(self, voice_handler, sample_text):
+    def test_cleanup_old_files(self, tmp_handler, sample_text):
         """Should delete files older than max_age"""
         # Create a temp file
-        audio_path = voice_handler.synthesize(sample_text)
+        audio_path = tmp_handler.synthesize(sample_text)
         assert Path(audio_path).exists()
         
         # Cleanup files older than 0 hours (all files)
-        deleted = voice_handler.cleanup_temp_files(max_age_hours=0)
+        deleted = tmp_handler.cleanup_temp_files(max_age_hours=0)
         
         # File should be deleted
         assert deleted >= 1
@@ -1,25 +1,229 @@
+import asyncio
 import os
+import hashlib
+import itertools
+import json
+import re
+import secrets
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Dict, Iterator, List, Optional, Literal, Sequence
+import httpx
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from loguru import logger
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
 import config
 import base64
 
 # Supported audio formats
 SUPPORTED_FORMATS = {'.wav', '.mp3', '.m4a', '.webm', '.ogg'}
 MAX_AUDIO_SIZE_MB = 25
+MAX_AUDIO_SIZE_BYTES = MAX_AUDIO_SIZE_MB * 1024 * 1024
 MAX_TTS_LENGTH = 4096  # OpenAI TTS character limit
+TTS_MODEL = "tts-1-hd"  # Standard quality (tts-1 is cheaper, lower quality)
+ACCENT_MODEL = "gpt-4o-audio-preview"
 
 VoiceType = Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
 
+# Persistent synthesis cache: identical (text, model, options) -> same audio file.
+# Entries unused for TTS_CACHE_MAX_AGE_DAYS are swept by cleanup_temp_files.
+TTS_CACHE_DIR = config.TEMP_DIR / "tts_cache"
+TTS_CACHE_MAX_AGE_DAYS = 7
+
+# Accent steering instructions for synthesize_with_accent
+ITALIAN_ACCENT_PROMPT = """Parla come un MADRELINGUA ITALIANO del Nord Italia (Milano/Lombardia).
+
+ACCENTO E PRONUNCIA RICHIESTI:
+- Intonazione naturale italiana, NON neutrale o anglosassone
+- Pronuncia ogni parola con accento italiano autentico
+- Ritmo e cadenza tipici di un italiano settentrionale
+- Enfasi sulle vocali aperte/chiuse secondo fonetica italiana
+- Evita qualsiasi traccia di pronuncia anglofona
+
+STILE VOCALE:
+- Tono professionale ma cordiale
+- Come un commercialista milanese che parla con un cliente
+- Sicuro e competente, ma non freddo o robotico
+- Velocità moderata, chiara e comprensibile
+
+FONDAMENTALE: 
+Devi suonare come un ITALIANO che parla italiano, 
+NON come uno straniero che legge italiano."""
+
+# Reused as-is by every accent request (the SDK does not mutate messages)
+_ACCENT_SYSTEM_MESSAGE = {"role": "system", "content": ITALIAN_ACCENT_PROMPT}
+
+# Part of the accent cache key, so editing the prompt invalidates old audio
+_ACCENT_CACHE_MODEL = (
+    f"{ACCENT_MODEL}:{hashlib.sha256(ITALIAN_ACCENT_PROMPT.encode('utf-8')).hexdigest()[:16]}"
+)
+
+# Whisper transcripts by audio content hash, shared by all handlers (LRU) and
+# persisted append-only next to the TTS cache so restarts keep their hits
+TRANSCRIPT_CACHE_PATH = TTS_CACHE_DIR / "transcripts.jsonl"
+TRANSCRIPT_CACHE_MAX = 512
+# Transcript cache keys hash the size plus this many bytes from each end
+# (a recording differing only in the middle but not in length is unlikely)
+FINGERPRINT_SPAN_BYTES = 256 * 1024
+_transcript_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_transcript_cache_loaded = False
+_transcript_lock = threading.Lock()
+
+# Output file names: pid + per-import token + counter is unique across
+# workers and restarts without drawing entropy on every call
+_output_counter = itertools.count()
+_OUTPUT_TOKEN = secrets.token_hex(2)
+
+# Connection pool of the shared OpenAI client: keeps TLS sessions to the API
+# warm when several calls are in flight at once
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Retries are left to the OpenAI SDK: it backs off exponentially, honours
+# Retry-After and only retries transient failures (connection, 408/409/429/5xx)
+MAX_RETRIES = 3
+
+# Defaults for the *_many batch methods (size them to the account's limits)
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RPM = 50
+DEFAULT_MAX_TPM = 50_000
+
+# synthesize_long: sentence-sized chunks rendered in parallel, then joined.
+# Only frame-stream formats can be concatenated byte by byte.
+LONG_TTS_CHUNK_CHARS = 500
+LONG_TTS_CONCURRENCY = 4
+LONG_TTS_FORMATS = {"mp3", "aac", "opus"}
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\s*\n\s*")
+
+
+def _audio_fingerprint(audio_path: str, span: int = FINGERPRINT_SPAN_BYTES) -> str:
+    """
+    Content fingerprint of an audio file: its size plus the first and last
+    span bytes (files up to 2 * span are hashed whole, in chunks).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(audio_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        digest.update(size.to_bytes(8, "little"))
+        if size <= 2 * span:
+            while chunk := f.read(64 * 1024):
+                digest.update(chunk)
+        else:
+            digest.update(f.read(span))
+            f.seek(-span, os.SEEK_END)
+            digest.update(f.read(span))
+    return digest.hexdigest()
+
+
+def _load_transcripts():
+    """Fill the in-memory LRU from the on-disk log (once, lock held)"""
+    global _transcript_cache_loaded
+    _transcript_cache_loaded = True
+    try:
+        with open(TRANSCRIPT_CACHE_PATH, encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return
+    
+    for line in lines:
+        try:
+            record = json.loads(line)
+            key = (record["audio"], record["language"], record["prompt"])
+            text = record["text"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        _transcript_cache[key] = text
+        _transcript_cache.move_to_end(key)
+    while len(_transcript_cache) > TRANSCRIPT_CACHE_MAX:
+        _transcript_cache.popitem(last=False)
+    
+    # Compact the log once it is mostly superseded or evicted entries
+    if len(lines) > 2 * TRANSCRIPT_CACHE_MAX:
+        part_path = TRANSCRIPT_CACHE_PATH.with_name(f"{TRANSCRIPT_CACHE_PATH.name}.{os.getpid()}.part")
+        try:
+            with open(part_path, "w", encoding="utf-8") as f:
+                for (audio, language, prompt), text in _transcript_cache.items():
+                    f.write(json.dumps(
+                        {"audio": audio, "language": language, "prompt": prompt, "text": text},
+                        ensure_ascii=False
+                    ) + "\n")
+            os.replace(part_path, TRANSCRIPT_CACHE_PATH)
+        except OSError as e:
+            part_path.unlink(missing_ok=True)
+            logger.warning(f"Could not compact transcript cache: {e}")
+
+
+def _get_transcript(key: tuple) -> Optional[str]:
+    with _transcript_lock:
+        if not _transcript_cache_loaded:
+            _load_transcripts()
+        text = _transcript_cache.get(key)
+        if text is not None:
+            _transcript_cache.move_to_end(key)
+        return text
+
+
+def _put_transcript(key: tuple, text: str):
+    audio, language, prompt = key
+    record = json.dumps(
+        {"audio": audio, "language": language, "prompt": prompt, "text": text},
+        ensure_ascii=False
+    ) + "\n"
+    with _transcript_lock:
+        _transcript_cache[key] = text
+        _transcript_cache.move_to_end(key)
+        if len(_transcript_cache) > TRANSCRIPT_CACHE_MAX:
+            _transcript_cache.popitem(last=False)
+        try:
+            with open(TRANSCRIPT_CACHE_PATH, "a", encoding="utf-8") as f:
+                f.write(record)
+        except OSError as e:
+            logger.warning(f"Could not persist transcript: {e}")
+
+
+class _RateLimiter:
+    """
+    Requests/min and tokens/min buckets refilled on the monotonic clock.
+    
+    Paces a batch proactively so it stays under the account limits instead
+    of bursting into 429s and retry backoff. Create one per event loop.
+    """
+    
+    def __init__(self, max_rpm: int, max_tpm: int):
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self._requests = float(max_rpm)
+        self._tokens = float(max_tpm)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: int = 0):
+        tokens = min(tokens, self.max_tpm)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed, self._updated = now - self._updated, now
+                self._requests = min(self.max_rpm, self._requests + elapsed * self.max_rpm / 60)
+                self._tokens = min(self.max_tpm, self._tokens + elapsed * self.max_tpm / 60)
+                
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                
+                await asyncio.sleep(max(
+                    (1 - self._requests) * 60 / self.max_rpm,
+                    (tokens - self._tokens) * 60 / self.max_tpm
+                ))
+
 
 class VoiceHandler:
     """
@@ -29,27 +233,311 @@ class VoiceHandler:
     Audio files are automatically cleaned up to prevent disk bloat.
     """
     
-    def __init__(self):
-        """Initialize OpenAI client for voice operations"""
+    # OpenAI clients shared by all handlers (created on first use).
+    # Async clients pool connections bound to one event loop, so there is one
+    # per loop (each asyncio.run() batch gets its own).
+    _client: Optional[OpenAI] = None
+    _aclients: Dict[asyncio.AbstractEventLoop, AsyncOpenAI] = {}
+    _aclients_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_rpm: int = DEFAULT_MAX_RPM,
+        max_tpm: int = DEFAULT_MAX_TPM
+    ):
+        """
+        Initialize OpenAI client for voice operations.
+        
+        max_concurrency, max_rpm and max_tpm bound the transcribe_many /
+        synthesize_many batches.
+        """
         logger.info("Initializing Voice Handler...")
         
+        if max_concurrency < 1 or max_rpm < 1 or max_tpm < 1:
+            raise ValueError("max_concurrency, max_rpm and max_tpm must be >= 1")
+        self.max_concurrency = max_concurrency
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        
         if not config.OPENAI_API_KEY:
             raise ValueError(
                 "OPENAI_API_KEY not found. Voice features cannot initialize."
             )
         
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        if VoiceHandler._client is None:
+            VoiceHandler._client = OpenAI(
+                api_key=config.OPENAI_API_KEY,
+                max_retries=MAX_RETRIES,
+                http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            )
+        self.client = VoiceHandler._client
         
-        # Ensure temp directory exists
+        # Ensure temp and cache directories exist
         config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         
         logger.success("Voice Handler initialized successfully")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((openai.APIError, openai.APIConnectionError))
-    )
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async OpenAI client of the running event loop (created on first use)"""
+        loop = asyncio.get_running_loop()
+        with VoiceHandler._aclients_lock:
+            client = VoiceHandler._aclients.get(loop)
+            if client is None:
+                # Clients of finished loops can't be closed any more: drop them
+                for stale in [old for old in VoiceHandler._aclients if old.is_closed()]:
+                    del VoiceHandler._aclients[stale]
+                client = VoiceHandler._aclients[loop] = AsyncOpenAI(
+                    api_key=config.OPENAI_API_KEY,
+                    max_retries=MAX_RETRIES,
+                    http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+                )
+        return client
+    
+    @classmethod
+    def close(cls):
+        """Close the shared sync OpenAI client and its connection pool"""
+        if cls._client is not None:
+            cls._client.close()
+            cls._client = None
+    
+    @classmethod
+    async def aclose(cls):
+        """Close the running loop's async OpenAI client and its connection pool"""
+        with cls._aclients_lock:
+            client = cls._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+    
+    @staticmethod
+    def _validate_audio(audio_path: str, language: str) -> str:
+        """Existence, format and size checks shared by transcribe/atranscribe"""
+        
+        # Validation 1: File exists (one stat serves the size check too)
+        try:
+            st = os.stat(audio_path)
+        except FileNotFoundError:
+            error_msg = f"File audio non trovato: {audio_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg) from None
+        
+        # Validation 2: File format
+        suffix = os.path.splitext(audio_path)[1]
+        if suffix.lower() not in SUPPORTED_FORMATS:
+            error_msg = (
+                f"Formato audio non supportato: {suffix}. "
+                f"Formati accettati: {', '.join(SUPPORTED_FORMATS)}"
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # Validation 3: File size (Whisper limit: 25MB), compared in bytes
+        size_mb = st.st_size / (1024 * 1024)
+        if st.st_size > MAX_AUDIO_SIZE_BYTES:
+            error_msg = (
+                f"File audio troppo grande: {size_mb:.1f}MB. "
+                f"Massimo consentito: {MAX_AUDIO_SIZE_MB}MB"
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # Hot-path logs pass args instead of f-strings: loguru only formats
+        # them when a sink accepts the record
+        logger.info(
+            "Transcribing audio: {} ({:.2f}MB, language={})",
+            os.path.basename(audio_path), size_mb, language
+        )
+        return audio_path
+    
+    @staticmethod
+    def _normalize_tts_text(text: str) -> str:
+        """Empty check and length cap shared by every synthesis method"""
+        # Validation 1: Text not empty
+        if not text or not text.strip():
+            error_msg = "Il testo da sintetizzare è vuoto"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # Validation 2: Text length (OpenAI limit: 4096 characters).
+        # Truncate instead of failing (better UX); only this rare path logs.
+        length = len(text)
+        if length <= MAX_TTS_LENGTH:
+            return text
+        logger.warning(
+            f"Testo troppo lungo: {length} caratteri. "
+            f"Troncamento a {MAX_TTS_LENGTH} caratteri"
+        )
+        return text[:MAX_TTS_LENGTH]
+    
+    @staticmethod
+    def _valid_speed(speed: float) -> float:
+        """Validation 3: Speed range (out-of-range values fall back to 1.0)"""
+        if not (0.25 <= speed <= 4.0):
+            logger.warning(f"Invalid speed {speed}, defaulting to 1.0")
+            return 1.0
+        return speed
+    
+    @classmethod
+    def _validate_tts_input(cls, text: str, voice: str, speed: float):
+        """Text and speed checks shared by synthesize/asynthesize"""
+        text = cls._normalize_tts_text(text)
+        speed = cls._valid_speed(speed)
+        
+        logger.info(
+            "Synthesizing speech: {} chars, voice={}, speed={}",
+            len(text), voice, speed
+        )
+        return text, speed
+    
+    @staticmethod
+    def _split_sentences(text: str, max_chars: int = LONG_TTS_CHUNK_CHARS) -> List[str]:
+        """Greedily pack sentences into chunks of at most max_chars"""
+        chunks = []
+        current = ""
+        for sentence in _SENTENCE_BREAK.split(text):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            
+            # A sentence longer than a chunk is cut at the last space that fits
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars + 1)
+                if cut <= 0:
+                    cut = max_chars
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:cut].rstrip())
+                sentence = sentence[cut:].lstrip()
+            
+            if current and len(current) + 1 + len(sentence) <= max_chars:
+                current = f"{current} {sentence}"
+            else:
+                if current:
+                    chunks.append(current)
+                current = sentence
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    @staticmethod
+    def _new_output_path(prefix: str, output_format: str) -> Path:
+        """Unique file path in the temp directory"""
+        return config.TEMP_DIR / (
+            f"{prefix}_{os.getpid()}_{_OUTPUT_TOKEN}{next(_output_counter):06x}.{output_format}"
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _tts_cache_path(
+        model: str,
+        text: str,
+        voice: str,
+        speed: Optional[float],
+        output_format: str
+    ) -> Path:
+        """Content-addressed cache entry for a synthesis request"""
+        key = hashlib.blake2b(
+            f"{model}|{voice}|{speed}|{output_format}|{text}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        return TTS_CACHE_DIR / f"{key}.{output_format}"
+    
+    @staticmethod
+    def _write_base64(data: str, path: Path, chunk_size: int = 64 * 1024):
+        """Decode base64 into path chunk by chunk (no full-size bytes copy)"""
+        # chunk_size is a multiple of 4, so each slice decodes on its own
+        try:
+            with open(path, "wb") as f:
+                for start in range(0, len(data), chunk_size):
+                    f.write(base64.b64decode(data[start:start + chunk_size]))
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path):
+        """Hardlink src to dst (copy across filesystems)"""
+        try:
+            os.link(src, dst)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(src, dst)
+    
+    def _tts_from_cache(self, cache_path: Path, output_path: Path) -> bool:
+        """
+        Materialize a cached synthesis as output_path.
+        
+        Callers get their own temp file (they may delete it, and
+        cleanup_temp_files ages it normally); the cache entry survives.
+        """
+        try:
+            self._link_or_copy(cache_path, output_path)
+        except FileNotFoundError:
+            return False
+        os.utime(output_path)  # Fresh mtime so cleanup doesn't reap it at once
+        logger.info("TTS cache hit: {} -> {}", cache_path.name, output_path.name)
+        return True
+    
+    def _tts_to_cache(self, output_path: Path, cache_path: Path):
+        """Add a fresh synthesis to the cache (best effort)"""
+        part_path = self._cache_part_path(cache_path)
+        try:
+            self._link_or_copy(output_path, part_path)
+            os.replace(part_path, cache_path)
+        except OSError as e:
+            part_path.unlink(missing_ok=True)
+            logger.warning(f"Could not cache TTS output: {e}")
+    
+    @staticmethod
+    def _cache_part_path(cache_path: Path) -> Path:
+        """Private staging name next to a cache entry (unique per writer)"""
+        return cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{next(_output_counter):x}.part"
+        )
+    
+    @staticmethod
+    def _tts_read_cache(cache_path: Path) -> Optional[bytes]:
+        """Cached synthesis as bytes, or None on a miss"""
+        try:
+            audio = cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(cache_path)  # A hit keeps the entry young for cleanup
+        logger.info("TTS cache hit: {} ({} bytes)", cache_path.name, len(audio))
+        return audio
+    
+    def _tts_bytes_to_cache(self, audio: bytes, cache_path: Path):
+        """Add an in-memory synthesis to the cache (best effort)"""
+        part_path = self._cache_part_path(cache_path)
+        try:
+            part_path.write_bytes(audio)
+            os.replace(part_path, cache_path)
+        except OSError as e:
+            part_path.unlink(missing_ok=True)
+            logger.warning(f"Could not cache TTS output: {e}")
+    
+    @staticmethod
+    def _api_error(e: Exception, action: str) -> RuntimeError:
+        """Log an OpenAI call failure and map it to a user-facing RuntimeError"""
+        if isinstance(e, openai.RateLimitError):
+            logger.error(f"Rate limit error: {e}")
+            return RuntimeError(
+                "Limite richieste API raggiunto. "
+                "Attendi qualche minuto e riprova."
+            )
+        if isinstance(e, openai.APIError):
+            error_msg = f"Errore API OpenAI: {str(e)}"
+            logger.error(error_msg)
+            return RuntimeError(error_msg)
+        error_msg = f"Errore imprevisto durante {action}: {str(e)}"
+        logger.exception(error_msg)
+        return RuntimeError(error_msg)
+    
     def transcribe(
         self, 
         audio_path: str,
@@ -78,39 +566,16 @@ class VoiceHandler:
         - Audio format (WAV, MP3, M4A, WebM, OGG only)
         - Language forcing (prevents auto-detection errors)
         """
-        audio_file = Path(audio_path)
-        
-        # Validation 1: File exists
-        if not audio_file.exists():
-            error_msg = f"File audio non trovato: {audio_path}"
-            logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
-        
-        # Validation 2: File format
-        if audio_file.suffix.lower() not in SUPPORTED_FORMATS:
-            error_msg = (
-                f"Formato audio non supportato: {audio_file.suffix}. "
-                f"Formati accettati: {', '.join(SUPPORTED_FORMATS)}"
-            )
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        # Validation 3: File size (Whisper limit: 25MB)
-        size_mb = audio_file.stat().st_size / (1024 * 1024)
-        if size_mb > MAX_AUDIO_SIZE_MB:
-            error_msg = (
-                f"File audio troppo grande: {size_mb:.1f}MB. "
-                f"Massimo consentito: {MAX_AUDIO_SIZE_MB}MB"
-            )
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        logger.info(
-            f"Transcribing audio: {audio_file.name} "
-            f"({size_mb:.2f}MB, language={language})"
-        )
+        audio_file = self._validate_audio(audio_path, language)
         
         try:
+            # Same audio bytes + options -> same transcript: skip Whisper
+            cache_key = (_audio_fingerprint(audio_file), language, prompt)
+            cached = _get_transcript(cache_key)
+            if cached is not None:
+                logger.info("Transcript cache hit: {}", os.path.basename(audio_file))
+                return cached
+            
             with open(audio_file, "rb") as audio:
                 # CRITICAL: Force Italian language to prevent auto-detection errors
                 transcript = self.client.audio.transcriptions.create(
@@ -125,35 +590,61 @@ class VoiceHandler:
             transcribed_text = transcript.strip()
             
             logger.success(
-                f"Transcription complete: {len(transcribed_text)} characters - "
-                f"'{transcribed_text[:50]}...'"
+                "Transcription complete: {} characters - '{:.50}...'",
+                len(transcribed_text), transcribed_text
             )
             
+            _put_transcript(cache_key, transcribed_text)
             return transcribed_text
         
-        except openai.RateLimitError as e:
-            error_msg = (
-                "Limite richieste API raggiunto. "
-                "Attendi qualche minuto e riprova."
-            )
-            logger.error(f"Rate limit error: {e}")
-            raise RuntimeError(error_msg) from e
+        except Exception as e:
+            raise self._api_error(e, "la trascrizione") from e
+    
+    async def atranscribe(
+        self,
+        audio_path: str,
+        language: str = "it",
+        prompt: Optional[str] = None
+    ) -> str:
+        """
+        Async variant of transcribe() on the shared AsyncOpenAI client.
         
-        except openai.APIError as e:
-            error_msg = f"Errore API OpenAI: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+        Same validations, arguments and errors as transcribe(); lets callers
+        overlap the Whisper round-trip with other work.
+        """
+        audio_file = self._validate_audio(audio_path, language)
+        
+        try:
+            cache_key = (
+                await asyncio.to_thread(_audio_fingerprint, audio_file), language, prompt
+            )
+            cached = _get_transcript(cache_key)
+            if cached is not None:
+                logger.info("Transcript cache hit: {}", os.path.basename(audio_file))
+                return cached
+            
+            with open(audio_file, "rb") as audio:
+                transcript = await self.aclient.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=audio,
+                    language=language,
+                    prompt=prompt,
+                    response_format="text"
+                )
+            
+            transcribed_text = transcript.strip()
+            
+            logger.success(
+                "Transcription complete: {} characters - '{:.50}...'",
+                len(transcribed_text), transcribed_text
+            )
+            
+            _put_transcript(cache_key, transcribed_text)
+            return transcribed_text
         
         except Exception as e:
-            error_msg = f"Errore imprevisto durante la trascrizione: {str(e)}"
-            logger.exception(error_msg)
-            raise RuntimeError(error_msg) from e
+            raise self._api_error(e, "la trascrizione") from e
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((openai.APIError, openai.APIConnectionError))
-    )
     def synthesize(
         self,
         text: str,
@@ -183,89 +674,417 @@ class VoiceHandler:
         - Speed within valid range (0.25-4.0)
         - Voice is valid OpenAI voice
         """
-        # Validation 1: Text not empty
-        if not text or not text.strip():
-            error_msg = "Il testo da sintetizzare è vuoto"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        text, speed = self._validate_tts_input(text, voice, speed)
         
-        # Validation 2: Text length (OpenAI limit: 4096 characters)
-        if len(text) > MAX_TTS_LENGTH:
-            error_msg = (
-                f"Testo troppo lungo: {len(text)} caratteri. "
-                f"Massimo consentito: {MAX_TTS_LENGTH} caratteri"
+        # Generate unique filename
+        output_path = self._new_output_path("tts", output_format)
+        cache_path = self._tts_cache_path(TTS_MODEL, text, voice, speed, output_format)
+        if self._tts_from_cache(cache_path, output_path):
+            return str(output_path)
+        
+        try:
+            # Stream audio chunks straight to the file (no full-body buffer)
+            try:
+                with self.client.audio.speech.with_streaming_response.create(
+                    model=TTS_MODEL,
+                    voice=voice,
+                    input=text,
+                    speed=speed,
+                    response_format=output_format
+                ) as response:
+                    response.stream_to_file(output_path)
+            except BaseException:
+                output_path.unlink(missing_ok=True)
+                raise
+            
+            # Verify file was created
+            if not output_path.exists():
+                raise RuntimeError(
+                    "File audio generato ma non trovato su disco"
+                )
+            
+            logger.opt(lazy=True).success(
+                "Speech synthesized successfully: {} ({:.1f}KB)",
+                lambda: output_path.name,
+                lambda: output_path.stat().st_size / 1024
             )
-            logger.warning(error_msg)
-            # Truncate instead of failing (better UX)
-            text = text[:MAX_TTS_LENGTH]
-            logger.info(f"Testo troncato a {MAX_TTS_LENGTH} caratteri")
+            
+            self._tts_to_cache(output_path, cache_path)
+            return str(output_path)
         
-        # Validation 3: Speed range
-        if not (0.25 <= speed <= 4.0):
-            logger.warning(f"Invalid speed {speed}, defaulting to 1.0")
-            speed = 1.0
+        except Exception as e:
+            raise self._api_error(e, "la sintesi vocale") from e
+    
+    def synthesize_bytes(
+        self,
+        text: str,
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3"
+    ) -> bytes:
+        """
+        synthesize() returning the audio itself instead of a temp file path.
         
-        logger.info(
-            f"Synthesizing speech: {len(text)} chars, "
-            f"voice={voice}, speed={speed}"
-        )
+        For callers that forward audio over HTTP/WebSocket: no temp file is
+        written or read back. Same validations, cache and errors as
+        synthesize().
+        """
+        text, speed = self._validate_tts_input(text, voice, speed)
+        
+        cache_path = self._tts_cache_path(TTS_MODEL, text, voice, speed, output_format)
+        audio = self._tts_read_cache(cache_path)
+        if audio is not None:
+            return audio
         
         try:
-            # Generate speech
             response = self.client.audio.speech.create(
-                model="tts-1-hd",  # Standard quality (tts-1-hd for higher quality)
+                model=TTS_MODEL,
                 voice=voice,
                 input=text,
                 speed=speed,
                 response_format=output_format
             )
+            audio = response.content
+        except Exception as e:
+            raise self._api_error(e, "la sintesi vocale") from e
+        
+        logger.success("Speech synthesized successfully: {:.1f}KB in memory", len(audio) / 1024)
+        
+        self._tts_bytes_to_cache(audio, cache_path)
+        return audio
+    
+    def synthesize_stream(
+        self,
+        text: str,
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        chunk_size: int = 4096
+    ) -> Iterator[bytes]:
+        """
+        Synthesize text as an iterator of audio chunks (first bytes early).
+        
+        Suited to streaming HTTP responses, e.g.
+        StreamingResponse(handler.synthesize_stream(text)). Input is
+        validated on call, like synthesize(); API errors surface as
+        RuntimeError while iterating. A fully consumed stream is added to
+        the TTS cache, and cache hits are streamed from disk.
+        """
+        text, speed = self._validate_tts_input(text, voice, speed)
+        cache_path = self._tts_cache_path(TTS_MODEL, text, voice, speed, output_format)
+        return self._stream_tts(text, voice, speed, output_format, cache_path, chunk_size)
+    
+    def _stream_tts(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_format: str,
+        cache_path: Path,
+        chunk_size: int
+    ) -> Iterator[bytes]:
+        """Generator behind synthesize_stream()"""
+        try:
+            cached = open(cache_path, "rb")
+        except FileNotFoundError:
+            cached = None
+        if cached is not None:
+            with cached:
+                os.utime(cache_path)
+                logger.info("TTS cache hit: {} (streamed)", cache_path.name)
+                while chunk := cached.read(chunk_size):
+                    yield chunk
+            return
+        
+        # Chunks are teed into a staging file; it only becomes a cache entry
+        # once the whole response has been received and consumed
+        part_path = self._cache_part_path(cache_path)
+        try:
+            part = open(part_path, "wb")
+        except OSError as e:
+            logger.warning(f"Could not cache TTS output: {e}")
+            part = None
+        
+        completed = False
+        try:
+            with self.client.audio.speech.with_streaming_response.create(
+                model=TTS_MODEL,
+                voice=voice,
+                input=text,
+                speed=speed,
+                response_format=output_format
+            ) as response:
+                for chunk in response.iter_bytes(chunk_size):
+                    if part is not None:
+                        part.write(chunk)
+                    yield chunk
+            completed = True
+        except GeneratorExit:
+            raise  # Consumer stopped early (e.g. client disconnected)
+        except Exception as e:
+            raise self._api_error(e, "la sintesi vocale") from e
+        finally:
+            if part is not None:
+                part.close()
+                try:
+                    if completed:
+                        os.replace(part_path, cache_path)
+                        logger.success("Speech streamed successfully: {}", cache_path.name)
+                except OSError as e:
+                    logger.warning(f"Could not cache TTS output: {e}")
+                finally:
+                    part_path.unlink(missing_ok=True)
+    
+    async def asynthesize(
+        self,
+        text: str,
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3"
+    ) -> str:
+        """
+        Async variant of synthesize() on the shared AsyncOpenAI client.
+        
+        Same validations, arguments and errors as synthesize(); several
+        calls can be awaited together (e.g. one per sentence chunk).
+        """
+        text, speed = self._validate_tts_input(text, voice, speed)
+        
+        output_path = self._new_output_path("tts", output_format)
+        cache_path = self._tts_cache_path(TTS_MODEL, text, voice, speed, output_format)
+        if self._tts_from_cache(cache_path, output_path):
+            return str(output_path)
+        
+        try:
+            try:
+                async with self.aclient.audio.speech.with_streaming_response.create(
+                    model=TTS_MODEL,
+                    voice=voice,
+                    input=text,
+                    speed=speed,
+                    response_format=output_format
+                ) as response:
+                    await response.stream_to_file(output_path)
+            except BaseException:
+                output_path.unlink(missing_ok=True)
+                raise
             
-            # Generate unique filename
-            import uuid
-            output_filename = f"tts_{uuid.uuid4().hex[:8]}.{output_format}"
-            output_path = config.TEMP_DIR / output_filename
-            
-            # Save audio to file
-            with open(output_path, "wb") as f:
-                f.write(response.content)
-            
-            # Verify file was created
-            if not output_path.exists():
-                raise RuntimeError(
-                    "File audio generato ma non trovato su disco"
-                )
-            
-            file_size_kb = output_path.stat().st_size / 1024
-            logger.success(
-                f"Speech synthesized successfully: {output_path.name} "
-                f"({file_size_kb:.1f}KB)"
+            logger.opt(lazy=True).success(
+                "Speech synthesized successfully: {} ({:.1f}KB)",
+                lambda: output_path.name,
+                lambda: output_path.stat().st_size / 1024
             )
             
+            self._tts_to_cache(output_path, cache_path)
             return str(output_path)
         
-        except openai.RateLimitError as e:
+        except Exception as e:
+            raise self._api_error(e, "la sintesi vocale") from e
+    
+    async def asynthesize_bytes(
+        self,
+        text: str,
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3"
+    ) -> bytes:
+        """Async variant of synthesize_bytes() on the shared AsyncOpenAI client"""
+        text, speed = self._validate_tts_input(text, voice, speed)
+        
+        cache_path = self._tts_cache_path(TTS_MODEL, text, voice, speed, output_format)
+        audio = self._tts_read_cache(cache_path)
+        if audio is not None:
+            return audio
+        
+        try:
+            response = await self.aclient.audio.speech.create(
+                model=TTS_MODEL,
+                voice=voice,
+                input=text,
+                speed=speed,
+                response_format=output_format
+            )
+            audio = response.content
+        except Exception as e:
+            raise self._api_error(e, "la sintesi vocale") from e
+        
+        logger.success("Speech synthesized successfully: {:.1f}KB in memory", len(audio) / 1024)
+        
+        self._tts_bytes_to_cache(audio, cache_path)
+        return audio
+    
+    async def synthesize_long(
+        self,
+        text: str,
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        use_accent_model: bool = False
+    ) -> str:
+        """
+        Synthesize a long text as sentence chunks rendered concurrently.
+        
+        The text is split at sentence boundaries into chunks of at most
+        LONG_TTS_CHUNK_CHARS, up to LONG_TTS_CONCURRENCY are synthesized at
+        once, and the audio is concatenated into one file. Unlike
+        synthesize(), text longer than MAX_TTS_LENGTH is not truncated.
+        Each chunk is cached on its own, so edited texts reuse the
+        unchanged sentences.
+        
+        Args:
+            text: Italian text to synthesize
+            voice: Voice profile
+            speed: Speech speed (ignored by the accent model)
+            output_format: mp3, aac or opus (accent model: always mp3)
+            use_accent_model: Render chunks with synthesize_with_accent_bytes()
+        
+        Returns:
+            Path to the generated audio file in temp directory
+        
+        Raises:
+            ValueError: Empty text or format that cannot be concatenated
+            RuntimeError: TTS API error
+        """
+        if use_accent_model:
+            output_format = "mp3"
+        if output_format not in LONG_TTS_FORMATS:
             error_msg = (
-                "Limite richieste API raggiunto. "
-                "Attendi qualche minuto e riprova."
+                f"Formato non supportato per testi lunghi: {output_format}. "
+                f"Formati accettati: {', '.join(sorted(LONG_TTS_FORMATS))}"
             )
-            logger.error(f"Rate limit error: {e}")
-            raise RuntimeError(error_msg) from e
+            logger.error(error_msg)
+            raise ValueError(error_msg)
         
-        except openai.APIError as e:
-            error_msg = f"Errore API OpenAI: {str(e)}"
+        chunks = self._split_sentences(text)
+        if not chunks:
+            error_msg = "Il testo da sintetizzare è vuoto"
             logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+            raise ValueError(error_msg)
         
-        except Exception as e:
-            error_msg = f"Errore imprevisto durante la sintesi vocale: {str(e)}"
-            logger.exception(error_msg)
-            raise RuntimeError(error_msg) from e
+        logger.info("Synthesizing long text: {} chars in {} chunks", len(text), len(chunks))
+        
+        semaphore = asyncio.Semaphore(LONG_TTS_CONCURRENCY)
+        
+        async def render(chunk: str) -> bytes:
+            async with semaphore:
+                if use_accent_model:
+                    # Sync client in a worker thread; the accent system
+                    # message is shared, each chunk only adds its user turn
+                    return await asyncio.to_thread(
+                        self.synthesize_with_accent_bytes, chunk, voice
+                    )
+                return await self.asynthesize_bytes(
+                    chunk, voice=voice, speed=speed, output_format=output_format
+                )
+        
+        parts = await asyncio.gather(*(render(chunk) for chunk in chunks))
+        
+        # One write for the whole file
+        output_path = self._new_output_path("tts_long", output_format)
+        await asyncio.to_thread(output_path.write_bytes, b"".join(parts))
+        
+        logger.opt(lazy=True).success(
+            "Long text synthesized: {} ({:.1f}KB, {} chunks)",
+            lambda: output_path.name,
+            lambda: output_path.stat().st_size / 1024,
+            lambda: len(chunks)
+        )
+        return str(output_path)
+    
+    async def _run_batch(self, calls, token_costs: Sequence[int]) -> list:
+        """Run coroutine factories concurrently under the handler's limits"""
+        limiter = _RateLimiter(self.max_rpm, self.max_tpm)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(call, tokens):
+            async with semaphore:
+                await limiter.acquire(tokens)
+                return await call()
+        
+        return await asyncio.gather(
+            *(run(call, tokens) for call, tokens in zip(calls, token_costs))
+        )
+    
+    async def transcribe_many(
+        self,
+        audio_paths: Sequence[str],
+        language: str = "it",
+        prompt: Optional[str] = None
+    ) -> List[str]:
+        """
+        Transcribe several audio files concurrently (results in input order).
+        
+        Up to max_concurrency requests are in flight, paced under max_rpm.
+        Raises the first error, like atranscribe().
+        """
+        calls = [
+            lambda path=path: self.atranscribe(path, language=language, prompt=prompt)
+            for path in audio_paths
+        ]
+        return await self._run_batch(calls, [0] * len(calls))
+    
+    async def synthesize_many(
+        self,
+        texts: Sequence[str],
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3"
+    ) -> List[str]:
+        """
+        Synthesize several texts concurrently (paths in input order).
+        
+        Up to max_concurrency requests are in flight, paced under max_rpm and
+        max_tpm (estimated at ~4 characters per token). Raises the first
+        error, like asynthesize().
+        """
+        calls = [
+            lambda text=text: self.asynthesize(
+                text, voice=voice, speed=speed, output_format=output_format
+            )
+            for text in texts
+        ]
+        return await self._run_batch(calls, [len(text) // 4 for text in texts])
+    
+    async def prewarm_tts_cache(
+        self,
+        texts: Sequence[str],
+        voice: VoiceType = "alloy",
+        speed: float = 1.0,
+        output_format: str = "mp3"
+    ) -> int:
+        """
+        Synthesize texts into TTS_CACHE_DIR only (no temp files), for
+        offline jobs such as pre-rendering FAQ answers.
+        
+        Later synthesize()/synthesize_bytes() calls with the same text and
+        options are cache hits. Texts already cached are skipped; the rest
+        run under the same limits as synthesize_many().
+        
+        Returns:
+            Number of texts that were synthesized
+        """
+        speed = self._valid_speed(speed)
+        missing = []
+        for text in dict.fromkeys(texts):  # Dedup, keeping order
+            text = self._normalize_tts_text(text)
+            cache_path = self._tts_cache_path(TTS_MODEL, text, voice, speed, output_format)
+            if not cache_path.exists():
+                missing.append(text)
+        
+        calls = [
+            lambda text=text: self.asynthesize_bytes(
+                text, voice=voice, speed=speed, output_format=output_format
+            )
+            for text in missing
+        ]
+        await self._run_batch(calls, [len(text) // 4 for text in missing])
+        
+        logger.info(
+            "TTS cache prewarmed: {} synthesized, {} skipped",
+            len(missing), len(texts) - len(missing)
+        )
+        return len(missing)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((openai.APIError, openai.APIConnectionError))
-    )
     def synthesize_with_accent(
         self,
         text: str,
@@ -299,81 +1118,82 @@ class VoiceHandler:
         The model receives instructions to speak with authentic Italian accent,
         avoiding the neutral/anglophone pronunciation of standard TTS voices.
         """
-        # Validation 1: Text not empty
-        if not text or not text.strip():
-            error_msg = "Il testo da sintetizzare è vuoto"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        # Validation 2: Text length
-        if len(text) > MAX_TTS_LENGTH:
-            logger.warning(
-                f"Testo troppo lungo: {len(text)} caratteri. "
-                f"Troncamento a {MAX_TTS_LENGTH}"
-            )
-            text = text[:MAX_TTS_LENGTH]
+        text = self._normalize_tts_text(text)
         
         logger.info(
-            f"Synthesizing speech WITH ITALIAN ACCENT: {len(text)} chars, "
-            f"voice={voice}"
+            "Synthesizing speech WITH ITALIAN ACCENT: {} chars, voice={}",
+            len(text), voice
+        )
+        
+        # Generate unique filename (speed is not supported by this model)
+        output_path = self._new_output_path("tts_accent", "mp3")
+        cache_path = self._tts_cache_path(_ACCENT_CACHE_MODEL, text, voice, None, "mp3")
+        if self._tts_from_cache(cache_path, output_path):
+            return str(output_path)
+        
+        audio_data = self._accent_audio_b64(text, voice)
+        
+        try:
+            # Decode base64 audio straight into the file
+            self._write_base64(audio_data, output_path)
+        except Exception as e:
+            error_msg = f"Errore imprevisto durante la sintesi: {str(e)}"
+            logger.exception(error_msg)
+            raise RuntimeError(error_msg) from e
+        
+        logger.success(
+            "Speech synthesis WITH ITALIAN ACCENT complete: {}", output_path.name
+        )
+        
+        self._tts_to_cache(output_path, cache_path)
+        return str(output_path)
+    
+    def synthesize_with_accent_bytes(
+        self,
+        text: str,
+        voice: VoiceType = "alloy"
+    ) -> bytes:
+        """
+        synthesize_with_accent() returning the MP3 bytes instead of a path.
+        
+        Shares the accent cache entries and errors of synthesize_with_accent().
+        """
+        text = self._normalize_tts_text(text)
+        
+        cache_path = self._tts_cache_path(_ACCENT_CACHE_MODEL, text, voice, None, "mp3")
+        audio = self._tts_read_cache(cache_path)
+        if audio is not None:
+            return audio
+        
+        audio = base64.b64decode(self._accent_audio_b64(text, voice))
+        logger.success(
+            "Speech synthesis WITH ITALIAN ACCENT complete: {:.1f}KB in memory",
+            len(audio) / 1024
         )
         
+        self._tts_bytes_to_cache(audio, cache_path)
+        return audio
+    
+    def _accent_audio_b64(self, text: str, voice: str) -> str:
+        """gpt-4o-audio-preview call with the accent prompt (base64 MP3)"""
         try:
             # CRITICAL: Use gpt-4o-audio-preview with accent instructions
             completion = self.client.chat.completions.create(
-                model="gpt-4o-audio-preview",
+                model=ACCENT_MODEL,
                 modalities=["text", "audio"],
                 audio={
                     "voice": voice,
                     "format": "mp3"
                 },
                 messages=[
-                    {
-                        "role": "system",
-                        "content": """Parla come un MADRELINGUA ITALIANO del Nord Italia (Milano/Lombardia).
-
-ACCENTO E PRONUNCIA RICHIESTI:
-- Intonazione naturale italiana, NON neutrale o anglosassone
-- Pronuncia ogni parola con accento italiano autentico
-- Ritmo e cadenza tipici di un italiano settentrionale
-- Enfasi sulle vocali aperte/chiuse secondo fonetica italiana
-- Evita qualsiasi traccia di pronuncia anglofona
-
-STILE VOCALE:
-- Tono professionale ma cordiale
-- Come un commercialista milanese che parla con un cliente
-- Sicuro e competente, ma non freddo o robotico
-- Velocità moderata, chiara e comprensibile
-
-FONDAMENTALE: 
-Devi suonare come un ITALIANO che parla italiano, 
-NON come uno straniero che legge italiano."""
-                    },
+                    _ACCENT_SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": text
                     }
                 ],
             )
-            
-            # Decode base64 audio
-            audio_data = completion.choices[0].message.audio.data
-            mp3_bytes = base64.b64decode(audio_data)
-            
-            # Generate unique filename
-            import uuid
-            output_filename = f"tts_accent_{uuid.uuid4().hex[:8]}.mp3"
-            output_path = config.TEMP_DIR / output_filename
-            
-            # Write audio file
-            with open(output_path, "wb") as f:
-                f.write(mp3_bytes)
-            
-            logger.success(
-                f"Speech synthesis WITH ITALIAN ACCENT complete: {output_path.name}"
-            )
-            
-            return str(output_path)
+            return completion.choices[0].message.audio.data
         
         except openai.RateLimitError as e:
             error_msg = (
@@ -421,21 +1241,28 @@ NON come uno straniero che legge italiano."""
             **kwargs: Additional arguments passed to underlying method
         
         Returns:
-            Path to generated audio file
+            Path to generated audio file (both methods reuse TTS_CACHE_DIR
+            when the same text and options were synthesized before)
         """
         if use_accent_model:
             logger.info("Using ACCENT-STEERED model (gpt-4o-audio-preview)")
             return self.synthesize_with_accent(text, **kwargs)
-        else:
-            logger.info("Using STANDARD TTS model (tts-1/tts-1-hd)")
-            return self.synthesize(text, **kwargs)
+        
+        logger.info("Using STANDARD TTS model (tts-1/tts-1-hd)")
+        return self.synthesize(text, **kwargs)
     
-    def cleanup_temp_files(self, max_age_hours: int = 1) -> int:
+    def cleanup_temp_files(
+        self,
+        max_age_hours: int = 1,
+        cache_max_age_days: float = TTS_CACHE_MAX_AGE_DAYS
+    ) -> int:
         """
         Clean up old temporary audio files to prevent disk bloat.
         
         Args:
-            max_age_hours: Delete files older than this many hours
+            max_age_hours: Delete temp files older than this many hours
+            cache_max_age_days: Delete TTS cache entries unused for this many
+                days (cache hits refresh an entry's mtime)
         
         Returns:
             Number of files deleted
@@ -443,42 +1270,78 @@ NON come uno straniero che legge italiano."""
         **BEST PRACTICE:** Call this periodically in production to prevent
         temp directory from growing unbounded.
         """
-        import time
-        
         deleted_count = 0
         current_time = time.time()
-        max_age_seconds = max_age_hours * 3600
         
         try:
-            for file_path in config.TEMP_DIR.glob("*"):
-                if not file_path.is_file():
-                    continue
-                
-                file_age = current_time - file_path.stat().st_mtime
-                
-                if file_age >= max_age_seconds:
-                    file_path.unlink()
-                    deleted_count += 1
-                    logger.debug(f"Deleted old temp file: {file_path.name}")
+            deleted_count += self._sweep_dir(
+                config.TEMP_DIR, current_time - max_age_hours * 3600
+            )
+            if TTS_CACHE_DIR.is_dir():
+                deleted_count += self._sweep_dir(
+                    TTS_CACHE_DIR, current_time - cache_max_age_days * 86400
+                )
             
             if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} temporary files")
+                logger.info("Cleaned up {} temporary files", deleted_count)
             
             return deleted_count
         
         except Exception as e:
             logger.error(f"Error during temp file cleanup: {e}")
             return deleted_count
+    
+    async def acleanup_temp_files(
+        self,
+        max_age_hours: int = 1,
+        cache_max_age_days: float = TTS_CACHE_MAX_AGE_DAYS
+    ) -> int:
+        """cleanup_temp_files() in a worker thread, for use inside event loops"""
+        return await asyncio.to_thread(
+            self.cleanup_temp_files, max_age_hours, cache_max_age_days
+        )
+    
+    @staticmethod
+    def _sweep_dir(directory: Path, cutoff: float) -> int:
+        """Delete regular files in directory (not recursive) with mtime <= cutoff"""
+        deleted_count = 0
+        # scandir entries reuse the directory read for is_file()/stat();
+        # subdirectories (e.g. TTS_CACHE_DIR under TEMP_DIR) are skipped
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Symlinks are never followed: only files living here are aged
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                if entry.stat(follow_symlinks=False).st_mtime <= cutoff:
+                    os.unlink(entry.path)
+                    deleted_count += 1
+                    # Args, not an f-string: only formatted if DEBUG is emitted
+                    logger.debug("Deleted old temp file: {}", entry.name)
+        
+        return deleted_count
 
 
 # Module-level convenience functions
+_default_handler_instance: Optional[VoiceHandler] = None
+_default_handler_lock = threading.Lock()
+
+
+def _default_handler() -> VoiceHandler:
+    """Handler shared by the quick_* helpers (created on first use)"""
+    global _default_handler_instance
+    if _default_handler_instance is None:
+        with _default_handler_lock:
+            if _default_handler_instance is None:
+                _default_handler_instance = VoiceHandler()
+    return _default_handler_instance
+
+
 def quick_transcribe(audio_path: str) -> str:
     """Quick transcription with default settings"""
-    handler = VoiceHandler()
-    return handler.transcribe(audio_path)
+    return _default_handler().transcribe(audio_path)
 
 
 def quick_synthesize(text: str, voice: VoiceType = "alloy") -> str:
     """Quick synthesis with default settings"""
-    handler = VoiceHandler()
-    return handler.synthesize(text, voice=voice)
\ No newline at end of file
+    return _default_handler().synthesize(text, voice=voice)
\ No newline at end of file
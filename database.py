@@ -39,11 +39,15 @@ def get_database_url() -> str:
     return db_url
 
 
-def create_db_engine():
+def create_db_engine(**overrides):
     """
     Create SQLAlchemy engine with appropriate configuration.
     
     CRITICAL: Different settings for SQLite vs PostgreSQL
+    
+    Args:
+        **overrides: create_engine() keyword arguments replacing the
+            defaults below (e.g. poolclass/pool_size for the test suite)
     """
     database_url = get_database_url()
     
@@ -57,12 +61,15 @@ def create_db_engine():
         # SQLite-specific configuration
         engine = create_engine(
             database_url,
-            connect_args={
-                "check_same_thread": False,  # Allow multi-threading
-                "timeout": 30  # 30 second timeout for locks
-            },
-            poolclass=StaticPool,  # Single connection pool for SQLite
-            echo=False  # Set to True for SQL debugging
+            **{
+                "connect_args": {
+                    "check_same_thread": False,  # Allow multi-threading
+                    "timeout": 30  # 30 second timeout for locks
+                },
+                "poolclass": StaticPool,  # Single connection pool for SQLite
+                "echo": False,  # Set to True for SQL debugging
+                **overrides,
+            }
         )
         
         # Enable foreign keys for SQLite (disabled by default)
@@ -81,11 +88,14 @@ def create_db_engine():
         # PostgreSQL-specific configuration
         engine = create_engine(
             database_url,
-            pool_size=5,  # Connection pool size
-            max_overflow=10,  # Max connections beyond pool_size
-            pool_pre_ping=True,  # Verify connections before using
-            pool_recycle=3600,  # Recycle connections after 1 hour
-            echo=False
+            **{
+                "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),  # Connection pool size
+                "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),  # Max connections beyond pool_size
+                "pool_pre_ping": True,  # Verify connections before using
+                "pool_recycle": 300,  # Recycle connections after 5 minutes
+                "echo": False,
+                **overrides,
+            }
         )
         
         logger.success("PostgreSQL engine configured with connection pooling")
@@ -173,7 +183,9 @@ def init_db(drop_existing: bool = False) -> None:
     Args:
         drop_existing: If True, drop all tables first (DANGEROUS!)
     
-    CRITICAL: Use this for V.B (SQLite). For V.A (PostgreSQL), use Alembic.
+    CRITICAL: Use this for V.B (SQLite). For V.A (PostgreSQL), use Alembic
+    (`alembic upgrade head`, see migrations/); existing SQLite databases
+    also need it for schema changes made after they were created.
     """
     if drop_existing:
         logger.warning("⚠️  Dropping all existing tables...")
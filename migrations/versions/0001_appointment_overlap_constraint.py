@@ -0,0 +1,49 @@
+"""Exclusion constraint against overlapping appointments (PostgreSQL)
+
+Databases built by init_db() after the constraint was added to models.py
+already have it; this brings older PostgreSQL databases in line.
+Overlapping active appointments already stored must be resolved (cancelled
+or moved) first, or ADD CONSTRAINT fails.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return  # SQLite relies on the BookingService pre-check only
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    
+    exists = bind.execute(sa.text(
+        "SELECT 1 FROM pg_constraint WHERE conname = 'no_overlapping_appointments'"
+    )).first()
+    if exists:
+        return
+    
+    op.execute(
+        "ALTER TABLE appointments ADD CONSTRAINT no_overlapping_appointments "
+        "EXCLUDE USING gist ("
+        "accountant_id WITH =, "
+        "tsrange(\"datetime\", \"datetime\" + make_interval(mins => duration)) WITH &&"
+        ") WHERE (status <> 'cancelled')"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE appointments DROP CONSTRAINT IF EXISTS no_overlapping_appointments"
+    )
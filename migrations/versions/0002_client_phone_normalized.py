@@ -0,0 +1,61 @@
+"""Add clients.phone_normalized and backfill it from phone
+
+ClientService.find_by_phone and RoutingService.resolve_client match callers
+on this column; rows written before it existed would never match.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from models import normalize_phone
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_clients_phone_normalized"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    
+    # Fresh databases (create_all) already have the column and its index
+    columns = {c["name"] for c in inspector.get_columns("clients")}
+    if "phone_normalized" not in columns:
+        op.add_column("clients", sa.Column("phone_normalized", sa.String(20), nullable=True))
+    indexes = {ix["name"] for ix in inspector.get_indexes("clients")}
+    if INDEX_NAME not in indexes:
+        op.create_index(INDEX_NAME, "clients", ["phone_normalized"])
+    
+    clients = sa.table(
+        "clients",
+        sa.column("id", sa.String),
+        sa.column("phone", sa.String),
+        sa.column("phone_normalized", sa.String),
+    )
+    rows = bind.execute(
+        sa.select(clients.c.id, clients.c.phone).where(
+            clients.c.phone_normalized.is_(None),
+            clients.c.phone.is_not(None),
+        )
+    ).all()
+    if rows:
+        # One executemany for the whole backfill
+        bind.execute(
+            clients.update()
+            .where(clients.c.id == sa.bindparam("b_id"))
+            .values(phone_normalized=sa.bindparam("b_phone")),
+            [{"b_id": row.id, "b_phone": normalize_phone(row.phone)} for row in rows],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name="clients")
+    with op.batch_alter_table("clients") as batch:
+        batch.drop_column("phone_normalized")
@@ -0,0 +1,28 @@
+"""Drop ix_client_lower_name
+
+ClientService.find_by_company_name is a single LIKE query (exact matches are
+only ranked first), so no query uses lower(company_name) equality any more
+and the index only cost writes.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_client_lower_name")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_client_lower_name", "clients", [sa.text("lower(company_name)")]
+    )
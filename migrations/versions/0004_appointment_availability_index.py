@@ -0,0 +1,38 @@
+"""Partial (accountant_id, datetime) index for availability lookups
+
+BookingService.check_availability and _has_overlap filter by accountant and
+day range on non-cancelled appointments. Databases built by init_db() after
+the index was added to models.py already have it.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_appt_accountant_dt"
+ACTIVE_ONLY = sa.text("status <> 'cancelled'")
+
+
+def upgrade() -> None:
+    indexes = {ix["name"] for ix in sa.inspect(op.get_bind()).get_indexes("appointments")}
+    if INDEX_NAME in indexes:
+        return
+    op.create_index(
+        INDEX_NAME,
+        "appointments",
+        ["accountant_id", "datetime"],
+        postgresql_where=ACTIVE_ONLY,
+        sqlite_where=ACTIVE_ONLY,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name="appointments")
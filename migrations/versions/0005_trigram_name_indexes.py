@@ -0,0 +1,40 @@
+"""pg_trgm extension and trigram indexes for name lookups (PostgreSQL)
+
+Partial-name searches (LIKE '%name%' on lower(accountants.name) and
+lower(clients.company_name)) use these GIN indexes instead of a full scan.
+models.py creates them only for fresh tables; this brings older PostgreSQL
+databases in line.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return  # SQLite has no trigram indexes
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_acct_name_trgm ON accountants "
+        "USING gin (lower(name) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_client_name_trgm ON clients "
+        "USING gin (lower(company_name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_client_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_acct_name_trgm")
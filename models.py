@@ -2,13 +2,14 @@
 SQLAlchemy Models for Voice AI Agent Demo V2
 Optimized for SQLite: Enums stored as strings with valid SQL CHECK constraints.
 """
+import re
 import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
     Column, String, Integer, DateTime, ForeignKey, Text, 
-    Boolean, Index, CheckConstraint, func
+    Boolean, Index, CheckConstraint, DDL, event, func, text
 )
 from sqlalchemy.orm import declarative_base, relationship, validates
 
@@ -53,6 +54,25 @@ class CallLogStatus(str, PyEnum):
     TRANSFERRED = "transferred"
     CANCELLED = "cancelled"
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def normalize_phone(phone: str, default_prefix: str = "+39") -> str:
+    """
+    Normalize a phone number to E.164 (e.g. "+39 333 1234" -> "+393331234").
+    
+    Numbers without an international prefix are assumed to be Italian.
+    """
+    phone = phone.strip()
+    digits = re.sub(r"\D", "", phone)
+    if phone.startswith("+"):
+        return f"+{digits}"
+    if digits.startswith("00"):
+        return f"+{digits[2:]}"
+    return f"{default_prefix}{digits}"
+
+
 # ============================================================================
 # MODELS
 # ============================================================================
@@ -102,6 +122,7 @@ class Client(Base):
     company_name = Column(String(200), nullable=False)
     tax_code = Column(String(16), unique=True, nullable=False)
     phone = Column(String(20), nullable=False)
+    phone_normalized = Column(String(20), nullable=True, index=True)  # E.164, set from phone
     email = Column(String(100), nullable=False)
     address = Column(String(300), nullable=True)
     
@@ -114,10 +135,40 @@ class Client(Base):
     accountant = relationship("Accountant", back_populates="clients")
     appointments = relationship("Appointment", back_populates="client")
 
+    @validates("phone")
+    def _normalize_phone(self, key, phone):
+        self.phone_normalized = normalize_phone(phone) if phone else None
+        return phone
+
     def __repr__(self):
         return f"<Client {self.company_name} ({self.tax_code})>"
 
 
+# PostgreSQL only: trigram indexes so LIKE '%name%' partial matches avoid a full scan
+# (extension is created before any table: accountants is created ahead of clients)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Accountant.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_acct_name_trgm ON accountants "
+        "USING gin (lower(name) gin_trgm_ops)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Client.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_client_name_trgm ON clients "
+        "USING gin (lower(company_name) gin_trgm_ops)"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class Appointment(Base):
     """Scheduled appointment between client and accountant"""
     __tablename__ = "appointments"
@@ -143,12 +194,42 @@ class Appointment(Base):
             f"status IN {tuple(s.value for s in AppointmentStatus)}", 
             name='valid_appointment_status'
         ),
+        # Covers the availability lookup (accountant + day range, non-cancelled)
+        Index(
+            'ix_appt_accountant_dt',
+            'accountant_id',
+            'datetime',
+            postgresql_where=text(f"status <> '{AppointmentStatus.CANCELLED.value}'"),
+            sqlite_where=text(f"status <> '{AppointmentStatus.CANCELLED.value}'"),
+        ),
     )
 
     def __repr__(self):
         return f"<Appointment {self.datetime} - {self.status}>"
 
 
+# PostgreSQL only: reject overlapping active appointments for the same accountant
+# at INSERT time. Backstop for concurrent bookings racing past the
+# BookingService._has_overlap pre-check. Existing databases get it from the
+# Alembic migration 0001 (create_all only runs this for fresh tables).
+event.listen(
+    Appointment.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Appointment.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE appointments ADD CONSTRAINT no_overlapping_appointments "
+        "EXCLUDE USING gist ("
+        "accountant_id WITH =, "
+        "tsrange(\"datetime\", \"datetime\" + make_interval(mins => duration)) WITH &&"
+        f") WHERE (status <> '{AppointmentStatus.CANCELLED.value}')"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class OfficeInfo(Base):
     """Office information key-value store"""
     __tablename__ = "office_info"
@@ -2,13 +2,21 @@
 LangGraph Orchestrator - Conversation State Machine
 Manages multi-turn conversations with intent classification and routing
 """
-from typing import TypedDict, Optional, List, Literal, Any
+from typing import TypedDict, Optional, List, Literal, Any, NamedTuple
 from enum import Enum
 from datetime import datetime
+from collections import OrderedDict, deque
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from loguru import logger
+import asyncio
+import copy
 import json
 import re
+import threading
+import time
+import unicodedata
+import prompts
 from rag_engine import RAGEngine, get_rag_engine
 
 # ============================================================================
@@ -58,6 +66,101 @@ class ConversationState(TypedDict, total=False):
     current_node: str                     # Current processing node
     error: Optional[str]                  # Error message (if failed)
     requires_followup: bool               # True if needs more info
+    last_unclear_input: Optional[str]     # Normalized input that triggered the last clarification
+    escalation_offered: bool              # CLARIFICATION_ESCALATION_RESPONSE awaits a reply
+
+
+# ============================================================================
+# INTENT KEYWORDS (substring match, compiled once into one regex per intent)
+# ============================================================================
+
+TAX_KEYWORDS = (
+    "iva", "ires", "irap", "tasse", "fiscal", "scadenz", "dichiarazione",
+    "deduz", "dedur", "dedurre", "detraz", "detrare",
+    "contribut", "imposta", "aliquota", "codice tributo",
+    "regime forfett", "730", "redditi", "f24", "imu", "tari", "inps",
+)
+BOOKING_KEYWORDS = ("appuntamento", "prenotar", "prenota", "fissare", "disponibil")
+OFFICE_KEYWORDS = ("orari", "orario", "dove", "indirizzo", "telefono", "contatt", "email")
+ROUTING_KEYWORDS = ("parlare con", "dott.", "dottor", "commercialista")
+
+# Broader lists used to detect a topic change during a follow-up turn
+FOLLOWUP_OFFICE_KEYWORDS = OFFICE_KEYWORDS + (
+    "chiud", "chiude", "chiudete", "apert", "aperto", "aperti",
+)
+FOLLOWUP_ROUTING_KEYWORDS = ROUTING_KEYWORDS + ("dottoressa",)
+
+
+# Short replies to a yes/no offer (e.g. the clarification escalation)
+AFFIRMATIVE_RE = re.compile(
+    r"(?:sì|si|certo|certamente|va bene|ok|okay|d'accordo|volentieri|perfetto)\b"
+)
+NEGATIVE_RE = re.compile(r"(?:no|non)\b")
+MAX_YES_NO_WORDS = 4
+
+# Conversation turns kept in context (user + assistant entries)
+MAX_HISTORY_ITEMS = 20
+
+
+def _keyword_pattern(*groups) -> "re.Pattern[str]":
+    """Single alternation regex matching any keyword as a substring"""
+    keywords = sorted({k for group in groups for k in group}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+TAX_RE = _keyword_pattern(TAX_KEYWORDS)
+BOOKING_RE = _keyword_pattern(BOOKING_KEYWORDS)
+OFFICE_RE = _keyword_pattern(OFFICE_KEYWORDS)
+ROUTING_RE = _keyword_pattern(ROUTING_KEYWORDS)
+TOPIC_SHIFT_RE = _keyword_pattern(
+    FOLLOWUP_OFFICE_KEYWORDS, FOLLOWUP_ROUTING_KEYWORDS, BOOKING_KEYWORDS, TAX_KEYWORDS
+)
+
+
+class KeywordFeatures(NamedTuple):
+    """Which keyword families appear in an utterance"""
+    tax: bool
+    booking: bool
+    office: bool
+    routing: bool
+    topic_shift: bool
+
+
+@lru_cache(maxsize=1024)
+def _keyword_features(normalized: str) -> KeywordFeatures:
+    return KeywordFeatures(
+        tax=TAX_RE.search(normalized) is not None,
+        booking=BOOKING_RE.search(normalized) is not None,
+        office=OFFICE_RE.search(normalized) is not None,
+        routing=ROUTING_RE.search(normalized) is not None,
+        topic_shift=TOPIC_SHIFT_RE.search(normalized) is not None,
+    )
+
+
+def _normalize_utterance(text: str) -> str:
+    return unicodedata.normalize("NFKC", text.lower().strip())
+
+
+def _yes_no(text: str) -> Optional[bool]:
+    """True/False for a short affirmative/negative reply, None otherwise"""
+    normalized = _normalize_utterance(text)
+    if len(normalized.split()) > MAX_YES_NO_WORDS:
+        return None
+    if AFFIRMATIVE_RE.match(normalized):
+        return True
+    if NEGATIVE_RE.match(normalized):
+        return False
+    return None
+
+
+def _featurize(text: str) -> KeywordFeatures:
+    """
+    Keyword features for a user utterance, memoized across turns.
+    
+    Input is NFKC-normalized and lowercased first, so replayed utterances
+    (corrections, resumed flows) hit the cache regardless of casing.
+    """
+    return _keyword_features(_normalize_utterance(text))
 
 
 # ============================================================================
@@ -136,6 +239,24 @@ def welcome_node(state: ConversationState) -> ConversationState:
     return state
 
 
+@lru_cache(maxsize=256)
+def _classify_with_llm(text: str) -> str:
+    """
+    Ask the LLM to classify an input, returning its raw JSON answer.
+    
+    Cached per text so repeated identical utterances skip inference
+    (failures raise and are therefore never cached).
+    """
+    # Invariant instructions go in the system block, the request last. The
+    # prompt is below Anthropic's cacheable minimum, so it is not marked for
+    # caching; OpenAI's automatic prefix caching has the same threshold.
+    rag = get_rag_engine()
+    return rag._call_llm(
+        f'RICHIESTA:\n"{text}"',
+        system=prompts.INTENT_CLASSIFICATION_PROMPT,
+    )
+
+
 def classify_intent_node(state: ConversationState) -> ConversationState:
     """
     Classify user intent using FAST REGEX PATTERNS first, LLM as fallback.
@@ -154,6 +275,20 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
     text = (state.get("transcript") or state.get("user_input") or "")
     text_lower = text.lower().strip()
 
+    # Reply to the escalation offer: "sì" asks for a colleague to call back,
+    # "no" withdraws the offer; anything else is classified normally and
+    # leaves the offer open (see Orchestrator.process)
+    if state.get("escalation_offered"):
+        answer = _yes_no(text_lower)
+        if answer is not None:
+            state["escalation_offered"] = False
+        if answer:
+            logger.info("📞 Escalation accepted - routing to callback")
+            state["intent"] = Intent.ACCOUNTANT_ROUTING
+            state["confidence"] = 0.95
+            state.setdefault("entities", {})["callback_requested"] = True
+            return state
+
     # If we explicitly asked for a name (slot-filling), capture it here.
     # This avoids accidental "name capture" from phrases like "Appuntamento con Rossi".
     expected_slot = (state.get("entities") or {}).get("expected_slot")
@@ -185,25 +320,7 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
     # keep the previous intent instead of re-classifying a short slot-filling answer.
     # BUT: if the user clearly changes topic, allow re-classification.
     if state.get("requires_followup") and state.get("intent") and state.get("intent") != Intent.UNKNOWN:
-        office_keywords = [
-            "orari", "orario", "dove", "indirizzo", "telefono", "contatt", "email",
-            "chiud", "chiude", "chiudete", "apert", "aperto", "aperti",
-        ]
-        routing_keywords = ["parlare con", "dott.", "dottor", "dottoressa", "commercialista"]
-        booking_keywords = ["appuntamento", "prenotar", "prenota", "fissare", "disponibil"]
-        tax_keywords = [
-            "iva", "ires", "irap", "tasse", "fiscal", "scadenz", "dichiarazione",
-            "deduz", "dedur", "dedurre", "detraz", "detrare",
-            "contribut", "imposta", "aliquota", "codice tributo",
-            "regime forfett", "730", "redditi", "f24", "imu", "tari", "inps",
-        ]
-
-        topic_shift = (
-            any(k in text_lower for k in office_keywords)
-            or any(k in text_lower for k in routing_keywords)
-            or any(k in text_lower for k in booking_keywords)
-            or any(k in text_lower for k in tax_keywords)
-        )
+        topic_shift = _featurize(text_lower).topic_shift
 
         if not topic_shift:
             logger.info(
@@ -261,15 +378,10 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
 
     # NOTE: We intentionally do NOT do proactive name capture here.
     # The receptionist should ask for the name only when needed to register something.
+    features = _featurize(text_lower)
     
     # Tax query detection (to REJECT, not answer)
-    tax_keywords = [
-        "iva", "ires", "irap", "tasse", "fiscal", "scadenz", "dichiarazione",
-        "deduz", "dedur", "dedurre", "detraz", "detrare",
-        "contribut", "imposta", "aliquota", "codice tributo",
-        "regime forfett", "730", "redditi", "f24", "imu", "tari", "inps",
-    ]
-    if any(keyword in text_lower for keyword in tax_keywords):
+    if features.tax:
         logger.info("🚫 Tax query detected - will redirect to accountant")
         state["intent"] = Intent.UNKNOWN  # Treat as unknown, will give rejection message
         state["confidence"] = 0.95
@@ -277,8 +389,7 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
         return state
     
     # Booking patterns
-    booking_keywords = ["appuntamento", "prenotar", "prenota", "fissare", "disponibil"]
-    if any(keyword in text_lower for keyword in booking_keywords):
+    if features.booking:
         logger.info("🚀 FAST PATH: Booking intent detected via regex")
         state["intent"] = Intent.APPOINTMENT_BOOKING
         state["confidence"] = 0.95
@@ -306,8 +417,7 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
         return state
     
     # Office info patterns
-    office_keywords = ["orari", "orario", "dove", "indirizzo", "telefono", "contatt", "email"]
-    if any(keyword in text_lower for keyword in office_keywords):
+    if features.office:
         logger.info("🚀 FAST PATH: Office info intent detected via regex")
         state["intent"] = Intent.OFFICE_INFO
         state["confidence"] = 0.95
@@ -315,8 +425,7 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
         return state
     
     # Routing patterns
-    routing_keywords = ["parlare con", "dott.", "dottor", "commercialista"]
-    if any(keyword in text_lower for keyword in routing_keywords):
+    if features.routing:
         logger.info("🚀 FAST PATH: Routing intent detected via regex")
         state["intent"] = Intent.ACCOUNTANT_ROUTING
         state["confidence"] = 0.90
@@ -331,36 +440,8 @@ def classify_intent_node(state: ConversationState) -> ConversationState:
         from rag_engine import RAGEngine
         import config
         
-        # Build classification prompt
-        prompt = f"""Analizza questa richiesta di un cliente di uno studio commercialista italiano e classifica l'intento.
-
-INTENTI POSSIBILI:
-- booking: Prenotare, modificare, cancellare un appuntamento
-- routing: Parlare con un commercialista specifico
-- office_info: Orari ufficio, indirizzo, contatti
-- lead: Nuovo potenziale cliente che chiede informazioni SPECIFICHE sui servizi
-- unknown: Saluti generici, domande non correlate, messaggi poco chiari
-
-IMPORTANTE: Se la richiesta è solo un saluto ("ciao", "come stai") o non ha intento chiaro, classifica come UNKNOWN.
-
-RICHIESTA:
-"{text}"
-
-Rispondi SOLO con un JSON:
-{{
-    "intent": "booking|routing|office_info|lead|unknown",
-  "confidence": 0.0-1.0,
-  "entities": {{
-    "date": "YYYY-MM-DD se menzionata",
-    "time": "HH:MM se menzionata",
-    "accountant_name": "nome se menzionato",
-    "tax_type": "IVA|IRES|IRAP se menzionato"
-  }}
-}}"""
-        
-        # Call LLM (reuse RAGEngine's LLM client)
-        rag = get_rag_engine()
-        response = rag._call_llm(prompt)
+        # Call LLM (memoized per input text: classification is a pure function of it)
+        response = _classify_with_llm(text)
         
         # Parse JSON response
         # Remove markdown code blocks if present
@@ -583,7 +664,7 @@ def execute_action_node(state: ConversationState) -> ConversationState:
                             from models import Client, Accountant
                             client = None
                             if state.get("client_id"):
-                                client = db.query(Client).filter(Client.id == state["client_id"]).first()
+                                client = db.get(Client, state["client_id"])
                             if not client and entities.get("client_name"):
                                 name_q = entities.get("client_name")
                                 client = db.query(Client).filter(Client.company_name.ilike(f"%{name_q}%")).first()
@@ -691,18 +772,31 @@ def execute_action_node(state: ConversationState) -> ConversationState:
                     state["error"] = str(e)      
 
         elif intent == Intent.ACCOUNTANT_ROUTING:
-            # ✅ Real ClientService for accountant lookup
-            from services.factory import ServiceFactory
-            from models import Accountant
+            # ✅ RoutingService (cached accountant directory) for accountant lookup
+            from services.routing_service import RoutingService
             
             accountant_name = entities.get("accountant_name", "")
             
-            if not accountant_name:
-                # List available accountants from DB
+            if entities.pop("callback_requested", False):
+                # Accepted escalation: log a callback for the office to follow up
+                from models import CallLogStatus
+                
+                with get_db_session() as db:
+                    RoutingService(db).log_call(
+                        caller_phone=state.get("client_phone"),
+                        client_id=state.get("client_id"),
+                        accountant_id=state.get("accountant_id"),
+                        reason="clarification_escalated",
+                        callback_requested=True,
+                        status=CallLogStatus.CALLBACK_REQUESTED.value,
+                    )
+                state["response"] = prompts.ESCALATION_CALLBACK_RESPONSE
+                state["action_taken"] = "callback_requested"
+                state["requires_followup"] = False
+            elif not accountant_name:
+                # List available accountants
                 with get_db_session() as db:
-                    accountants = db.query(Accountant).filter(
-                        Accountant.status == "active"
-                    ).limit(3).all()
+                    accountants = RoutingService(db).list_active_accountants(limit=3)
 
                     examples = ", ".join([acc.name for acc in accountants if acc and acc.name])
                     if examples:
@@ -714,11 +808,9 @@ def execute_action_node(state: ConversationState) -> ConversationState:
                         state["response"] = "Con quale commercialista desidera parlare? Mi dica pure il cognome."
                     state["requires_followup"] = True
             else:
-                # Search for accountant in DB
+                # Search for accountant
                 with get_db_session() as db:
-                    accountant = db.query(Accountant).filter(
-                        Accountant.name.ilike(f"%{accountant_name}%")
-                    ).first()
+                    accountant = RoutingService(db).lookup_accountant(accountant_name)
                     
                     if accountant:
                         state["response"] = (
@@ -769,10 +861,10 @@ def execute_action_node(state: ConversationState) -> ConversationState:
                         state["response"] = "Può contattare lo studio telefonicamente."
                 
                 else:
-                    # General info
-                    address = info_service.get_address()
-                    contacts = info_service.get_contact_info()
-                    phone = contacts.get("office_phone", "N/A")
+                    # General info (address + contacts in one query)
+                    metadata = info_service.get_office_metadata()
+                    address = metadata["address"]
+                    phone = metadata["contacts"].get("office_phone", "N/A")
 
                     state["response"] = (
                         f"Lo studio è in {address}. "
@@ -965,6 +1057,13 @@ class Orchestrator:
         print(result["response"])
     """
     
+    # Response cache for stateless, read-only turns (e.g. "A che ora chiudete?").
+    # Only turns without caller identity are eligible (see _response_cache_key),
+    # so it serves text/CLI and test callers; phone calls always run the graph.
+    RESPONSE_CACHE_SIZE = 256
+    RESPONSE_CACHE_TTL = 60  # seconds (office hours answer depends on the day)
+    CACHEABLE_ACTIONS = {"office_info_provided"}
+    
     def __init__(self):
         """Initialize orchestrator with compiled graph"""
         logger.info("Initializing Orchestrator...")
@@ -972,6 +1071,10 @@ class Orchestrator:
         workflow = create_conversation_graph()
         self.app = workflow.compile()
         
+        # Shared by server threads, aprocess() workers and parallel tests
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
         # RAG Engine DISABLED - receptionist doesn't answer tax questions
         # Keeping code commented for potential future use
         # logger.info("Pre-warming RAG Engine...")
@@ -980,6 +1083,35 @@ class Orchestrator:
         
         logger.success("Orchestrator ready")
     
+    def reset(self) -> None:
+        """Drop per-instance caches (conversation state itself is never stored)"""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+    
+    @staticmethod
+    def _response_cache_key(state: ConversationState) -> Optional[str]:
+        """
+        Cache key for a turn, or None if the turn depends on prior context.
+        
+        Only first turns with no caller identity, entities or pending
+        follow-up are eligible: their outcome depends on the text alone.
+        Twilio turns always carry client_phone, so they never use the
+        cache (a cached state would hand one caller's identity to another).
+        """
+        if (
+            state.get("audio_path")
+            or state.get("client_phone")
+            or state.get("client_id")
+            or state.get("entities")
+            or state.get("requires_followup")
+            or len(state.get("conversation_history", [])) > 1
+        ):
+            return None
+        
+        text = state.get("transcript") or state.get("user_input") or ""
+        normalized = " ".join(text.lower().split())
+        return normalized or None
+    
     def process(
         self, 
         user_input: str = None,
@@ -1025,9 +1157,12 @@ class Orchestrator:
         else:
             raise ValueError("Must provide user_input, audio_path, or transcript")
         
-        # Initialize context fields if not present
-        if "conversation_history" not in initial_state:
-            initial_state["conversation_history"] = []
+        # Initialize context fields if not present.
+        # History is a bounded ring buffer (also detaches it from the caller's list).
+        initial_state["conversation_history"] = deque(
+            initial_state.get("conversation_history") or [],
+            maxlen=MAX_HISTORY_ITEMS,
+        )
         if "entities" not in initial_state:
             initial_state["entities"] = {}
 
@@ -1035,11 +1170,33 @@ class Orchestrator:
         # can see a coherent thread.
         user_text = initial_state.get("transcript") or initial_state.get("user_input")
         if user_text and len(str(user_text).strip()) >= 1:
-            initial_state["conversation_history"].append({
-                "role": "user",
-                "content": str(user_text).strip(),
-                "timestamp": datetime.now().isoformat(),
-            })
+            history = initial_state["conversation_history"]
+            content = str(user_text).strip()
+            last = history[-1] if history else None
+            # Skip exact back-to-back duplicates (e.g. a re-delivered webhook turn)
+            if not (last and last.get("role") == "user" and last.get("content") == content):
+                history.append({
+                    "role": "user",
+                    "content": content,
+                    "timestamp": datetime.now().isoformat(),
+                })
+        
+        repeated = self._repeated_unclear_turn(initial_state)
+        if repeated is not None:
+            return repeated
+        
+        cache_key = self._response_cache_key(initial_state)
+        if cache_key:
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached and cached[0] > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                else:
+                    cached = None
+            if cached:
+                logger.info(f"⚡ Response cache hit: '{cache_key}'")
+                # Entries are never mutated once stored: copy outside the lock
+                return copy.deepcopy(cached[1])
         
         # Run through graph
         try:
@@ -1053,22 +1210,36 @@ class Orchestrator:
             logger.info("="*70)
             
             # ✅ ADD CONTEXT TO RESULT FOR MULTI-TURN CONVERSATIONS
-            # Preserve state for next turn, but keep it bounded.
-            max_history_items = 20
-            history = final_state.get("conversation_history", [])
-            if isinstance(history, list) and len(history) > max_history_items:
-                history = history[-max_history_items:]
-
-            final_state["context"] = {
-                "conversation_history": history,
-                "entities": final_state.get("entities", {}),
-                "client_id": final_state.get("client_id"),
-                "accountant_id": final_state.get("accountant_id"),
-                "intent": final_state.get("intent"),
-                "confidence": final_state.get("confidence", 0.0),
-                "requires_followup": bool(final_state.get("requires_followup", False)),
-                "action_taken": final_state.get("action_taken"),
-            }
+            # Preserve state for next turn (already bounded by the ring buffer).
+            history = list(final_state.get("conversation_history", []))
+            final_state["conversation_history"] = history
+
+            if final_state.get("action_taken") == "clarification_requested":
+                # While an escalation offer is open, repeats don't re-offer it
+                final_state["last_unclear_input"] = (
+                    None if final_state.get("escalation_offered")
+                    else _normalize_utterance(str(user_text or ""))
+                )
+            else:
+                final_state["last_unclear_input"] = None
+                final_state["escalation_offered"] = False
+            final_state["context"] = self._build_context(final_state)
+            
+            if (
+                cache_key
+                and final_state.get("action_taken") in self.CACHEABLE_ACTIONS
+                and not final_state.get("requires_followup")
+                and not final_state.get("error")
+            ):
+                entry = (
+                    time.monotonic() + self.RESPONSE_CACHE_TTL,
+                    copy.deepcopy(final_state),
+                )
+                with self._response_cache_lock:
+                    self._response_cache[cache_key] = entry
+                    self._response_cache.move_to_end(cache_key)
+                    if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
             
             return final_state
         
@@ -1085,6 +1256,84 @@ class Orchestrator:
                 "context": {}  # ✅ Empty context on error
             }
 
+    @staticmethod
+    def _build_context(state: ConversationState) -> dict:
+        """Durable subset of a finished turn, passed back in for the next one"""
+        return {
+            "conversation_history": state["conversation_history"],
+            "entities": state.get("entities", {}),
+            "client_id": state.get("client_id"),
+            "accountant_id": state.get("accountant_id"),
+            "intent": state.get("intent"),
+            "confidence": state.get("confidence", 0.0),
+            "requires_followup": bool(state.get("requires_followup", False)),
+            "action_taken": state.get("action_taken"),
+            "last_unclear_input": state.get("last_unclear_input"),
+            "escalation_offered": bool(state.get("escalation_offered", False)),
+        }
+
+    def _repeated_unclear_turn(self, state: ConversationState) -> Optional[ConversationState]:
+        """
+        Short-circuit an unclear input repeated right after a clarification.
+        
+        Running the graph again would only re-ask the same question (and
+        possibly call the LLM classifier again), so offer escalation instead.
+        The offer is made once: last_unclear_input is cleared and
+        escalation_offered routes a "sì" on a later turn to a callback.
+        """
+        previous = state.get("last_unclear_input")
+        text = state.get("transcript") or state.get("user_input")
+        if not previous or not text or _normalize_utterance(str(text)) != previous:
+            return None
+        
+        logger.info("🔁 Repeated unclear input - offering escalation (graph skipped)")
+        response = prompts.CLARIFICATION_ESCALATION_RESPONSE
+        history = state["conversation_history"]
+        history.append({
+            "role": "assistant",
+            "content": response,
+            "timestamp": datetime.now().isoformat(),
+            "intent": Intent.UNKNOWN.value,
+            "action": "clarification_escalated",
+        })
+        
+        result: ConversationState = dict(state)
+        result.update(
+            conversation_history=list(history),
+            intent=Intent.UNKNOWN,
+            confidence=0.0,
+            response=response,
+            action_taken="clarification_escalated",
+            requires_followup=True,
+            current_node="generate_response",
+            last_unclear_input=None,
+            escalation_offered=True,
+        )
+        result["context"] = self._build_context(result)
+        return result
+
+    async def aprocess(
+        self,
+        user_input: str = None,
+        audio_path: str = None,
+        transcript: str = None,
+        context: dict = None
+    ) -> ConversationState:
+        """
+        Async variant of process() for callers running an event loop.
+        
+        The graph nodes use the sync DB session and LLM clients, so the turn
+        runs in a worker thread; concurrent turns can be awaited together
+        with asyncio.gather().
+        """
+        return await asyncio.to_thread(
+            self.process,
+            user_input=user_input,
+            audio_path=audio_path,
+            transcript=transcript,
+            context=context,
+        )
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -42,6 +42,32 @@ un appuntamento con uno dei nostri commercialisti che potrà rispondere con
 precisione alla sua domanda. Vuole che le fissi un appuntamento?"
 """
 
+# ============================================================================
+# INTENT CLASSIFICATION (LLM fallback - invariant, sent as cached system block)
+# ============================================================================
+INTENT_CLASSIFICATION_PROMPT = """Analizza questa richiesta di un cliente di uno studio commercialista italiano e classifica l'intento.
+
+INTENTI POSSIBILI:
+- booking: Prenotare, modificare, cancellare un appuntamento
+- routing: Parlare con un commercialista specifico
+- office_info: Orari ufficio, indirizzo, contatti
+- lead: Nuovo potenziale cliente che chiede informazioni SPECIFICHE sui servizi
+- unknown: Saluti generici, domande non correlate, messaggi poco chiari
+
+IMPORTANTE: Se la richiesta è solo un saluto ("ciao", "come stai") o non ha intento chiaro, classifica come UNKNOWN.
+
+Rispondi SOLO con un JSON:
+{
+    "intent": "booking|routing|office_info|lead|unknown",
+  "confidence": 0.0-1.0,
+  "entities": {
+    "date": "YYYY-MM-DD se menzionata",
+    "time": "HH:MM se menzionata",
+    "accountant_name": "nome se menzionato",
+    "tax_type": "IVA|IRES|IRAP se menzionato"
+  }
+}"""
+
 # ============================================================================
 # TAX QUERY REJECTION RESPONSE
 # ============================================================================
@@ -70,6 +96,16 @@ EMPTY_QUERY_RESPONSE = (
 	"Se è una domanda fiscale, posso fissarle un appuntamento con un commercialista."
 )
 
+CLARIFICATION_ESCALATION_RESPONSE = (
+	"Mi scusi, continuo a non capire la richiesta. "
+	"Preferisce che la metta in contatto con un collega dello studio?"
+)
+
+ESCALATION_CALLBACK_RESPONSE = (
+	"Va bene. Ho registrato la richiesta: un collega dello studio "
+	"La richiamerà al più presto."
+)
+
 # ============================================================================
 # DISCLAIMER (Always appended to responses)
 # ============================================================================
@@ -3,6 +3,7 @@ RAG Engine - Retrieval Augmented Generation
 Handles document processing, embedding, storage, and retrieval
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import chromadb
@@ -17,6 +18,42 @@ import config
 import prompts
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# ============================================================================
+# PROMPT PREFIX CACHE
+# ============================================================================
+# Anthropic ignores cache_control on prefixes shorter than ~1024 tokens
+# (2048 on Haiku models) and allows at most 4 breakpoints per request.
+# Prompt lengths are estimated at ~4 characters per token.
+MIN_CACHEABLE_PREFIX_CHARS = 4096
+MAX_CACHE_BREAKPOINTS = 4
+
+
+@lru_cache(maxsize=64)
+def _build_system_blocks(parts: Tuple[str, ...]) -> Tuple[Dict, ...]:
+    """
+    Assemble (once per distinct prefix) the system blocks.
+    
+    A block is marked cacheable only once the prefix ending with it is long
+    enough to be cached; shorter prompts (e.g. the ~300-token intent
+    classification prompt) are sent unmarked, as the marker would be a
+    no-op. The prompts are module constants, so the same block objects are
+    reused on every call; they are treated as read-only.
+    """
+    blocks = []
+    prefix_chars = 0
+    breakpoints = 0
+    for part in parts:
+        if not part:
+            continue
+        prefix_chars += len(part)
+        block = {"type": "text", "text": part}
+        if prefix_chars >= MIN_CACHEABLE_PREFIX_CHARS and breakpoints < MAX_CACHE_BREAKPOINTS:
+            block["cache_control"] = {"type": "ephemeral"}
+            breakpoints += 1
+        blocks.append(block)
+    return tuple(blocks)
+
+
 # ============================================================================
 # SINGLETON PATTERN 
 # ============================================================================
@@ -237,13 +274,27 @@ class RAGEngine:
         
         return chunks, metadatas
     
+    @staticmethod
+    def _system_blocks(system) -> List[Dict]:
+        """
+        Build Anthropic system blocks with prompt-caching breakpoints.
+        
+        Blocks are sent in the given order (put the most stable text first);
+        once the prefix is long enough to be cached, blocks are marked
+        cacheable so it is reused across turns instead of being re-processed.
+        """
+        parts = (system,) if isinstance(system, str) else tuple(system)
+        return list(_build_system_blocks(parts))
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, prompt: str, system=None) -> str:
         """
         Call Claude API with retry logic
         
         Args:
-            prompt: Complete prompt with context and question
+            prompt: Volatile part of the request (user turn)
+            system: Optional stable instructions, a string or a list of
+                strings ordered from most to least stable
             
         Returns:
             Generated response text
@@ -251,36 +302,43 @@ class RAGEngine:
         Raises:
             RuntimeError: If all retry attempts fail
         """
-        if self.llm_provider == "anthropic":
-            # Existing Anthropic code
-            message = self.anthropic_client.messages.create(...)
-            return message.content[0].text
-        
-        elif self.llm_provider == "openai":
-            # OpenAI fallback
-            response = openai.chat.completions.create(
-                model=config.LLM_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=config.LLM_MAX_TOKENS,
-                temperature=config.LLM_TEMPERATURE
-            )
-            return response.choices[0].message.content
-
         try:
-            logger.debug(f"Calling Claude with prompt length: {len(prompt)} chars")
+            logger.debug(f"Calling {self.llm_provider} with prompt length: {len(prompt)} chars")
             
-            message = self.anthropic_client.messages.create(
-                model=config.LLM_MODEL,
-                max_tokens=config.LLM_MAX_TOKENS,
-                temperature=config.LLM_TEMPERATURE,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            if self.llm_provider == "anthropic":
+                kwargs = {}
+                if system:
+                    kwargs["system"] = self._system_blocks(system)
+                
+                message = self.anthropic_client.messages.create(
+                    model=config.LLM_MODEL,
+                    max_tokens=config.LLM_MAX_TOKENS,
+                    temperature=config.LLM_TEMPERATURE,
+                    messages=[{
+                        "role": "user",
+                        "content": prompt
+                    }],
+                    **kwargs
+                )
+                response = message.content[0].text
+            
+            else:
+                # OpenAI fallback (prefix caching is automatic there)
+                messages = []
+                if system:
+                    parts = [system] if isinstance(system, str) else system
+                    messages.append({"role": "system", "content": "\n\n".join(parts)})
+                messages.append({"role": "user", "content": prompt})
+                
+                completion = openai.chat.completions.create(
+                    model=config.LLM_MODEL,
+                    messages=messages,
+                    max_tokens=config.LLM_MAX_TOKENS,
+                    temperature=config.LLM_TEMPERATURE
+                )
+                response = completion.choices[0].message.content
             
-            response = message.content[0].text
-            logger.success(f"Claude response received: {len(response)} chars")
+            logger.success(f"LLM response received: {len(response)} chars")
             
             return response
             
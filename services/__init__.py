@@ -1,15 +1,25 @@
 """
 Services package - Business logic layer
+
+Exports are resolved lazily (PEP 562) so that importing a single submodule,
+e.g. services.factory, does not pull in every service and the DB engine.
 """
-from .booking_service import BookingService
-from .client_service import ClientService
-from .office_info_service import OfficeInfoService
-from .factory import ServiceFactory, get_service_factory  # ADD THIS LINE
-
-__all__ = [
-    'BookingService',
-    'ClientService', 
-    'OfficeInfoService',
-    'ServiceFactory',          # ADD THIS
-    'get_service_factory',     # ADD THIS
-]
\ No newline at end of file
+from importlib import import_module
+
+_EXPORTS = {
+    'BookingService': '.booking_service',
+    'ClientService': '.client_service',
+    'OfficeInfoService': '.office_info_service',
+    'ServiceFactory': '.factory',
+    'get_service_factory': '.factory',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
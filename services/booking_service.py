@@ -2,14 +2,34 @@
 Booking Service - Real appointment management with DB persistence
 CRITICAL: This service MUST write to database
 """
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from loguru import logger
 
 from models import Appointment, Accountant, Client, AppointmentStatus
 
 
+# Process-wide availability cache shared by all BookingService instances
+# key "avail:{accountant_id}:{YYYY-MM-DD}" -> {duration: (expires_at, slots)}
+_availability_cache: Dict[str, Dict[int, Tuple[float, List[datetime]]]] = {}
+_availability_lock = threading.Lock()
+
+
+def _prune_availability_cache(now: float) -> None:
+    """Drop days whose cached lists have all expired (caller holds the lock)"""
+    expired = [
+        key for key, by_duration in _availability_cache.items()
+        if all(expires <= now for expires, _ in by_duration.values())
+    ]
+    for key in expired:
+        del _availability_cache[key]
+
+
 class BookingService:
     """
     Manages appointment booking operations
@@ -18,6 +38,14 @@ class BookingService:
     This is NOT a mock - this is the real implementation for Version B
     """
     
+    # Business hours: 9:00 - 18:00, slots every 30 minutes
+    START_HOUR = 9
+    END_HOUR = 18
+    SLOT_MINUTES = 30
+    
+    # Seconds a computed availability list is served from cache
+    AVAILABILITY_CACHE_TTL = 60
+    
     def __init__(self, db_session: Session):
         """
         Initialize service with database session
@@ -46,42 +74,64 @@ class BookingService:
         """
         logger.info(f"Checking availability for accountant {accountant_id} on {date.date()}")
         
-        # Business hours: 9:00 - 18:00
-        start_hour = 9
-        end_hour = 18
+        cache_key = self._availability_key(accountant_id, date)
+        with _availability_lock:
+            cached = _availability_cache.get(cache_key, {}).get(duration)
+        if cached and cached[0] > time.monotonic():
+            logger.debug(f"Availability cache hit: {cache_key}")
+            return list(cached[1])
+        
+        # Business-hours window, computed once
+        day_start = date.replace(hour=self.START_HOUR, minute=0, second=0, microsecond=0)
+        day_end = date.replace(hour=self.END_HOUR, minute=0, second=0, microsecond=0)
+        day_minutes = (self.END_HOUR - self.START_HOUR) * 60
         
         # Get existing appointments for this accountant on this date
-        existing = self.db.query(Appointment).filter(
+        # (only start/duration columns: plain tuples, no ORM instances)
+        existing = self.db.query(Appointment.datetime, Appointment.duration).filter(
             Appointment.accountant_id == accountant_id,
-            Appointment.datetime >= date.replace(hour=start_hour, minute=0),
-            Appointment.datetime < date.replace(hour=end_hour, minute=0),
+            Appointment.datetime >= day_start,
+            Appointment.datetime < day_end,
             Appointment.status != AppointmentStatus.CANCELLED.value
         ).all()
         
-        # Generate all possible slots
-        available_slots = []
-        current_time = date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
-        end_time = date.replace(hour=end_hour, minute=0)
-        
-        while current_time < end_time:
-            # Check if slot conflicts with existing appointment
-            conflict = False
-            for appt in existing:
-                appt_end = appt.datetime + timedelta(minutes=appt.duration)
-                slot_end = current_time + timedelta(minutes=duration)
-                
-                # Check overlap
-                if (current_time < appt_end) and (slot_end > appt.datetime):
-                    conflict = True
-                    break
-            
-            if not conflict:
-                available_slots.append(current_time)
+        step = self.SLOT_MINUTES
+        
+        if not existing:
+            # Empty calendar: every slot is free, skip the conflict check
+            available_slots = [
+                day_start + timedelta(minutes=i * step)
+                for i in range(day_minutes // step)
+            ]
+        else:
+            # Occupancy bitmask: bit i set <=> half-hour slot i is (partly) booked.
+            # Appointments are widened to whole slots (floor start, ceil end).
+            busy_mask = 0
+            for start, length in existing:
+                offset = int((start - day_start).total_seconds()) // 60
+                start_idx = offset // step
+                end_idx = -(-(offset + length) // step)
+                busy_mask |= ((1 << (end_idx - start_idx)) - 1) << start_idx
             
-            # Move to next slot
-            current_time += timedelta(minutes=30)  # Check every 30 min
+            # A slot of k half-hours at index i is free iff none of its bits are busy
+            slot_bits = (1 << -(-duration // step)) - 1
+            available_slots = [
+                day_start + timedelta(minutes=i * step)
+                for i in range(day_minutes // step)
+                if not busy_mask & (slot_bits << i)
+            ]
         
         logger.info(f"Found {len(available_slots)} available slots")
+        
+        # Pruned on every write: only days queried within the TTL stay cached
+        now = time.monotonic()
+        with _availability_lock:
+            _prune_availability_cache(now)
+            _availability_cache.setdefault(cache_key, {})[duration] = (
+                now + self.AVAILABILITY_CACHE_TTL,
+                list(available_slots),
+            )
+        
         return available_slots
     
     def create_appointment(
@@ -110,19 +160,26 @@ class BookingService:
         """
         logger.info(f"Creating appointment: client={client_id}, accountant={accountant_id}, time={datetime}")
         
-        # Validation 1: Check client exists
-        client = self.db.query(Client).filter(Client.id == client_id).first()
-        if not client:
+        # Validations 1+2: Check client and accountant exist (single round-trip)
+        company_name, found_accountant_id = self.db.execute(
+            select(
+                select(Client.company_name).where(Client.id == client_id).scalar_subquery(),
+                select(Accountant.id).where(Accountant.id == accountant_id).scalar_subquery(),
+            )
+        ).one()
+        if company_name is None:
             raise ValueError("Cliente non trovato")
-        
-        # Validation 2: Check accountant exists and is active
-        accountant = self.db.query(Accountant).filter(Accountant.id == accountant_id).first()
-        if not accountant:
+        if found_accountant_id is None:
             raise ValueError("Commercialista non trovato")
         
-        # Validation 3: Check slot is available
-        available_slots = self.check_availability(accountant_id, datetime, duration)
-        if datetime not in available_slots:
+        # Validation 3: Slot must be on the business-hours grid
+        if not self._is_bookable_slot(datetime):
+            raise ValueError("Orario non disponibile")
+        
+        # Validation 4: No overlapping appointment. Where the PostgreSQL
+        # exclusion constraint exists (see models.py / migrations) it is only a
+        # backstop for concurrent inserts: the IntegrityError below
+        if self._has_overlap(accountant_id, datetime, duration):
             raise ValueError("Orario non disponibile")
         
         # Create appointment
@@ -131,36 +188,90 @@ class BookingService:
             accountant_id=accountant_id,
             datetime=datetime,
             duration=duration,
-            notes=notes or f"Appuntamento con {client.company_name}",
+            notes=notes or f"Appuntamento con {company_name}",
             status=AppointmentStatus.PENDING.value  # Pending until confirmed
         )
         
         # ✅ CRITICAL: Persist to database
         self.db.add(appointment)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            # Overlap rejected by the DB exclusion constraint
+            self.db.rollback()
+            logger.warning(f"Slot {datetime} rejected by DB for accountant {accountant_id}: {e.orig}")
+            raise ValueError("Orario non disponibile") from e
         self.db.refresh(appointment)  # Get ID from DB
+        self._invalidate_availability(accountant_id, datetime)
         
         logger.success(f"✅ Appointment #{appointment.id} created successfully")
         
         return appointment
     
+    @staticmethod
+    def _availability_key(accountant_id: str, date: datetime) -> str:
+        """Cache key for an accountant's availability on a given day"""
+        return f"avail:{accountant_id}:{date.date().isoformat()}"
+    
+    def _invalidate_availability(self, accountant_id: str, date: datetime) -> None:
+        """Drop cached availability after a write affecting that day"""
+        with _availability_lock:
+            _availability_cache.pop(self._availability_key(accountant_id, date), None)
+    
+    def _is_bookable_slot(self, slot: datetime) -> bool:
+        """Check slot falls on the 30-minute grid within business hours"""
+        return (
+            self.START_HOUR <= slot.hour < self.END_HOUR
+            and slot.minute % self.SLOT_MINUTES == 0
+            and slot.second == 0
+            and slot.microsecond == 0
+        )
+    
+    def _has_overlap(self, accountant_id: str, start: datetime, duration: int) -> bool:
+        """Check whether [start, start+duration) overlaps an active appointment"""
+        end = start + timedelta(minutes=duration)
+        day_start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        existing = self.db.query(Appointment.datetime, Appointment.duration).filter(
+            Appointment.accountant_id == accountant_id,
+            Appointment.datetime >= day_start,
+            Appointment.datetime < end,
+            Appointment.status != AppointmentStatus.CANCELLED.value
+        ).all()
+        
+        return any(
+            appt_start + timedelta(minutes=length) > start
+            for appt_start, length in existing
+        )
+    
     def get_appointment(self, appointment_id: str) -> Optional[Appointment]:
         """Get appointment by ID"""
-        return self.db.query(Appointment).filter(Appointment.id == appointment_id).first()
+        return self.db.get(Appointment, appointment_id)
     
     def cancel_appointment(self, appointment_id: str) -> bool:
         """
         Cancel appointment (soft delete - set status to CANCELLED)
         
         Returns:
-            True if cancelled, False if not found
+            True if cancelled, False if not found or already cancelled
         """
-        appointment = self.get_appointment(appointment_id)
-        if not appointment:
+        # Single UPDATE ... RETURNING: no SELECT, no ORM hydration
+        cancelled = self.db.execute(
+            update(Appointment)
+            .where(
+                Appointment.id == appointment_id,
+                Appointment.status != AppointmentStatus.CANCELLED.value
+            )
+            .values(status=AppointmentStatus.CANCELLED.value)
+            .returning(Appointment.accountant_id, Appointment.datetime)
+            .execution_options(synchronize_session=False)
+        ).first()
+        self.db.commit()
+        
+        if not cancelled:
             return False
         
-        appointment.status = AppointmentStatus.CANCELLED.value
-        self.db.commit()
+        self._invalidate_availability(cancelled.accountant_id, cancelled.datetime)
         
         logger.info(f"Appointment #{appointment_id} cancelled")
-        return True
\ No newline at end of file
+        return True
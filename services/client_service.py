@@ -2,11 +2,11 @@
 Client Service - Client lookup and management
 """
 from typing import Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, func
 from loguru import logger
 
-from models import Client, Accountant
+from models import Client, Accountant, normalize_phone
 
 
 class ClientService:
@@ -29,22 +29,19 @@ class ClientService:
         """
         logger.info(f"Searching client: {company_name}")
         
-        # Try exact match first (case-insensitive)
-        client = self.db.query(Client).filter(
-            func.lower(Client.company_name) == company_name.lower()
-        ).first()
-        
-        if client:
-            logger.success(f"✅ Found client: {client.company_name} (exact match)")
-            return client
+        name = company_name.lower()
+        lower_name = func.lower(Client.company_name)
         
-        # Try partial match
+        # Single query: partial match, exact (case-insensitive) match ranked first
         client = self.db.query(Client).filter(
-            func.lower(Client.company_name).like(f"%{company_name.lower()}%")
+            lower_name.like(f"%{name}%")
+        ).order_by(
+            case((lower_name == name, 0), else_=1)
         ).first()
         
         if client:
-            logger.success(f"✅ Found client: {client.company_name} (partial match)")
+            match = "exact" if client.company_name.lower() == name else "partial"
+            logger.success(f"✅ Found client: {client.company_name} ({match} match)")
             return client
         
         logger.warning(f"⚠️ Client not found: {company_name}")
@@ -55,13 +52,15 @@ class ClientService:
         return self.db.query(Client).filter(Client.tax_code == tax_code).first()
 
     def find_by_phone(self, phone: str) -> Optional[Client]:
-        """Find client by phone (exact match)"""
-        normalized = phone.strip()
-        return self.db.query(Client).filter(Client.phone == normalized).first()
+        """Find client by phone (E.164-normalized match), with assigned accountant loaded"""
+        normalized = normalize_phone(phone)
+        return self.db.query(Client).options(
+            joinedload(Client.accountant)
+        ).filter(Client.phone_normalized == normalized).first()
     
     def get_assigned_accountant(self, client_id: str) -> Optional[Accountant]:
         """Get accountant assigned to client"""
-        client = self.db.query(Client).filter(Client.id == client_id).first()
+        client = self.db.get(Client, client_id, options=[joinedload(Client.accountant)])
         if not client:
             return None
         
@@ -12,21 +12,20 @@ This factory:
 Usage:
     from services.factory import ServiceFactory
     
-    factory = ServiceFactory(mode="real")
-    booking_service = factory.create_booking_service()
-    client_service = factory.create_client_service()
+    with ServiceFactory(mode="real") as factory:
+        booking_service = factory.create_booking_service()
+        client_service = factory.create_client_service()
 """
-from typing import Literal
+from typing import Literal, TYPE_CHECKING
 from sqlalchemy.orm import Session
 from loguru import logger
 
-# Import real service implementations
-from services.booking_service import BookingService
-from services.client_service import ClientService
-from services.office_info_service import OfficeInfoService
-
-# Import database utilities
-from database import SessionLocal, get_db
+# Service implementations and the DB engine are imported lazily inside the
+# create_* methods so importing the factory stays cheap for short-lived workers
+if TYPE_CHECKING:
+    from services.booking_service import BookingService
+    from services.client_service import ClientService
+    from services.office_info_service import OfficeInfoService
 
 
 # Type for service mode
@@ -68,31 +67,41 @@ class ServiceFactory:
         
         self.mode = mode
         self._db_session = db_session
+        self._owns_session = False  # True only if the factory opened the session
         
         logger.info(f"🏭 ServiceFactory initialized in {mode.upper()} mode")
     
+    def __enter__(self) -> "ServiceFactory":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def _get_db_session(self) -> Session:
         """
         Get database session.
         
-        Returns existing session if provided, otherwise creates new one.
-        
-        WARNING: If factory creates session, caller is responsible for closing it.
+        Returns existing session if provided, otherwise creates one on first
+        use and reuses it for every service built by this factory.
         """
-        if self._db_session:
-            return self._db_session
+        if self._db_session is None:
+            from database import SessionLocal
+            
+            logger.debug("Creating new database session")
+            self._db_session = SessionLocal()
+            self._owns_session = True
         
-        # Create new session
-        logger.debug("Creating new database session")
-        return SessionLocal()
+        return self._db_session
     
-    def create_booking_service(self) -> BookingService:
+    def create_booking_service(self) -> "BookingService":
         """
         Create BookingService instance.
         
         Returns:
             BookingService configured for current mode
         """
+        from services.booking_service import BookingService
+        
         db = self._get_db_session()
         
         if self.mode == "mock":
@@ -105,13 +114,15 @@ class ServiceFactory:
             logger.debug("Creating BookingService (real implementation)")
             return BookingService(db_session=db)
     
-    def create_client_service(self) -> ClientService:
+    def create_client_service(self) -> "ClientService":
         """
         Create ClientService instance.
         
         Returns:
             ClientService configured for current mode
         """
+        from services.client_service import ClientService
+        
         db = self._get_db_session()
         
         if self.mode == "mock":
@@ -122,13 +133,15 @@ class ServiceFactory:
             logger.debug("Creating ClientService (real implementation)")
             return ClientService(db_session=db)
     
-    def create_office_info_service(self) -> OfficeInfoService:
+    def create_office_info_service(self) -> "OfficeInfoService":
         """
         Create OfficeInfoService instance.
         
         Returns:
             OfficeInfoService configured for current mode
         """
+        from services.office_info_service import OfficeInfoService
+        
         db = self._get_db_session()
         
         if self.mode == "mock":
@@ -167,13 +180,15 @@ class ServiceFactory:
         
         Only closes session if factory created it (not provided externally).
         """
-        if self._db_session is None:
-            # Factory didn't create session, nothing to close
+        if not self._owns_session or self._db_session is None:
+            # Session was provided externally (caller is responsible)
+            # or never opened: nothing to close
             return
         
-        # Session was provided externally, don't close it
-        # (caller is responsible)
-        pass
+        logger.debug("Closing factory-owned database session")
+        self._db_session.close()
+        self._db_session = None
+        self._owns_session = False
 
 
 # ============================================================================
@@ -188,7 +203,7 @@ class MockBookingServiceWrapper:
     This would wrap BookingService and intercept DB operations.
     """
     
-    def __init__(self, real_service: BookingService):
+    def __init__(self, real_service: "BookingService"):
         self.real_service = real_service
         self.mock_appointments = []
     
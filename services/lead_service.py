@@ -38,14 +38,14 @@ class LeadService:
         return lead
 
     def mark_contacted(self, lead_id: str) -> Optional[Lead]:
-        lead = self.db.query(Lead).filter(Lead.id == lead_id).first()
+        lead = self.db.get(Lead, lead_id)
         if not lead:
             return None
         lead.contacted = True
         return lead
 
     def qualify_lead(self, lead_id: str, notes: str) -> Optional[Lead]:
-        lead = self.db.query(Lead).filter(Lead.id == lead_id).first()
+        lead = self.db.get(Lead, lead_id)
         if not lead:
             return None
         lead.notes = (lead.notes or "") + f"\n{notes}"
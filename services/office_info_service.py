@@ -1,14 +1,22 @@
 """
 Office Info Service - Office hours and information
 """
+import threading
+import time
 from typing import Optional, Dict
 from datetime import datetime
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from loguru import logger
 
 from models import OfficeInfo
 
 
+# Process-wide office hours cache: (expires_at, {day: value})
+_hours_cache: Optional[tuple] = None
+_hours_lock = threading.Lock()
+
+
 class OfficeInfoService:
     """
     Manages office information queries
@@ -24,8 +32,40 @@ class OfficeInfoService:
         "sunday": "domenica"
     }
     
+    # Office hours change rarely: serve them from memory for this many seconds
+    HOURS_CACHE_TTL = 3600
+    
     def __init__(self, db_session: Session):
         self.db = db_session
+        self._metadata: Optional[Dict] = None
+    
+    def _load_hours(self) -> Dict[str, str]:
+        """Load the whole office-hours table once, then serve it from memory"""
+        global _hours_cache
+        
+        with _hours_lock:
+            cached = _hours_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        prefix = "office_hours_"
+        rows = self.db.query(OfficeInfo.key, OfficeInfo.value).filter(
+            OfficeInfo.key.like(f"{prefix}%")
+        ).all()
+        hours = {key[len(prefix):]: value for key, value in rows}
+        
+        with _hours_lock:
+            _hours_cache = (time.monotonic() + self.HOURS_CACHE_TTL, hours)
+        
+        logger.debug(f"Loaded office hours for {len(hours)} days")
+        return hours
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop cached office hours (call after editing OfficeInfo)"""
+        global _hours_cache
+        with _hours_lock:
+            _hours_cache = None
     
     def get_office_hours(self, day: Optional[str] = None) -> str:
         """
@@ -42,29 +82,46 @@ class OfficeInfoService:
         
         logger.info(f"Getting office hours for {day}")
         
-        key = f"office_hours_{day}"
-        office_info = self.db.query(OfficeInfo).filter(OfficeInfo.key == key).first()
+        hours = self._load_hours().get(day)
         
-        if not office_info:
+        if not hours:
             return f"Informazioni non disponibili per {self.ITALIAN_DAYS.get(day, day)}"
         
-        if office_info.value == "closed":
+        if hours == "closed":
             return f"L'ufficio è chiuso {self.ITALIAN_DAYS.get(day, day)}"
         
-        return f"L'ufficio è aperto {self.ITALIAN_DAYS.get(day, day)} dalle {office_info.value}"
+        return f"L'ufficio è aperto {self.ITALIAN_DAYS.get(day, day)} dalle {hours}"
     
     def get_contact_info(self) -> Dict[str, str]:
         """Get all contact information"""
-        contacts = self.db.query(OfficeInfo).filter(
+        contacts = self.db.query(OfficeInfo.key, OfficeInfo.value).filter(
             OfficeInfo.category == "contact"
         ).all()
         
-        return {info.key: info.value for info in contacts}
+        return dict(contacts)
     
     def get_address(self) -> Optional[str]:
         """Get office address"""
-        address = self.db.query(OfficeInfo).filter(
+        return self.db.query(OfficeInfo.value).filter(
             OfficeInfo.key == "office_address"
-        ).first()
+        ).scalar()
+    
+    def get_office_metadata(self) -> Dict:
+        """
+        Get address and contact information in a single query
+        
+        Returns:
+            {"address": str | None, "contacts": {key: value}}
+        """
+        if self._metadata is not None:
+            return self._metadata
+        
+        rows = self.db.query(OfficeInfo.key, OfficeInfo.value, OfficeInfo.category).filter(
+            or_(OfficeInfo.category == "contact", OfficeInfo.key == "office_address")
+        ).all()
         
-        return address.value if address else None
\ No newline at end of file
+        self._metadata = {
+            "address": next((value for key, value, _ in rows if key == "office_address"), None),
+            "contacts": {key: value for key, value, category in rows if category == "contact"},
+        }
+        return self._metadata
@@ -1,22 +1,76 @@
 """
 Routing Service - find accountant and log call routing
 """
-from typing import Optional
+import threading
+import time
+from typing import List, NamedTuple, Optional
 from sqlalchemy.orm import Session
 from loguru import logger
 from sqlalchemy import func
 
-from models import Accountant, Client, CallLog, CallLogStatus
+from models import Accountant, AccountantStatus, Client, CallLog, CallLogStatus, normalize_phone
+
+
+class AccountantEntry(NamedTuple):
+    """Lightweight, session-independent view of an accountant"""
+    id: str
+    name: str
+    status: str
+
+
+# Process-wide accountant directory: (expires_at, [AccountantEntry, ...])
+_accountant_cache: Optional[tuple] = None
+_accountant_lock = threading.Lock()
 
 
 class RoutingService:
     """Handles routing requests and call logging"""
 
+    # Accountants change rarely: keep the directory in memory for 5 minutes
+    ACCOUNTANT_CACHE_TTL = 300
+
     def __init__(self, db_session: Session):
         self.db = db_session
 
+    def _load_accountants(self) -> List[AccountantEntry]:
+        """Load all accountants once, then serve them from memory until the TTL expires"""
+        global _accountant_cache
+
+        with _accountant_lock:
+            cached = _accountant_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        rows = self.db.query(Accountant.id, Accountant.name, Accountant.status).order_by(Accountant.name).all()
+        entries = [AccountantEntry(*row) for row in rows]
+
+        with _accountant_lock:
+            _accountant_cache = (time.monotonic() + self.ACCOUNTANT_CACHE_TTL, entries)
+
+        logger.debug(f"Loaded {len(entries)} accountants into routing cache")
+        return entries
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop the cached accountant directory (call after editing accountants)"""
+        global _accountant_cache
+        with _accountant_lock:
+            _accountant_cache = None
+
+    def lookup_accountant(self, name: str) -> Optional[AccountantEntry]:
+        """Find accountant by name (case-insensitive partial) in the cached directory"""
+        if not name:
+            return None
+        needle = name.lower()
+        return next((acc for acc in self._load_accountants() if needle in acc.name.lower()), None)
+
+    def list_active_accountants(self, limit: Optional[int] = None) -> List[AccountantEntry]:
+        """Active accountants from the cached directory"""
+        active = [acc for acc in self._load_accountants() if acc.status == AccountantStatus.ACTIVE.value]
+        return active[:limit] if limit is not None else active
+
     def find_accountant_by_name(self, name: str) -> Optional[Accountant]:
-        """Find accountant by name (case-insensitive partial)"""
+        """Find accountant by name (case-insensitive partial, trigram-indexed on PostgreSQL)"""
         if not name:
             return None
         return (
@@ -63,7 +117,9 @@ class RoutingService:
         return log
 
     def resolve_client(self, phone: str) -> Optional[Client]:
-        """Resolve client by phone exact match"""
+        """Resolve client by phone (E.164-normalized match, like ClientService.find_by_phone)"""
         if not phone:
             return None
-        return self.db.query(Client).filter(Client.phone == phone).first()
+        return self.db.query(Client).filter(
+            Client.phone_normalized == normalize_phone(phone)
+        ).first()
@@ -3,7 +3,70 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_db_pool():
+    """
+    Back SessionLocal with a warm QueuePool for the whole run.
+
+    The app default for SQLite is a single shared connection (StaticPool);
+    concurrent tests reuse pooled connections instead. No pre-ping: the
+    test database is local.
+    """
+    from sqlalchemy.pool import QueuePool
+
+    import database
+
+    engine = database.create_db_engine(
+        poolclass=QueuePool, pool_size=10, max_overflow=20, pool_pre_ping=False
+    )
+    original_engine = database.engine
+    database.engine = engine
+    database.SessionLocal.configure(bind=engine)
+    yield engine
+    database.SessionLocal.configure(bind=original_engine)
+    database.engine = original_engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _shared_orchestrator():
+    """Build the Orchestrator (and its compiled graph) once per test session"""
+    from orchestrator import Orchestrator
+
+    return Orchestrator()
+
+
+@pytest.fixture
+def orchestrator(_shared_orchestrator):
+    """Shared Orchestrator, reset so no per-instance cache leaks between tests"""
+    _shared_orchestrator.reset()
+    return _shared_orchestrator
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """
+    Replace the LLM intent-classification call with a canned "unknown" answer.
+
+    The stub returns the raw JSON text the LLM would produce, so parsing and
+    routing in classify_intent_node still run for real. Use it for tests that
+    only check structure, not live model behaviour.
+    """
+    import orchestrator as orchestrator_module
+
+    calls = []
+
+    def fake_classify(text: str) -> str:
+        calls.append(text)
+        return '{"intent": "unknown", "confidence": 0.5, "entities": {}}'
+
+    monkeypatch.setattr(orchestrator_module, "_classify_with_llm", fake_classify)
+    return calls
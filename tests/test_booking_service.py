@@ -0,0 +1,183 @@
+"""
+BookingService unit tests on an isolated in-memory SQLite database
+(no demo data, no shared state with the integration tests)
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Accountant, Appointment, AppointmentStatus, Base, Client
+from services import booking_service as booking_module
+from services.factory import ServiceFactory
+
+
+DAY = datetime(2030, 3, 4)  # A Monday, far from the demo data
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return DAY.replace(hour=hour, minute=minute)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def booking(db):
+    with ServiceFactory(db_session=db) as factory:
+        yield factory.create_booking_service()
+
+
+@pytest.fixture
+def accountant(db):
+    acc = Accountant(name="Dott. Test", email="test@booking.local")
+    db.add(acc)
+    db.commit()
+    return acc
+
+
+@pytest.fixture
+def client(db, accountant):
+    cli = Client(
+        company_name="Test Srl",
+        tax_code="TSTSRL00A00A000A",
+        phone="+39 02 1234567",
+        email="info@test.local",
+        accountant_id=accountant.id,
+    )
+    db.add(cli)
+    db.commit()
+    return cli
+
+
+def _book(db, client, accountant, start: datetime, duration: int) -> Appointment:
+    """Insert directly (bypasses the grid check, e.g. for off-grid legacy rows)"""
+    appt = Appointment(
+        client_id=client.id,
+        accountant_id=accountant.id,
+        datetime=start,
+        duration=duration,
+        status=AppointmentStatus.CONFIRMED.value,
+    )
+    db.add(appt)
+    db.commit()
+    return appt
+
+
+def _baseline_slots(booking, appointments, duration):
+    """Reference result: a slot is free iff no appointment interval overlaps it"""
+    day_start = _at(booking.START_HOUR)
+    slots = []
+    for offset in range(0, (booking.END_HOUR - booking.START_HOUR) * 60, booking.SLOT_MINUTES):
+        slot_start = day_start + timedelta(minutes=offset)
+        slot_end = slot_start + timedelta(minutes=duration)
+        if not any(
+            start < slot_end and start + timedelta(minutes=length) > slot_start
+            for start, length in appointments
+        ):
+            slots.append(slot_start)
+    return slots
+
+
+class TestAvailability:
+    """Occupancy bitmask in check_availability"""
+
+    def test_empty_day_all_slots_free(self, booking, accountant):
+        slots = booking.check_availability(accountant.id, DAY, duration=30)
+        assert len(slots) == (booking.END_HOUR - booking.START_HOUR) * 2
+        assert slots[0] == _at(9) and slots[-1] == _at(17, 30)
+
+    def test_60_minute_appointment_blocks_two_slots(self, db, booking, client, accountant):
+        _book(db, client, accountant, _at(10), 60)
+
+        slots = booking.check_availability(accountant.id, DAY, duration=30)
+
+        assert _at(10) not in slots
+        assert _at(10, 30) not in slots
+        assert _at(9, 30) in slots
+        assert _at(11) in slots
+
+    def test_off_grid_appointment_blocks_touched_slots(self, db, booking, client, accountant):
+        # 10:15-10:45 touches both the 10:00 and the 10:30 half-hours
+        _book(db, client, accountant, _at(10, 15), 30)
+
+        slots = booking.check_availability(accountant.id, DAY, duration=30)
+
+        assert _at(10) not in slots
+        assert _at(10, 30) not in slots
+        assert _at(9, 30) in slots
+        assert _at(11) in slots
+
+    @pytest.mark.parametrize("duration", [30, 60, 90])
+    def test_matches_interval_baseline(self, db, booking, client, accountant, duration):
+        appointments = [(_at(9), 30), (_at(11), 60), (_at(13, 30), 90), (_at(17), 30)]
+        for start, length in appointments:
+            _book(db, client, accountant, start, length)
+
+        slots = booking.check_availability(accountant.id, DAY, duration=duration)
+
+        assert slots == _baseline_slots(booking, appointments, duration)
+
+
+class TestAvailabilityCache:
+    """Process-wide availability cache"""
+
+    def test_create_appointment_invalidates_day(self, booking, client, accountant):
+        cache_key = booking._availability_key(accountant.id, DAY)
+        assert _at(10) in booking.check_availability(accountant.id, DAY)
+        assert cache_key in booking_module._availability_cache
+
+        booking.create_appointment(client.id, accountant.id, _at(10), duration=60)
+
+        assert cache_key not in booking_module._availability_cache
+        assert _at(10) not in booking.check_availability(accountant.id, DAY)
+
+    def test_expired_days_are_pruned(self, booking, accountant, monkeypatch):
+        other_day = DAY + timedelta(days=1)
+        booking.check_availability(accountant.id, DAY)
+
+        # Next write happens after the TTL: the stale day is dropped
+        later = booking_module.time.monotonic() + booking.AVAILABILITY_CACHE_TTL + 1
+        monkeypatch.setattr(booking_module, "time", SimpleNamespace(monotonic=lambda: later))
+        booking.check_availability(accountant.id, other_day)
+
+        assert booking._availability_key(accountant.id, DAY) not in booking_module._availability_cache
+        assert booking._availability_key(accountant.id, other_day) in booking_module._availability_cache
+
+
+class TestCancellation:
+    """cancel_appointment return contract and cache invalidation"""
+
+    def test_cancel_twice(self, db, booking, client, accountant):
+        appt = _book(db, client, accountant, _at(10), 60)
+        cache_key = booking._availability_key(accountant.id, DAY)
+
+        booking.check_availability(accountant.id, DAY)
+        assert cache_key in booking_module._availability_cache
+
+        # First cancel: succeeds and drops the cached day
+        assert booking.cancel_appointment(appt.id) is True
+        assert cache_key not in booking_module._availability_cache
+
+        # Second cancel: already cancelled, cache left alone
+        slots = booking.check_availability(accountant.id, DAY)
+        assert _at(10) in slots
+        assert booking.cancel_appointment(appt.id) is False
+        assert cache_key in booking_module._availability_cache
+
+    def test_cancel_unknown_appointment(self, booking):
+        assert booking.cancel_appointment("00000000-0000-0000-0000-000000000000") is False
@@ -4,17 +4,17 @@ FIXED: More flexible assertions that match actual system responses
 """
 import pytest
 from datetime import datetime, timedelta
-from orchestrator import Orchestrator, Intent
+import prompts
+from orchestrator import Intent
 from database import get_db_session
-from models import Appointment, Client, Accountant
+from models import Appointment, CallLog, Client, Accountant
 
 
 class TestMultiTurnBookingFlow:
     """Test booking requires multiple turns to collect info"""
 
-    def test_booking_next_week_with_rossi_timeframe(self):
+    def test_booking_next_week_with_rossi_timeframe(self, orchestrator):
         """Flow: user asks appointment with Dottor Rossi for next week (needs follow-up)."""
-        orchestrator = Orchestrator()
         context = {}
 
         result = orchestrator.process(
@@ -37,9 +37,8 @@ class TestMultiTurnBookingFlow:
         resp_lower = (result.get("response") or "").lower()
         assert any(k in resp_lower for k in ["giorno", "orario", "a che ora", "prossima settimana", "quando"])
 
-    def test_booking_requests_name_only_when_registering(self):
+    def test_booking_requests_name_only_when_registering(self, orchestrator):
         """Name should be requested only when needed to register an appointment, not upfront."""
-        orchestrator = Orchestrator()
         context = {}
 
         # Turn 1: Provide a complete day/time; system may need a name to register.
@@ -71,9 +70,9 @@ class TestMultiTurnBookingFlow:
         assert "a nome di chi" not in resp2
         assert "qual è il suo nome" not in resp2
     
-    def test_booking_incremental_collection(self):
+    @pytest.mark.xdist_group("db_writes")
+    def test_booking_incremental_collection(self, orchestrator):
         """System should collect date, time, accountant across turns"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Turn 1: Initial request (incomplete)
@@ -101,9 +100,8 @@ class TestMultiTurnBookingFlow:
             assert result2.get("entities", {}).get("date") is not None or \
                    result2.get("entities", {}).get("time") is not None
     
-    def test_booking_handles_corrections(self):
+    def test_booking_handles_corrections(self, orchestrator):
         """System should update entities when user corrects info"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Turn 1: Initial time
@@ -124,9 +122,8 @@ class TestMultiTurnBookingFlow:
                "pomeriggio" in result2["response"].lower() or \
                result2["intent"] == Intent.APPOINTMENT_BOOKING
     
-    def test_booking_requires_confirmation(self):
+    def test_booking_requires_confirmation(self, orchestrator):
         """System should handle complete booking requests"""
-        orchestrator = Orchestrator()
         context = {}
         
         result1 = orchestrator.process(
@@ -145,12 +142,12 @@ class TestMultiTurnBookingFlow:
                   for word in ["appuntamento", "prenot", "conferma", "rossi", "orario", "data"])
 
 
+@pytest.mark.usefixtures("mock_llm")
 class TestContextSwitching:
     """Test handling of abrupt context changes"""
     
-    def test_switch_from_booking_to_tax_query(self):
+    def test_switch_from_booking_to_tax_query(self, orchestrator):
         """User changes mind mid-conversation"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Start booking flow
@@ -170,9 +167,8 @@ class TestContextSwitching:
         assert result2["intent"] == Intent.UNKNOWN
         assert any(word in result2["response"].lower() for word in ["non posso", "consulenza", "appuntamento", "commercialista"])
     
-    def test_resume_after_interruption(self):
+    def test_resume_after_interruption(self, orchestrator):
         """User should be able to return to original topic"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Start booking
@@ -208,12 +204,12 @@ class TestContextSwitching:
                result3.get("requires_followup") == True
 
 
+@pytest.mark.usefixtures("mock_llm")
 class TestAmbiguityHandling:
     """Test system handles unclear/ambiguous input"""
     
-    def test_anaphora_resolution(self):
+    def test_anaphora_resolution(self, orchestrator):
         """System should attempt to resolve pronouns to previous entities"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Establish context
@@ -234,10 +230,8 @@ class TestAmbiguityHandling:
         assert result2["response"] is not None
         assert len(result2["response"]) > 10  # Has meaningful response
     
-    def test_multiple_intents_same_utterance(self):
+    def test_multiple_intents_same_utterance(self, orchestrator):
         """Handle user asking multiple things at once"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Quando scade l'IVA e vorrei anche un appuntamento"
         )
@@ -250,13 +244,12 @@ class TestAmbiguityHandling:
         assert len(result["response"]) > 20  # Non-trivial response
 
 
+@pytest.mark.usefixtures("mock_llm")
 class TestErrorRecovery:
     """Test conversation recovery from errors"""
     
-    def test_clarification_after_unknown_intent(self):
+    def test_clarification_after_unknown_intent(self, orchestrator):
         """System should ask for clarification gracefully"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Ciao come va?"
         )
@@ -268,10 +261,8 @@ class TestErrorRecovery:
         assert any(word in result["response"].lower() 
                   for word in ["aiuta", "posso", "cosa", "serve", "bisogno"])
     
-    def test_invalid_entity_rejection(self):
+    def test_invalid_entity_rejection(self, orchestrator):
         """System should handle invalid dates/times"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Appuntamento il 30 febbraio"
         )
@@ -286,22 +277,32 @@ class TestErrorRecovery:
         assert result["response"] is not None
         assert len(result["response"]) > 10
     
-    def test_max_clarification_attempts(self):
+    def test_max_clarification_attempts(self, orchestrator, mock_llm):
         """System should handle repeated unclear responses"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Track how system responds to repeated unclear input
         unclear_responses = []
+        actions = []
+        llm_calls = []
         
         for i in range(3):
+            calls_before = len(mock_llm)
             result = orchestrator.process(
                 user_input="boh",
                 context=context
             )
             unclear_responses.append(result["response"])
+            actions.append(result["action_taken"])
+            llm_calls.append(len(mock_llm) - calls_before)
             context.update(result.get("context", {}))
         
+        # The repeat right after a clarification escalates without the graph
+        assert actions[0] == "clarification_requested"
+        assert actions[1] == "clarification_escalated"
+        assert unclear_responses[1] == prompts.CLARIFICATION_ESCALATION_RESPONSE
+        assert llm_calls[1] == 0
+        
         # System should respond consistently (not crash)
         assert all(r is not None for r in unclear_responses)
         assert all(len(r) > 10 for r in unclear_responses)
@@ -310,14 +311,42 @@ class TestErrorRecovery:
         final = unclear_responses[-1].lower()
         # Just verify it's a reasonable response
         assert len(final) > 20
+        
+        # The offer is made once: the third "boh" is a plain clarification
+        assert actions[2] == "clarification_requested"
+    
+    @pytest.mark.xdist_group("db_writes")
+    def test_escalation_accepted_requests_callback(self, orchestrator):
+        """A "sì" after the escalation offer logs a callback request"""
+        context = {}
+        for _ in range(3):
+            result = orchestrator.process(user_input="boh", context=context)
+            context.update(result.get("context", {}))
+        
+        callbacks = CallLog.callback_requested.is_(True)
+        with get_db_session() as db:
+            before = {row.id for row in db.query(CallLog.id).filter(callbacks)}
+        
+        result = orchestrator.process(user_input="sì", context=context)
+        
+        assert result["action_taken"] == "callback_requested"
+        assert "richiamerà" in result["response"]
+        assert not result["context"]["escalation_offered"]
+        
+        with get_db_session() as db:
+            created = db.query(CallLog).filter(callbacks, CallLog.id.notin_(before)).all()
+            assert len(created) == 1
+            assert created[0].status == "callback_requested"
+            # Clean up the test row
+            db.delete(created[0])
 
 
+@pytest.mark.usefixtures("mock_llm")
 class TestConversationMemory:
     """Test context persistence across turns"""
     
-    def test_conversation_history_stored(self):
+    def test_conversation_history_stored(self, orchestrator):
         """All turns should be stored in history"""
-        orchestrator = Orchestrator()
         context = {}
         
         inputs = [
@@ -347,9 +376,8 @@ class TestConversationMemory:
         # Flexible: accept if ANY history recorded
         # (Full implementation might limit history size)
     
-    def test_context_limit_enforcement(self):
+    def test_context_limit_enforcement(self, orchestrator):
         """System should handle many turns gracefully"""
-        orchestrator = Orchestrator()
         context = {}
         
         # Simulate 20 turns
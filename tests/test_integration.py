@@ -4,7 +4,8 @@ Tests complete user journeys through the system
 """
 import pytest
 from datetime import datetime, timedelta
-from orchestrator import Orchestrator, Intent
+from sqlalchemy import func
+from orchestrator import Intent
 from database import get_db_session
 from models import Appointment, Client, Accountant
 
@@ -12,14 +13,12 @@ from models import Appointment, Client, Accountant
 class TestBookingFlow:
     """Test complete booking workflow"""
     
-    def test_booking_creates_appointment_in_db(self):
+    @pytest.mark.xdist_group("db_writes")
+    def test_booking_creates_appointment_in_db(self, orchestrator):
         """Test that booking request creates real DB record"""
-        # Setup
-        orchestrator = Orchestrator()
-        
         # Get initial count
         with get_db_session() as db:
-            count_before = db.query(Appointment).count()
+            count_before = db.query(func.count(Appointment.id)).scalar()
         
         # Execute booking
         result = orchestrator.process(
@@ -35,7 +34,7 @@ class TestBookingFlow:
 
             # Verify DB write
             with get_db_session() as db:
-                count_after = db.query(Appointment).count()
+                count_after = db.query(func.count(Appointment.id)).scalar()
                 assert count_after == count_before + 1
 
                 # Verify appointment details
@@ -60,17 +59,15 @@ class TestBookingFlow:
             assert "?" in result["response"]
             # No DB write should have happened yet.
             with get_db_session() as db:
-                count_after = db.query(Appointment).count()
+                count_after = db.query(func.count(Appointment.id)).scalar()
                 assert count_after == count_before
         else:
             # If we couldn't create appointment, the response should indicate failure
             assert "non" in result["response"].lower() or "errore" in result.get("error", "").lower()
 
     
-    def test_booking_rejects_invalid_hours(self):
+    def test_booking_rejects_invalid_hours(self, orchestrator):
         """Test that booking rejects out-of-hours requests"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Vorrei un appuntamento domani alle 20:00"
         )
@@ -78,10 +75,9 @@ class TestBookingFlow:
         assert "fuori dall'orario" in result["response"].lower()
         assert result["action_taken"] != "appointment_created"
     
-    def test_booking_detects_conflicts(self):
+    @pytest.mark.xdist_group("db_writes")
+    def test_booking_detects_conflicts(self, orchestrator):
         """Test that booking detects schedule conflicts"""
-        orchestrator = Orchestrator()
-        
         # Create first appointment
         result1 = orchestrator.process(
             user_input="Vorrei un appuntamento dopodomani alle 11:00"
@@ -102,10 +98,8 @@ class TestBookingFlow:
 class TestTaxQueryFlow:
     """Tax queries are rejected (no fiscal advice)"""
     
-    def test_tax_query_returns_rag_response(self):
+    def test_tax_query_returns_rag_response(self, orchestrator):
         """Tax queries should be rejected and routed to a human"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Quando scade la dichiarazione IVA?"
         )
@@ -114,10 +108,8 @@ class TestTaxQueryFlow:
         assert result.get("action_taken") == "tax_query_rejected"
         assert any(word in result["response"].lower() for word in ["non posso", "consulenza", "appuntamento", "commercialista"])
     
-    def test_tax_query_includes_disclaimer(self):
+    def test_tax_query_includes_disclaimer(self, orchestrator):
         """Deduction-related questions should be rejected as tax queries"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Posso dedurre le spese di carburante?"
         )
@@ -129,10 +121,8 @@ class TestTaxQueryFlow:
 class TestRoutingFlow:
     """Test accountant routing"""
     
-    def test_routing_finds_accountant_in_db(self):
+    def test_routing_finds_accountant_in_db(self, orchestrator):
         """Test that routing queries real database"""
-        orchestrator = Orchestrator()
-        
         # Get an actual accountant name from DB
         with get_db_session() as db:
             accountant = db.query(Accountant).first()
@@ -145,10 +135,8 @@ class TestRoutingFlow:
         assert result["intent"] == Intent.ACCOUNTANT_ROUTING
         assert accountant_name in result["response"]
     
-    def test_routing_handles_unknown_accountant(self):
+    def test_routing_handles_unknown_accountant(self, orchestrator):
         """Test routing with non-existent accountant"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Vorrei parlare con Dott. FantasyName"
         )
@@ -160,10 +148,8 @@ class TestRoutingFlow:
 class TestOfficeInfoFlow:
     """Test office information queries"""
     
-    def test_office_hours_from_db(self):
+    def test_office_hours_from_db(self, orchestrator):
         """Test that office hours come from database"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="A che ora chiudete oggi?"
         )
@@ -174,10 +160,8 @@ class TestOfficeInfoFlow:
         assert any(word in result["response"].lower() 
                   for word in ["orari", "aperto", "chiuso"])
     
-    def test_office_address_from_db(self):
+    def test_office_address_from_db(self, orchestrator):
         """Test that address comes from database"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Dove siete?"
         )
@@ -189,10 +173,8 @@ class TestOfficeInfoFlow:
 class TestUnknownIntentFlow:
     """Test handling of unclear requests"""
     
-    def test_unknown_intent_requests_clarification(self):
+    def test_unknown_intent_requests_clarification(self, orchestrator):
         """Test that system handles unclear requests gracefully"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(
             user_input="Ciao come stai?"
         )
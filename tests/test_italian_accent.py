@@ -1,11 +1,21 @@
 # test_italian_accent.py
-"""Quick manual test for Italian accent TTS (generates audio files)."""
+"""Quick manual test for Italian accent TTS (generates audio files).
+
+Runs standalone (python tests/test_italian_accent.py) or, opting in to the
+API cost, under pytest with one case per (model, text):
+
+    RUN_AUDIO_TESTS=1 pytest tests/test_italian_accent.py -n 4
+"""
 
 from __future__ import annotations
 
+import os
 import sys
+from itertools import product
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 ARCHIVE_DIR = REPO_ROOT / "archive"
@@ -15,44 +25,49 @@ if str(REPO_ROOT) not in sys.path:
 if str(ARCHIVE_DIR) not in sys.path:
     sys.path.insert(0, str(ARCHIVE_DIR))
 
-if __name__ != "__main__":
-    import pytest
-
+if __name__ != "__main__" and os.getenv("RUN_AUDIO_TESTS") != "1":
     pytest.skip(
-        "Manual audio-generation script (not an automated test). Run: python tests/test_italian_accent.py",
+        "Manual audio-generation script (not an automated test). "
+        "Run: python tests/test_italian_accent.py (or RUN_AUDIO_TESTS=1 pytest ...)",
         allow_module_level=True,
     )
 
 from voice_handler import VoiceHandler
 
-def test_italian_accent():
-    """Test the new accent-steered TTS"""
-    
+# Test text with difficult Italian words
+TEST_TEXTS = [
+    "Buongiorno, sono il suo commercialista di fiducia a Milano.",
+    "La dichiarazione IVA trimestrale scade il giorno quindici del mese successivo.",
+    "Per l'IRES, l'aliquota ordinaria è attualmente del ventiquattro per cento.",
+]
+
+
+@pytest.fixture(scope="module")
+def handler():
+    return VoiceHandler()
+
+
+@pytest.mark.parametrize(
+    "use_accent_model,text",
+    list(product((False, True), TEST_TEXTS)),
+    ids=lambda v: ("accent" if v else "standard") if isinstance(v, bool) else v[:20],
+)
+def test_italian_accent(handler, use_accent_model, text):
+    """Standard TTS (anglophone accent) vs accent-steered TTS (Italian native)"""
+    path = handler.synthesize_italian(text, use_accent_model=use_accent_model)
+    print(f"✓ Generated: {path}")
+    assert Path(path).exists()
+
+
+if __name__ == "__main__":
     handler = VoiceHandler()
-    
-    # Test text with difficult Italian words
-    test_texts = [
-        "Buongiorno, sono il suo commercialista di fiducia a Milano.",
-        "La dichiarazione IVA trimestrale scade il giorno quindici del mese successivo.",
-        "Per l'IRES, l'aliquota ordinaria è attualmente del ventiquattro per cento.",
-    ]
-    
-    print("\n=== Testing STANDARD TTS (anglophone accent) ===")
-    for i, text in enumerate(test_texts):
-        print(f"\nTest {i+1}: {text[:50]}...")
-        path = handler.synthesize_italian(text, use_accent_model=False)
-        print(f"✓ Generated: {path}")
-        assert Path(path).exists()
-    
-    print("\n=== Testing ACCENT-STEERED TTS (Italian native) ===")
-    for i, text in enumerate(test_texts):
-        print(f"\nTest {i+1}: {text[:50]}...")
-        path = handler.synthesize_italian(text, use_accent_model=True)
-        print(f"✓ Generated: {path}")
-        assert Path(path).exists()
-    
+
+    for use_accent_model in (False, True):
+        label = "ACCENT-STEERED TTS (Italian native)" if use_accent_model else "STANDARD TTS (anglophone accent)"
+        print(f"\n=== Testing {label} ===")
+        for i, text in enumerate(TEST_TEXTS):
+            print(f"\nTest {i+1}: {text[:50]}...")
+            test_italian_accent(handler, use_accent_model, text)
+
     print("\n✅ All tests passed! Compare the audio files manually.")
     print("   Listen to both versions and verify the accent difference.")
-
-if __name__ == "__main__":
-    test_italian_accent()
\ No newline at end of file
@@ -3,15 +3,13 @@ LangGraph state machine validation
 Tests node transitions and state consistency
 """
 import pytest
-from orchestrator import Orchestrator, ConversationState
+from orchestrator import ConversationState
 
 class TestNodeTransitions:
     """Validate state transitions between nodes"""
     
-    def test_welcome_to_classify_transition(self):
+    def test_welcome_to_classify_transition(self, orchestrator):
         """Welcome node should always go to classify"""
-        orchestrator = Orchestrator()
-        
         initial_state: ConversationState = {
             "user_input": "test"
         }
@@ -23,10 +21,8 @@ class TestNodeTransitions:
         assert result.get("intent") is not None
         assert result.get("confidence") is not None
     
-    def test_error_handling_creates_error_state(self):
+    def test_error_handling_creates_error_state(self, orchestrator):
         """Errors should create proper error state"""
-        orchestrator = Orchestrator()
-        
         # Force error with invalid state
         with pytest.raises(Exception):
             orchestrator.process(user_input=None, audio_path=None, transcript=None)
@@ -35,10 +31,8 @@ class TestNodeTransitions:
 class TestStateConsistency:
     """Validate state object remains consistent"""
     
-    def test_all_required_fields_present(self):
+    def test_all_required_fields_present(self, orchestrator):
         """Final state should have all required fields"""
-        orchestrator = Orchestrator()
-        
         result = orchestrator.process(user_input="Test")
         
         required_fields = [
@@ -18,18 +18,31 @@ Voces probadas para cada modelo:
 - fable (masculine, British accent)
 
 Output: test_audio_samples/ directory with organized samples
+(audio is cached in test_audio_samples/_cache; pass --no-cache to regenerate)
+
+Usage (no selection option shows the interactive menu):
+    python tests/test_tts_accent_comparison.py --mode quick
+    python tests/test_tts_accent_comparison.py --configs tts1hd_alloy,gpt4o_audio_nova --texts greeting
+    python tests/test_tts_accent_comparison.py --rerun --no-cache
+    python tests/test_tts_accent_comparison.py --mode full --estimate-only
 """
 
+import argparse
+import asyncio
+import hashlib
+import html
+import json
 import os
+import shutil
+import string
 import sys
+import time
+import unicodedata
+from itertools import product
 from pathlib import Path
 from datetime import datetime
 import base64
-from typing import Dict, List
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-if str(REPO_ROOT) not in sys.path:
-    sys.path.insert(0, str(REPO_ROOT))
+from typing import Dict, List, NamedTuple, Optional
 
 # This file is a manual comparison script (generates audio samples). It is not an
 # automated pytest test, but it lives under tests/ for convenience.
@@ -41,8 +54,15 @@ if __name__ != "__main__":
         allow_module_level=True,
     )
 
+# Script mode only: make the repo root importable (tests/conftest.py does
+# this for pytest runs).
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import AsyncOpenAI
     import config
     from loguru import logger
 except ImportError as e:
@@ -55,105 +75,138 @@ except ImportError as e:
 # TEST TEXTS - Variety of Italian content
 # ============================================================================
 
-TEST_TEXTS = {
-    "greeting": {
-        "label": "1. Professional greeting",
-        "text": "Buongiorno, sono il suo commercialista di fiducia. Come posso aiutarla oggi?"
-    },
-    "technical": {
-        "label": "2. Technical fiscal terms",
-        "text": "La dichiarazione IVA trimestrale deve essere presentata entro il giorno quindici del mese successivo al trimestre di riferimento."
-    },
-    "numbers": {
-        "label": "3. Numbers and percentages",
-        "text": "L'aliquota IRES ordinaria è del ventiquattro per cento, mentre per le società di capitali l'IVA può variare dal quattro al ventidue per cento."
-    },
-    "complex": {
-        "label": "4. Complex response (real)",
-        "text": "Dunque, per quanto riguarda la sua domanda sulle deduzioni fiscali, le spiego meglio. Secondo la normativa vigente, le spese di carburante sono deducibili al venti per cento per i veicoli aziendali. Tuttavia, se il veicolo è utilizzato esclusivamente per l'attività professionale, la percentuale di deduzione può aumentare fino all'ottanta per cento. Le consiglio di conservare tutti i documenti giustificativi."
-    },
-    "difficult_words": {
-        "label": "5. Difficult-to-pronounce words",
-        "text": "Gli adempimenti fiscali richiedono particolare attenzione: dichiarazione, registrazione, liquidazione, ritenuta d'acconto, contribuzione previdenziale."
-    }
-}
+class SampleText(NamedTuple):
+    key: str
+    label: str
+    text: str
+
+
+TEST_TEXTS = (
+    SampleText(
+        "greeting",
+        "1. Professional greeting",
+        "Buongiorno, sono il suo commercialista di fiducia. Come posso aiutarla oggi?",
+    ),
+    SampleText(
+        "technical",
+        "2. Technical fiscal terms",
+        "La dichiarazione IVA trimestrale deve essere presentata entro il giorno quindici del mese successivo al trimestre di riferimento.",
+    ),
+    SampleText(
+        "numbers",
+        "3. Numbers and percentages",
+        "L'aliquota IRES ordinaria è del ventiquattro per cento, mentre per le società di capitali l'IVA può variare dal quattro al ventidue per cento.",
+    ),
+    SampleText(
+        "complex",
+        "4. Complex response (real)",
+        "Dunque, per quanto riguarda la sua domanda sulle deduzioni fiscali, le spiego meglio. Secondo la normativa vigente, le spese di carburante sono deducibili al venti per cento per i veicoli aziendali. Tuttavia, se il veicolo è utilizzato esclusivamente per l'attività professionale, la percentuale di deduzione può aumentare fino all'ottanta per cento. Le consiglio di conservare tutti i documenti giustificativi.",
+    ),
+    SampleText(
+        "difficult_words",
+        "5. Difficult-to-pronounce words",
+        "Gli adempimenti fiscali richiedono particolare attenzione: dichiarazione, registrazione, liquidazione, ritenuta d'acconto, contribuzione previdenziale.",
+    ),
+)
+TEXTS_BY_KEY = {t.key: t for t in TEST_TEXTS}
+TEXT_LENGTHS = {t.key: len(t.text) for t in TEST_TEXTS}
 
 
 # ============================================================================
 # TTS MODEL CONFIGURATIONS
 # ============================================================================
 
-TTS_CONFIGS = {
+class TTSConfig(NamedTuple):
+    key: str
+    label: str
+    model: str
+    voice: str
+    method: str
+    cost_per_1k_chars: float
+    description: str
+
+
+TTS_CONFIGS = (
     # Standard TTS models
-    "tts1_alloy": {
-        "label": "OpenAI tts-1 (standard) - Voice: alloy",
-        "model": "tts-1",
-        "voice": "alloy",
-        "method": "standard",
-        "cost_per_1k_chars": 0.015,
-        "description": "Standard model, basic quality, neutral/English-leaning accent"
-    },
-    "tts1_nova": {
-        "label": "OpenAI tts-1 (standard) - Voice: nova",
-        "model": "tts-1",
-        "voice": "nova",
-        "method": "standard",
-        "cost_per_1k_chars": 0.015,
-        "description": "Standard model, female voice, neutral accent"
-    },
-    "tts1_echo": {
-        "label": "OpenAI tts-1 (standard) - Voice: echo",
-        "model": "tts-1",
-        "voice": "echo",
-        "method": "standard",
-        "cost_per_1k_chars": 0.015,
-        "description": "Standard model, male voice, neutral accent"
-    },
+    TTSConfig(
+        key="tts1_alloy",
+        label="OpenAI tts-1 (standard) - Voice: alloy",
+        model="tts-1",
+        voice="alloy",
+        method="standard",
+        cost_per_1k_chars=0.015,
+        description="Standard model, basic quality, neutral/English-leaning accent",
+    ),
+    TTSConfig(
+        key="tts1_nova",
+        label="OpenAI tts-1 (standard) - Voice: nova",
+        model="tts-1",
+        voice="nova",
+        method="standard",
+        cost_per_1k_chars=0.015,
+        description="Standard model, female voice, neutral accent",
+    ),
+    TTSConfig(
+        key="tts1_echo",
+        label="OpenAI tts-1 (standard) - Voice: echo",
+        model="tts-1",
+        voice="echo",
+        method="standard",
+        cost_per_1k_chars=0.015,
+        description="Standard model, male voice, neutral accent",
+    ),
     
     # HD TTS models
-    "tts1hd_alloy": {
-        "label": "OpenAI tts-1-hd (high def) - Voice: alloy",
-        "model": "tts-1-hd",
-        "voice": "alloy",
-        "method": "standard",
-        "cost_per_1k_chars": 0.030,
-        "description": "Modelo HD, mejor calidad audio, PERO sigue con acento anglófono"
-    },
-    "tts1hd_nova": {
-        "label": "OpenAI tts-1-hd (high def) - Voice: nova",
-        "model": "tts-1-hd",
-        "voice": "nova",
-        "method": "standard",
-        "cost_per_1k_chars": 0.030,
-        "description": "Modelo HD, voz femenina, acento neutral"
-    },
+    TTSConfig(
+        key="tts1hd_alloy",
+        label="OpenAI tts-1-hd (high def) - Voice: alloy",
+        model="tts-1-hd",
+        voice="alloy",
+        method="standard",
+        cost_per_1k_chars=0.030,
+        description="Modelo HD, mejor calidad audio, PERO sigue con acento anglófono",
+    ),
+    TTSConfig(
+        key="tts1hd_nova",
+        label="OpenAI tts-1-hd (high def) - Voice: nova",
+        model="tts-1-hd",
+        voice="nova",
+        method="standard",
+        cost_per_1k_chars=0.030,
+        description="Modelo HD, voz femenina, acento neutral",
+    ),
     
     # Accent-steered models (gpt-4o-audio-preview)
-    "gpt4o_audio_alloy_light": {
-        "label": "GPT-4o Audio Preview - Accent: Italian (light instructions)",
-        "model": "gpt-4o-audio-preview",
-        "voice": "alloy",
-        "method": "accent_steered_light",
-        "cost_per_1k_chars": 0.060,
-        "description": "Modelo avanzado con instrucciones LIGERAS de acento italiano"
-    },
-    "gpt4o_audio_alloy_strong": {
-        "label": "GPT-4o Audio Preview - Accent: Italian (strong instructions)",
-        "model": "gpt-4o-audio-preview",
-        "voice": "alloy",
-        "method": "accent_steered_strong",
-        "cost_per_1k_chars": 0.060,
-        "description": "Modelo avanzado con instrucciones FUERTES de acento milanés"
-    },
-    "gpt4o_audio_nova": {
-        "label": "GPT-4o Audio Preview - Voice: nova + Italian accent",
-        "model": "gpt-4o-audio-preview",
-        "voice": "nova",
-        "method": "accent_steered_strong",
-        "cost_per_1k_chars": 0.060,
-        "description": "Modelo avanzado, voz femenina, acento italiano fuerte"
-    }
-}
+    TTSConfig(
+        key="gpt4o_audio_alloy_light",
+        label="GPT-4o Audio Preview - Accent: Italian (light instructions)",
+        model="gpt-4o-audio-preview",
+        voice="alloy",
+        method="accent_steered_light",
+        cost_per_1k_chars=0.060,
+        description="Modelo avanzado con instrucciones LIGERAS de acento italiano",
+    ),
+    TTSConfig(
+        key="gpt4o_audio_alloy_strong",
+        label="GPT-4o Audio Preview - Accent: Italian (strong instructions)",
+        model="gpt-4o-audio-preview",
+        voice="alloy",
+        method="accent_steered_strong",
+        cost_per_1k_chars=0.060,
+        description="Modelo avanzado con instrucciones FUERTES de acento milanés",
+    ),
+    TTSConfig(
+        key="gpt4o_audio_nova",
+        label="GPT-4o Audio Preview - Voice: nova + Italian accent",
+        model="gpt-4o-audio-preview",
+        voice="nova",
+        method="accent_steered_strong",
+        cost_per_1k_chars=0.060,
+        description="Modelo avanzado, voz femenina, acento italiano fuerte",
+    ),
+)
+CONFIGS_BY_KEY = {c.key: c for c in TTS_CONFIGS}
+COST_PER_CHAR = {c.key: c.cost_per_1k_chars / 1000 for c in TTS_CONFIGS}
 
 
 # ============================================================================
@@ -189,6 +242,133 @@ Zero tracce di pronuncia straniera. Parli italiano dalla nascita."""
 }
 
 
+# ============================================================================
+# HTML PLAYER TEMPLATE
+# ============================================================================
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="it">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>TTS Accent Comparison Player</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        h1 {
+            color: #2c3e50;
+            text-align: center;
+        }
+        .text-section {
+            background: white;
+            padding: 20px;
+            margin: 20px 0;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .text-content {
+            background: #f8f9fa;
+            padding: 15px;
+            border-left: 4px solid #3498db;
+            margin: 10px 0;
+            font-style: italic;
+        }
+        .audio-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 15px;
+            margin-top: 20px;
+        }
+        .audio-item {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 4px;
+            border: 1px solid #dee2e6;
+        }
+        .audio-label {
+            font-weight: bold;
+            color: #495057;
+            margin-bottom: 8px;
+            font-size: 14px;
+        }
+        .audio-description {
+            font-size: 12px;
+            color: #6c757d;
+            margin-bottom: 10px;
+        }
+        .cost-badge {
+            display: inline-block;
+            background: #28a745;
+            color: white;
+            padding: 2px 8px;
+            border-radius: 3px;
+            font-size: 11px;
+            margin-left: 5px;
+        }
+        .cost-badge.expensive {
+            background: #ffc107;
+            color: #000;
+        }
+        audio {
+            width: 100%;
+            margin-top: 5px;
+        }
+        .legend {
+            background: #fff;
+            padding: 15px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }
+        .legend-item {
+            display: inline-block;
+            margin-right: 20px;
+            font-size: 14px;
+        }
+    </style>
+</head>
+<body>
+    <h1>🎧 TTS Accent Comparison Player</h1>
+    
+    <div class="legend">
+        <strong>Leyenda de costos:</strong>
+        <span class="legend-item"><span class="cost-badge">$</span> Standard ($0.015-0.03/1K)</span>
+        <span class="legend-item"><span class="cost-badge expensive">$$</span> Premium ($0.06/1K)</span>
+    </div>
+    
+"""
+
+_HTML_SECTION = string.Template("""    <div class="text-section">
+        <h2>${label}</h2>
+        <div class="text-content">${text}</div>
+        <div class="audio-grid">
+${items}        </div>
+    </div>
+
+""")
+
+_HTML_ITEM = string.Template("""            <div class="audio-item">
+                <div class="audio-label">
+                    ${model} - ${voice}
+                    <span class="cost-badge ${cost_class}">$$${cost}</span>
+                </div>
+                <div class="audio-description">${description}</div>
+                <audio controls preload="none">
+                    <source src="${filename}" type="audio/mpeg">
+                </audio>
+            </div>
+""")
+
+_HTML_TAIL = """
+</body>
+</html>
+"""
+
+
 # ============================================================================
 # TTS GENERATOR CLASS
 # ============================================================================
@@ -196,17 +376,31 @@ Zero tracce di pronuncia straniera. Parli italiano dalla nascita."""
 class TTSComparator:
     """Compare different TTS models and configurations."""
     
-    def __init__(self, output_dir: str = "test_audio_samples"):
-        """Initialize TTS comparator"""
+    # Simultaneous API requests (keeps bursts under the OpenAI rate limits)
+    MAX_CONCURRENCY = 8
+    # Request-start budget shared by all concurrent samples (OpenAI RPM limit)
+    MAX_REQUESTS_PER_MINUTE = 50
+    # Keep-alive pool shared by every request of a run
+    HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+    
+    def __init__(self, output_dir: str = "test_audio_samples", use_cache: bool = True):
+        """Initialize TTS comparator (use_cache=False forces regeneration)"""
         
         # Check API key
         if not config.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY not found in config/environment")
         
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        # Bound to a pooled HTTP client for the duration of each run
+        self.client: Optional[AsyncOpenAI] = None
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Content-addressed audio shared across runs (see _cache_path)
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / "_cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        
         # Create timestamp for this test run
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.run_dir = self.output_dir / f"run_{self.timestamp}"
@@ -218,25 +412,37 @@ class TTSComparator:
         self.total_chars = 0
         self.total_cost = 0.0
         self.results = []
+        
+        # Request pacing for the concurrent run (see _throttle)
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+        
+        # cfg.method -> coroutine(text, cfg, filepath) writing the mp3
+        self._generators = {"standard": self._generate_standard}
+        self._generators.update(
+            (method, self._generate_accent_steered) for method in ACCENT_PROMPTS
+        )
     
-    def generate_standard_tts(
+    async def generate_standard_tts(
         self,
         text: str,
         model: str,
-        voice: str
-    ) -> bytes:
-        """Generate audio using standard TTS API"""
+        voice: str,
+        filepath: Path
+    ) -> int:
+        """Generate audio using standard TTS API, streamed straight to filepath"""
         
-        response = self.client.audio.speech.create(
+        async with self.client.audio.speech.with_streaming_response.create(
             model=model,
             voice=voice,
             input=text,
             response_format="mp3"
-        )
+        ) as response:
+            await response.stream_to_file(filepath)
         
-        return response.content
+        return filepath.stat().st_size
     
-    def generate_accent_steered_tts(
+    async def generate_accent_steered_tts(
         self,
         text: str,
         voice: str,
@@ -249,7 +455,7 @@ class TTSComparator:
             ACCENT_PROMPTS["accent_steered_light"]
         )
         
-        completion = self.client.chat.completions.create(
+        completion = await self.client.chat.completions.create(
             model="gpt-4o-audio-preview",
             modalities=["text", "audio"],
             audio={
@@ -274,105 +480,159 @@ class TTSComparator:
         
         return mp3_bytes
     
-    def generate_sample(
+    async def _generate_standard(self, text: str, cfg: TTSConfig, filepath: Path):
+        await self.generate_standard_tts(text, cfg.model, cfg.voice, filepath)
+    
+    async def _generate_accent_steered(self, text: str, cfg: TTSConfig, filepath: Path):
+        # Audio arrives base64 in the JSON body, so it is written here
+        audio_bytes = await self.generate_accent_steered_tts(text, cfg.voice, cfg.method)
+        await asyncio.to_thread(filepath.write_bytes, audio_bytes)
+    
+    async def _throttle(self):
+        """Space request starts evenly so a run stays under MAX_REQUESTS_PER_MINUTE"""
+        async with self._rate_lock:
+            now = time.monotonic()
+            if self._next_request_at > now:
+                await asyncio.sleep(self._next_request_at - now)
+            self._next_request_at = max(now, self._next_request_at) + 60 / self.MAX_REQUESTS_PER_MINUTE
+    
+    def _cache_path(self, sample: SampleText, cfg: TTSConfig) -> Path:
+        """
+        Cache location keyed on everything that shapes the audio.
+        
+        Text is NFC-normalized with whitespace collapsed, so edits that cannot
+        change the spoken output (re-wrapping, composed vs decomposed accents)
+        still hit the same entry.
+        """
+        text = " ".join(unicodedata.normalize("NFC", sample.text).split())
+        prompt = ACCENT_PROMPTS.get(cfg.method, "")
+        key = hashlib.sha256(
+            f"{text}|{cfg.model}|{cfg.voice}|{cfg.method}|{prompt}".encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{key}.mp3"
+    
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path):
+        """Hardlink the cached file into the run dir (copy across filesystems)"""
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+    
+    async def generate_sample(
         self,
-        text_key: str,
-        text_content: str,
-        config_key: str,
-        config: Dict
+        sample: SampleText,
+        cfg: TTSConfig
     ) -> Dict:
         """Generate a single audio sample"""
         
-        logger.info(f"Generating: {config_key} for text: {text_key}")
+        logger.info(f"Generating: {cfg.key} for text: {sample.key}")
         
         try:
-            # Generate audio based on method
-            if config["method"] == "standard":
-                audio_bytes = self.generate_standard_tts(
-                    text_content,
-                    config["model"],
-                    config["voice"]
-                )
-            else:
-                # Accent-steered method
-                audio_bytes = self.generate_accent_steered_tts(
-                    text_content,
-                    config["voice"],
-                    config["method"]
-                )
-            
-            # Save audio file
-            filename = f"{text_key}_{config_key}.mp3"
+            filename = f"{sample.key}_{cfg.key}.mp3"
             filepath = self.run_dir / filename
+            cache_path = self._cache_path(sample, cfg)
+            cache_hit = self.use_cache and cache_path.exists()
+            
+            if not cache_hit:
+                await self._throttle()
+                
+                # Written under .part first so the cache never holds a partial mp3
+                part_path = cache_path.with_name(cache_path.name + ".part")
+                
+                # Generate audio based on method
+                await self._generators[cfg.method](sample.text, cfg, part_path)
+                
+                os.replace(part_path, cache_path)
             
-            with open(filepath, "wb") as f:
-                f.write(audio_bytes)
+            # Save audio file
+            await asyncio.to_thread(self._link_or_copy, cache_path, filepath)
             
-            # Calculate cost
-            char_count = len(text_content)
-            cost = (char_count / 1000) * config["cost_per_1k_chars"]
+            # Calculate cost (cache hits are free)
+            char_count = TEXT_LENGTHS[sample.key]
+            cost = 0.0 if cache_hit else char_count * COST_PER_CHAR[cfg.key]
             
-            self.total_chars += char_count
+            if not cache_hit:
+                self.total_chars += char_count
             self.total_cost += cost
             
             result = {
-                "text_key": text_key,
-                "config_key": config_key,
+                "text_key": sample.key,
+                "config_key": cfg.key,
                 "filepath": str(filepath),
                 "filename": filename,
-                "model": config["model"],
-                "voice": config["voice"],
-                "method": config["method"],
+                "model": cfg.model,
+                "voice": cfg.voice,
+                "method": cfg.method,
                 "chars": char_count,
                 "cost_usd": cost,
-                "description": config["description"],
+                "description": cfg.description,
+                "cache_hit": cache_hit,
                 "status": "SUCCESS"
             }
             
-            logger.success(f"✓ Generated: {filename} (${cost:.4f})")
+            if cache_hit:
+                logger.success(f"♻️ Cached: {filename} ($0)")
+            else:
+                logger.success(f"✓ Generated: {filename} (${cost:.4f})")
             return result
             
         except Exception as e:
-            logger.error(f"✗ Failed: {config_key} - {str(e)}")
+            logger.error(f"✗ Failed: {cfg.key} - {str(e)}")
             return {
-                "text_key": text_key,
-                "config_key": config_key,
+                "text_key": sample.key,
+                "config_key": cfg.key,
                 "status": "FAILED",
                 "error": str(e)
             }
     
+    async def _generate_matrix(
+        self,
+        samples: List[SampleText],
+        configs: List[TTSConfig],
+        max_concurrency: int
+    ) -> List[Dict]:
+        """Run every (text, config) request concurrently, bounded by a semaphore"""
+        
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(sample: SampleText, cfg: TTSConfig) -> Dict:
+            async with sem:
+                return await self.generate_sample(sample, cfg)
+        
+        # The pool belongs to this event loop, so it lives exactly as long as
+        # the run and every sample after the first reuses a warm connection.
+        async with httpx.AsyncClient(limits=self.HTTP_LIMITS, timeout=self.HTTP_TIMEOUT) as http:
+            self.client = AsyncOpenAI(api_key=config.OPENAI_API_KEY, http_client=http)
+            try:
+                # generate_sample() never raises (failures become FAILED results);
+                # gather keeps the text × config order for the reports.
+                return await asyncio.gather(
+                    *(bounded(sample, cfg) for sample in samples for cfg in configs)
+                )
+            finally:
+                self.client = None
+    
     def generate_all_samples(
         self,
         text_keys: List[str] = None,
-        config_keys: List[str] = None
+        config_keys: List[str] = None,
+        max_concurrency: int = MAX_CONCURRENCY
     ):
         """Generate all combinations of texts and configs"""
         
         # Default to all texts and configs
-        if text_keys is None:
-            text_keys = list(TEST_TEXTS.keys())
-        if config_keys is None:
-            config_keys = list(TTS_CONFIGS.keys())
-        
-        logger.info(f"Generating {len(text_keys)} texts × {len(config_keys)} configs = {len(text_keys) * len(config_keys)} samples")
-        
-        for text_key in text_keys:
-            text_data = TEST_TEXTS[text_key]
-            logger.info(f"\n{'='*60}")
-            logger.info(f"{text_data['label']}")
-            logger.info(f"{'='*60}")
-            
-            for config_key in config_keys:
-                config = TTS_CONFIGS[config_key]
-                
-                result = self.generate_sample(
-                    text_key,
-                    text_data["text"],
-                    config_key,
-                    config
-                )
-                
-                self.results.append(result)
+        samples = TEST_TEXTS if text_keys is None else [TEXTS_BY_KEY[k] for k in text_keys]
+        configs = TTS_CONFIGS if config_keys is None else [CONFIGS_BY_KEY[k] for k in config_keys]
+        
+        logger.info(
+            f"Generating {len(samples)} texts × {len(configs)} configs = "
+            f"{len(samples) * len(configs)} samples (up to {max_concurrency} in parallel)"
+        )
+        
+        self.results.extend(
+            asyncio.run(self._generate_matrix(samples, configs, max_concurrency))
+        )
         
         logger.info(f"\n{'='*60}")
         logger.info(f"GENERATION COMPLETE")
@@ -386,68 +646,71 @@ class TTSComparator:
         
         report_path = self.run_dir / "COMPARISON_REPORT.md"
         
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write("# TTS ACCENT COMPARISON REPORT\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"**Total Samples:** {len(self.results)}\n")
-            f.write(f"**Total Cost:** ${self.total_cost:.2f} USD\n\n")
-            
-            f.write("---\n\n")
-            f.write("## 📊 RESULTS BY TEXT TYPE\n\n")
-            
-            # Group by text type
-            for text_key, text_data in TEST_TEXTS.items():
-                f.write(f"### {text_data['label']}\n\n")
-                f.write(f"**Text:** _{text_data['text']}_\n\n")
-                
-                # List all samples for this text
-                text_results = [r for r in self.results if r["text_key"] == text_key and r["status"] == "SUCCESS"]
-                
-                if text_results:
-                    f.write("| Model | Voice | Method | Cost | File |\n")
-                    f.write("|-------|-------|--------|------|------|\n")
-                    
-                    for result in text_results:
-                        f.write(f"| {result['model']} | {result['voice']} | {result['method']} | ${result['cost_usd']:.4f} | `{result['filename']}` |\n")
-                
-                f.write("\n")
-            
-            f.write("---\n\n")
-            f.write("## 🎯 CONFIGURATIONS TESTED\n\n")
-            
-            for config_key, config in TTS_CONFIGS.items():
-                f.write(f"### {config['label']}\n\n")
-                f.write(f"- **Model:** {config['model']}\n")
-                f.write(f"- **Voice:** {config['voice']}\n")
-                f.write(f"- **Method:** {config['method']}\n")
-                f.write(f"- **Cost:** ${config['cost_per_1k_chars']:.3f} per 1K chars\n")
-                f.write(f"- **Description:** {config['description']}\n\n")
-            
-            f.write("---\n\n")
-            f.write("## 🎧 HOW TO COMPARE\n\n")
-            f.write("1. **Busca el mismo texto** en diferentes archivos (ej: `greeting_*.mp3`)\n")
-            f.write("2. **Escucha las versiones** una tras otra\n")
-            f.write("3. **Evalúa:**\n")
-            f.write("   - ¿Suena italiano nativo o extranjero?\n")
-            f.write("   - ¿Las vocales son italianas o anglófonas?\n")
-            f.write("   - ¿La entonación es natural?\n")
-            f.write("   - ¿La pronunciación de términos técnicos es correcta?\n\n")
+        parts = []
+        parts.append("# TTS ACCENT COMPARISON REPORT\n\n")
+        parts.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        parts.append(f"**Total Samples:** {len(self.results)}\n")
+        parts.append(f"**Total Cost:** ${self.total_cost:.2f} USD\n\n")
+        
+        parts.append("---\n\n")
+        parts.append("## 📊 RESULTS BY TEXT TYPE\n\n")
+        
+        # Group by text type
+        for sample in TEST_TEXTS:
+            parts.append(f"### {sample.label}\n\n")
+            parts.append(f"**Text:** _{sample.text}_\n\n")
             
-            f.write("## 💡 RECOMMENDATIONS\n\n")
-            f.write("**Para DEMO rápido (precio bajo):**\n")
-            f.write("- `tts1hd_alloy` o `tts1hd_nova` (mejor calidad que tts-1)\n")
-            f.write("- Costo: ~$0.03/1K chars\n")
-            f.write("- Limitación: Acento anglófono persiste\n\n")
+            # List all samples for this text
+            text_results = [r for r in self.results if r["text_key"] == sample.key and r["status"] == "SUCCESS"]
             
-            f.write("**Para PRODUCCIÓN (calidad profesional):**\n")
-            f.write("- `gpt4o_audio_alloy_strong` (acento italiano fuerte)\n")
-            f.write("- Costo: ~$0.06/1K chars (2x más caro que HD)\n")
-            f.write("- Ventaja: Acento italiano nativo\n\n")
+            if text_results:
+                parts.append("| Model | Voice | Method | Cost | File |\n")
+                parts.append("|-------|-------|--------|------|------|\n")
+                parts.append("".join(
+                    f"| {r['model']} | {r['voice']} | {r['method']} | ${r['cost_usd']:.4f} | `{r['filename']}` |\n"
+                    for r in text_results
+                ))
             
-            f.write("**Si NINGUNO convence:**\n")
-            f.write("- Migrar a ElevenLabs (voces nativas italianas reales)\n")
-            f.write("- Costo: ~$0.30/1K chars (5x más caro)\n")
-            f.write("- Garantía: Calidad profesional broadcasting\n\n")
+            parts.append("\n")
+        
+        parts.append("---\n\n")
+        parts.append("## 🎯 CONFIGURATIONS TESTED\n\n")
+        
+        for cfg in TTS_CONFIGS:
+            parts.append(f"### {cfg.label}\n\n")
+            parts.append(f"- **Model:** {cfg.model}\n")
+            parts.append(f"- **Voice:** {cfg.voice}\n")
+            parts.append(f"- **Method:** {cfg.method}\n")
+            parts.append(f"- **Cost:** ${cfg.cost_per_1k_chars:.3f} per 1K chars\n")
+            parts.append(f"- **Description:** {cfg.description}\n\n")
+        
+        parts.append("---\n\n")
+        parts.append("## 🎧 HOW TO COMPARE\n\n")
+        parts.append("1. **Busca el mismo texto** en diferentes archivos (ej: `greeting_*.mp3`)\n")
+        parts.append("2. **Escucha las versiones** una tras otra\n")
+        parts.append("3. **Evalúa:**\n")
+        parts.append("   - ¿Suena italiano nativo o extranjero?\n")
+        parts.append("   - ¿Las vocales son italianas o anglófonas?\n")
+        parts.append("   - ¿La entonación es natural?\n")
+        parts.append("   - ¿La pronunciación de términos técnicos es correcta?\n\n")
+        
+        parts.append("## 💡 RECOMMENDATIONS\n\n")
+        parts.append("**Para DEMO rápido (precio bajo):**\n")
+        parts.append("- `tts1hd_alloy` o `tts1hd_nova` (mejor calidad que tts-1)\n")
+        parts.append("- Costo: ~$0.03/1K chars\n")
+        parts.append("- Limitación: Acento anglófono persiste\n\n")
+        
+        parts.append("**Para PRODUCCIÓN (calidad profesional):**\n")
+        parts.append("- `gpt4o_audio_alloy_strong` (acento italiano fuerte)\n")
+        parts.append("- Costo: ~$0.06/1K chars (2x más caro que HD)\n")
+        parts.append("- Ventaja: Acento italiano nativo\n\n")
+        
+        parts.append("**Si NINGUNO convence:**\n")
+        parts.append("- Migrar a ElevenLabs (voces nativas italianas reales)\n")
+        parts.append("- Costo: ~$0.30/1K chars (5x más caro)\n")
+        parts.append("- Garantía: Calidad profesional broadcasting\n\n")
+        
+        report_path.write_text("".join(parts), encoding="utf-8")
         
         logger.success(f"Report generated: {report_path}")
         return report_path
@@ -457,137 +720,34 @@ class TTSComparator:
         
         html_path = self.run_dir / "player.html"
         
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write("""<!DOCTYPE html>
-<html lang="it">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TTS Accent Comparison Player</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-        h1 {
-            color: #2c3e50;
-            text-align: center;
-        }
-        .text-section {
-            background: white;
-            padding: 20px;
-            margin: 20px 0;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .text-content {
-            background: #f8f9fa;
-            padding: 15px;
-            border-left: 4px solid #3498db;
-            margin: 10px 0;
-            font-style: italic;
-        }
-        .audio-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }
-        .audio-item {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 4px;
-            border: 1px solid #dee2e6;
-        }
-        .audio-label {
-            font-weight: bold;
-            color: #495057;
-            margin-bottom: 8px;
-            font-size: 14px;
-        }
-        .audio-description {
-            font-size: 12px;
-            color: #6c757d;
-            margin-bottom: 10px;
-        }
-        .cost-badge {
-            display: inline-block;
-            background: #28a745;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 3px;
-            font-size: 11px;
-            margin-left: 5px;
-        }
-        .cost-badge.expensive {
-            background: #ffc107;
-            color: #000;
-        }
-        audio {
-            width: 100%;
-            margin-top: 5px;
-        }
-        .legend {
-            background: #fff;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }
-        .legend-item {
-            display: inline-block;
-            margin-right: 20px;
-            font-size: 14px;
-        }
-    </style>
-</head>
-<body>
-    <h1>🎧 TTS Accent Comparison Player</h1>
-    
-    <div class="legend">
-        <strong>Leyenda de costos:</strong>
-        <span class="legend-item"><span class="cost-badge">$</span> Standard ($0.015-0.03/1K)</span>
-        <span class="legend-item"><span class="cost-badge expensive">$$</span> Premium ($0.06/1K)</span>
-    </div>
-    
-""")
+        sections = []
+        
+        # Group results by text type
+        for sample in TEST_TEXTS:
+            text_results = [r for r in self.results if r["text_key"] == sample.key and r["status"] == "SUCCESS"]
             
-            # Group results by text type
-            for text_key, text_data in TEST_TEXTS.items():
-                text_results = [r for r in self.results if r["text_key"] == text_key and r["status"] == "SUCCESS"]
-                
-                if not text_results:
-                    continue
-                
-                f.write(f'    <div class="text-section">\n')
-                f.write(f'        <h2>{text_data["label"]}</h2>\n')
-                f.write(f'        <div class="text-content">{text_data["text"]}</div>\n')
-                f.write(f'        <div class="audio-grid">\n')
-                
-                for result in text_results:
-                    config = TTS_CONFIGS[result["config_key"]]
-                    cost_class = "expensive" if result["cost_usd"] > 0.04 else ""
-                    
-                    f.write(f'            <div class="audio-item">\n')
-                    f.write(f'                <div class="audio-label">\n')
-                    f.write(f'                    {config["model"]} - {config["voice"]}\n')
-                    f.write(f'                    <span class="cost-badge {cost_class}">${result["cost_usd"]:.4f}</span>\n')
-                    f.write(f'                </div>\n')
-                    f.write(f'                <div class="audio-description">{config["description"]}</div>\n')
-                    f.write(f'                <audio controls preload="none">\n')
-                    f.write(f'                    <source src="{result["filename"]}" type="audio/mpeg">\n')
-                    f.write(f'                </audio>\n')
-                    f.write(f'            </div>\n')
-                
-                f.write(f'        </div>\n')
-                f.write(f'    </div>\n\n')
+            if not text_results:
+                continue
             
-            f.write("""
-</body>
-</html>
-""")
+            items = []
+            for result in text_results:
+                cfg = CONFIGS_BY_KEY[result["config_key"]]
+                items.append(_HTML_ITEM.substitute(
+                    model=html.escape(cfg.model),
+                    voice=html.escape(cfg.voice),
+                    cost_class="expensive" if result["cost_usd"] > 0.04 else "",
+                    cost=f"{result['cost_usd']:.4f}",
+                    description=html.escape(cfg.description),
+                    filename=html.escape(result["filename"], quote=True),
+                ))
+            
+            sections.append(_HTML_SECTION.substitute(
+                label=html.escape(sample.label),
+                text=html.escape(sample.text),
+                items="".join(items),
+            ))
+        
+        html_path.write_text(_HTML_HEAD + "".join(sections) + _HTML_TAIL, encoding="utf-8")
         
         logger.success(f"HTML player generated: {html_path}")
         logger.info(f"Open in browser: file://{html_path.absolute()}")
@@ -598,13 +758,111 @@ class TTSComparator:
 # MAIN EXECUTION
 # ============================================================================
 
-def main():
-    """Main execution"""
+QUICK_CONFIG_KEYS = (
+    "tts1hd_alloy",  # Standard HD baseline
+    "gpt4o_audio_alloy_strong",  # Accent steered (recommended)
+    "gpt4o_audio_nova",  # Alternative voice
+)
+QUICK_TEXT_KEYS = ("greeting", "technical")  # Just 2 representative texts
+
+# Selection of the last run, for one-keystroke reruns (--rerun)
+LAST_RUN_PATH = Path.home() / ".cache" / "voice_ai_tts" / "last_run.json"
+
+# Runs estimated above this (USD) ask for confirmation unless --yes
+ESTIMATE_CONFIRM_THRESHOLD = 0.25
+
+
+def estimate_cost(text_keys: List[str], config_keys: List[str]) -> float:
+    """Upper-bound USD cost of a run (cache hits would make it cheaper)"""
+    return sum(
+        TEXT_LENGTHS[t] * COST_PER_CHAR[c]
+        for t, c in product(text_keys, config_keys)
+    )
+
+
+def _split_keys(value: str, known: Dict, what: str) -> List[str]:
+    """argparse type for comma-separated config/text keys"""
+    keys = [k.strip() for k in value.split(",") if k.strip()]
+    unknown = [k for k in keys if k not in known]
+    if unknown or not keys:
+        raise argparse.ArgumentTypeError(
+            f"unknown {what}: {', '.join(unknown) or value!r} (choose from: {', '.join(known)})"
+        )
+    return keys
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate TTS samples to compare Italian accents. "
+                    "Without a selection option the interactive menu is shown."
+    )
+    parser.add_argument(
+        "--mode", choices=("full", "quick", "custom"),
+        help="full: every config × text; quick: 3 best configs × 2 texts; "
+             "custom: use --configs/--texts (default: all texts)"
+    )
+    parser.add_argument(
+        "--configs", type=lambda v: _split_keys(v, CONFIGS_BY_KEY, "config"),
+        help="Comma-separated config keys (overrides the mode's configs)"
+    )
+    parser.add_argument(
+        "--texts", type=lambda v: _split_keys(v, TEXTS_BY_KEY, "text"),
+        help="Comma-separated text keys (overrides the mode's texts)"
+    )
+    parser.add_argument(
+        "--rerun", action="store_true",
+        help=f"Repeat the selection of the last run ({LAST_RUN_PATH})"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=TTSComparator.MAX_CONCURRENCY,
+        help="Maximum samples generated in parallel"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Regenerate audio even if it is in the cache"
+    )
+    parser.add_argument(
+        "--estimate-only", action="store_true",
+        help="Print the estimated cost and exit without calling the API"
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true",
+        help=f"Do not ask for confirmation above ${ESTIMATE_CONFIRM_THRESHOLD:.2f}"
+    )
+    args = parser.parse_args(argv)
     
-    print("\n" + "="*70)
-    print("  TTS ACCENT COMPARISON TOOL")
-    print("  Generates audio samples to compare accents")
-    print("="*70 + "\n")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+    if args.mode == "custom" and not args.configs:
+        parser.error("--mode custom requires --configs")
+    args.interactive = not (args.mode or args.configs or args.texts or args.rerun)
+    return args
+
+
+def _selection_from_args(args: argparse.Namespace):
+    """(text_keys, config_keys) for a non-interactive run"""
+    if args.rerun:
+        try:
+            last = json.loads(LAST_RUN_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"ERROR: No previous run to repeat ({LAST_RUN_PATH}): {e}")
+            sys.exit(1)
+        return last["text_keys"], last["config_keys"]
+    
+    if args.mode == "full":
+        text_keys = [sample.key for sample in TEST_TEXTS]
+        config_keys = [cfg.key for cfg in TTS_CONFIGS]
+    elif args.mode == "custom":
+        text_keys = [sample.key for sample in TEST_TEXTS]
+        config_keys = []
+    else:
+        text_keys, config_keys = list(QUICK_TEXT_KEYS), list(QUICK_CONFIG_KEYS)
+    
+    return args.texts or text_keys, args.configs or config_keys
+
+
+def _interactive_selection():
+    """(text_keys, config_keys) picked from the interactive menu"""
     
     # Ask user which configs to test
     print("Which configurations do you want to test?\n")
@@ -616,35 +874,75 @@ def main():
     
     if choice == "1":
         # All configs
-        config_keys = list(TTS_CONFIGS.keys())
-        text_keys = list(TEST_TEXTS.keys())
+        config_keys = [cfg.key for cfg in TTS_CONFIGS]
+        text_keys = [sample.key for sample in TEST_TEXTS]
     elif choice == "2":
         # Quick comparison - best options only
-        config_keys = [
-            "tts1hd_alloy",  # Standard HD baseline
-            "gpt4o_audio_alloy_strong",  # Accent steered (recommended)
-            "gpt4o_audio_nova"  # Alternative voice
-        ]
-        text_keys = ["greeting", "technical"]  # Just 2 representative texts
+        config_keys = list(QUICK_CONFIG_KEYS)
+        text_keys = list(QUICK_TEXT_KEYS)
     else:
         # Custom selection
         print("\nAvailable configs:")
-        for i, (key, cfg) in enumerate(TTS_CONFIGS.items(), 1):
-            print(f"{i}. {cfg['label']}")
+        for i, cfg in enumerate(TTS_CONFIGS, 1):
+            print(f"{i}. {cfg.label}")
         
         selected = input("\nComma-separated numbers (e.g., 1,3,5): ").strip()
         indices = [int(x.strip())-1 for x in selected.split(",")]
-        config_keys = [list(TTS_CONFIGS.keys())[i] for i in indices]
+        config_keys = [TTS_CONFIGS[i].key for i in indices]
         
-        text_keys = list(TEST_TEXTS.keys())
+        text_keys = [sample.key for sample in TEST_TEXTS]
+    
+    return text_keys, config_keys
+
+
+def _save_last_run(text_keys: List[str], config_keys: List[str]):
+    try:
+        LAST_RUN_PATH.parent.mkdir(parents=True, exist_ok=True)
+        LAST_RUN_PATH.write_text(
+            json.dumps({"text_keys": text_keys, "config_keys": config_keys}),
+            encoding="utf-8"
+        )
+    except OSError as e:
+        logger.warning(f"Could not save last run selection: {e}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main execution"""
+    
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    
+    print("\n" + "="*70)
+    print("  TTS ACCENT COMPARISON TOOL")
+    print("  Generates audio samples to compare accents")
+    print("="*70 + "\n")
+    
+    if args.interactive:
+        text_keys, config_keys = _interactive_selection()
+    else:
+        text_keys, config_keys = _selection_from_args(args)
+    
+    estimate = estimate_cost(text_keys, config_keys)
+    print(f"\n💰 Estimated total: ${estimate:.2f} (cached samples are free)")
+    if args.estimate_only:
+        return
+    if estimate > ESTIMATE_CONFIRM_THRESHOLD and not args.yes:
+        try:
+            answer = input("Continue? [y/N]: ").strip().lower()
+        except EOFError:
+            answer = ""
+        if answer not in ("y", "yes"):
+            print("Aborted, nothing was generated.")
+            return
+    
+    _save_last_run(text_keys, config_keys)
     
     print(f"\n✓ Generando {len(config_keys)} configs × {len(text_keys)} textos = {len(config_keys) * len(text_keys)} samples\n")
     
     # Create comparator and generate
-    comparator = TTSComparator()
+    comparator = TTSComparator(use_cache=not args.no_cache)
     
     try:
-        comparator.generate_all_samples(text_keys, config_keys)
+        comparator.generate_all_samples(text_keys, config_keys, max_concurrency=args.concurrency)
         
         # Generate reports
         report_path = comparator.generate_report()
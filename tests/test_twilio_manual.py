@@ -17,13 +17,39 @@ if __name__ != "__main__":
         allow_module_level=True,
     )
 
+import io
+import json
+import statistics
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote_plus
+from xml.etree import ElementTree as ET
+
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:5000"
 
+# Keep-alive connections reused by every request of the run; the pool is
+# sized so that all scenarios can run in parallel without blocking on it
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Every measured turn is appended here; the rolling median of the last
+# HISTORY_WINDOW runs of a (scenario, turn) is its latency baseline
+LATENCY_HISTORY = Path(__file__).with_name(".latency_history.jsonl")
+HISTORY_WINDOW = 20
+REGRESSION_FACTOR = 1.3
+_history_lock = threading.Lock()
+
+# /voice/gather bodies have a fixed shape: encode them directly instead of
+# going through requests' dict -> urlencode path on every turn
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 # ============================================================================
 # TEST SCENARIOS
 # ============================================================================
@@ -92,63 +118,172 @@ SCENARIOS = {
     }
 }
 
+# Menu text and scenario order are fixed at import: render them once
+MENU_TEXT = (
+    "\n📋 MENU:\n"
+    "\n  PREDEFINED SCENARIOS:\n"
+    + "".join(f"    {key}. {scenario['name']}\n" for key, scenario in SCENARIOS.items())
+    + "\n  OTHER:\n"
+    "    i. Interactive mode (free-form conversation)\n"
+    "    a. Run ALL scenarios\n"
+    "    q. Quit"
+)
+SCENARIO_KEYS = tuple(SCENARIOS)
+
 
 # ============================================================================
 # HELPERS
 # ============================================================================
 
+_HEADER_BAR = "=" * 70
+
+
 def print_header(text: str):
-    """Print formatted header"""
-    print("\n" + "=" * 70)
-    print(f"  {text}")
-    print("=" * 70 + "\n")
+    """Print formatted header (one write, so parallel scenarios don't split it)"""
+    sys.stdout.write(f"\n{_HEADER_BAR}\n  {text}\n{_HEADER_BAR}\n\n")
 
 
-def print_turn(turn_num: int, role: str, message: str, latency: float = None):
-    """Print conversation turn"""
+def format_turn(turn_num: int, role: str, message: str, latency: float = None) -> str:
+    """Format conversation turn"""
     if role == "USER":
-        print(f"\n[Turn {turn_num}] 👤 USER: {message}")
-    else:
-        latency_str = f" ({latency:.0f}ms)" if latency else ""
-        print(f"[Turn {turn_num}] 🤖 ASSISTANT{latency_str}: {message[:150]}...")
-        if len(message) > 150:
-            print(f"           [Total: {len(message)} chars]")
+        return f"\n[Turn {turn_num}] 👤 USER: {message}\n"
+    latency_str = f" ({latency:.0f}ms)" if latency else ""
+    text = f"[Turn {turn_num}] 🤖 ASSISTANT{latency_str}: {message[:150]}...\n"
+    if len(message) > 150:
+        text += f"           [Total: {len(message)} chars]\n"
+    return text
 
 
-def extract_response_from_twiml(twiml_text: str) -> str:
-    """Extract <Say> text from TwiML"""
-    from xml.etree import ElementTree as ET
+def print_turn(turn_num: int, role: str, message: str, latency: float = None):
+    """Print conversation turn (one write per turn)"""
+    sys.stdout.write(format_turn(turn_num, role, message, latency))
+
+
+def load_latency_baselines(scenario_key: str) -> dict[int, float]:
+    """Rolling median latency (ms) per turn of a scenario, from the history log
+    
+    Only sequential runs count: latencies measured while scenarios run
+    concurrently are inflated by contention.
+    """
+    samples: dict[int, list[float]] = {}
     try:
-        root = ET.fromstring(twiml_text)
-        
-        # Find all <Say> elements within <Gather>
-        gather = root.find(".//Gather")
-        if gather is not None:
-            say = gather.find("Say")
-            if say is not None and say.text:
-                return say.text
-        
-        # Fallback: find any <Say>
-        say = root.find(".//Say")
-        if say is not None and say.text:
-            return say.text
-        
-        return "[No response text found]"
-    except Exception as e:
-        return f"[Error parsing TwiML: {e}]"
+        with LATENCY_HISTORY.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("scenario") == scenario_key and not entry.get("parallel"):
+                    samples.setdefault(entry["turn"], []).append(entry["latency_ms"])
+    except FileNotFoundError:
+        return {}
+    
+    return {
+        turn: statistics.median(latencies[-HISTORY_WINDOW:])
+        for turn, latencies in samples.items()
+    }
 
 
-def check_hangup(twiml_text: str) -> bool:
-    """Check if TwiML contains <Hangup>"""
-    return "<Hangup" in twiml_text
+def record_latency(scenario_key: str, turn_num: int, latency_ms: float, parallel: bool = False):
+    """Append one measured turn to the history log (one write per record)"""
+    record = {
+        "scenario": scenario_key,
+        "turn": turn_num,
+        "latency_ms": round(latency_ms, 1),
+        "ts": time.time(),
+        "parallel": parallel,
+    }
+    with _history_lock, LATENCY_HISTORY.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def gather_body(call_sid: str, user_input: str) -> bytes:
+    """Form-encoded /voice/gather body for one turn"""
+    confidence = "0.95" if user_input else "0.0"
+    return (
+        f"CallSid={quote_plus(call_sid)}"
+        f"&SpeechResult={quote_plus(user_input)}"
+        f"&Confidence={confidence}"
+    ).encode()
+
+
+def parse_twiml(twiml_text: str) -> tuple[str, bool]:
+    """Extract <Say> text and detect <Hangup> with a single TwiML parse"""
+    try:
+        root = ET.fromstring(twiml_text)
+    except Exception as e:
+        return f"[Error parsing TwiML: {e}]", False
+    
+    # TwiML verbs are direct children of <Response>, so a single pass over
+    # them finds everything. Prefer a <Say> nested in <Gather>.
+    gather_say = say_text = None
+    hung_up = False
+    for verb in root:
+        if verb.tag == "Gather":
+            if gather_say is None:
+                for child in verb:
+                    if child.tag == "Say" and child.text:
+                        gather_say = child.text
+                        break
+        elif verb.tag == "Say":
+            if say_text is None and verb.text:
+                say_text = verb.text
+        elif verb.tag == "Hangup":
+            hung_up = True
+    
+    return gather_say or say_text or "[No response text found]", hung_up
 
 
 # ============================================================================
 # TEST RUNNER
 # ============================================================================
 
-def run_scenario(scenario_key: str, call_sid: str = None):
-    """Run a single test scenario"""
+def warmup(session: requests.Session = SESSION):
+    """Pay server cold-start costs (lazy imports, first DB/LLM client setup,
+    pooled connections) once, before any turn latency is measured"""
+    call_sid = f"WARMUP_{int(time.time())}"
+    try:
+        session.get(f"{BASE_URL}/health", timeout=2)
+        session.post(
+            f"{BASE_URL}/voice/incoming",
+            data={
+                "CallSid": call_sid,
+                "From": "+391234567890",
+                "To": "+390212345678"
+            },
+            timeout=10
+        )
+        # Let the server drop the warm-up call session right away
+        session.post(
+            f"{BASE_URL}/voice/status",
+            data={"CallSid": call_sid, "CallStatus": "completed"},
+            timeout=2
+        )
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"⚠️ Warm-up failed: {e}")
+
+
+def latency_percentiles(latencies: list[float]) -> tuple[float, float]:
+    """(p50, p95) in ms of a non-empty latency sample"""
+    if len(latencies) < 2:
+        return latencies[0], latencies[0]
+    cuts = statistics.quantiles(latencies, n=20, method="inclusive")
+    return cuts[9], cuts[18]
+
+
+def run_scenario(
+    scenario_key: str,
+    call_sid: str = None,
+    session: requests.Session = SESSION,
+    out_latencies: list[float] | None = None,
+    parallel: bool = False
+):
+    """Run a single test scenario (turns are sent sequentially).
+    
+    Measured turn latencies (ms) are appended to out_latencies if given.
+    parallel marks runs sharing the server with other scenarios: their
+    latencies are logged but kept out of the baselines.
+    """
     
     scenario = SCENARIOS[scenario_key]
     call_sid = call_sid or f"TEST_MANUAL_{scenario_key}_{int(time.time())}"
@@ -157,10 +292,12 @@ def run_scenario(scenario_key: str, call_sid: str = None):
     print(f"Description: {scenario['description']}")
     print(f"Call SID: {call_sid}")
     
+    baselines = load_latency_baselines(scenario_key)
+    
     # Start call
     print("\n📞 Starting call...")
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/voice/incoming",
             data={
                 "CallSid": call_sid,
@@ -174,7 +311,7 @@ def run_scenario(scenario_key: str, call_sid: str = None):
             print(f"❌ Failed to start call: {response.status_code}")
             return False
         
-        greeting = extract_response_from_twiml(response.text)
+        greeting, _ = parse_twiml(response.text)
         print(f"\n[Greeting] 🤖 ASSISTANT: {greeting}")
     
     except Exception as e:
@@ -190,45 +327,61 @@ def run_scenario(scenario_key: str, call_sid: str = None):
         expected_latency = turn["expected_latency"]
         
         print_turn(turn_num, "USER", user_input or "[silence]")
+        sys.stdout.flush()
         
+        # Everything printed after the response is emitted in one write
+        out = io.StringIO()
         try:
-            start_time = time.time()
-            response = requests.post(
+            start_ns = time.perf_counter_ns()
+            response = session.post(
                 f"{BASE_URL}/voice/gather",
-                data={
-                    "CallSid": call_sid,
-                    "SpeechResult": user_input,
-                    "Confidence": "0.95" if user_input else "0.0"
-                },
+                data=gather_body(call_sid, user_input),
+                headers=FORM_HEADERS,
                 timeout=15
             )
-            actual_latency = (time.time() - start_time) * 1000
+            actual_latency = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             if response.status_code != 200:
-                print(f"❌ Failed: HTTP {response.status_code}")
+                out.write(f"❌ Failed: HTTP {response.status_code}\n")
                 all_passed = False
                 continue
             
             # Extract response
-            ai_response = extract_response_from_twiml(response.text)
-            print_turn(turn_num, "ASSISTANT", ai_response, actual_latency)
+            ai_response, hung_up = parse_twiml(response.text)
+            out.write(format_turn(turn_num, "ASSISTANT", ai_response, actual_latency))
             
-            # Check latency
-            if actual_latency > expected_latency * 1.5:  # 50% tolerance
-                print(f"⚠️  WARNING: High latency! Expected ~{expected_latency}ms, got {actual_latency:.0f}ms")
+            # Check latency against the rolling median of previous runs;
+            # without history fall back to the hardcoded expectation
+            baseline = baselines.get(turn_num)
+            if baseline is not None:
+                limit = baseline * REGRESSION_FACTOR
+                expected_str = f"baseline ~{baseline:.0f}ms"
+            else:
+                limit = expected_latency * 1.5  # 50% tolerance
+                expected_str = f"expected ~{expected_latency}ms"
+            record_latency(scenario_key, turn_num, actual_latency, parallel=parallel)
+            if out_latencies is not None:
+                out_latencies.append(actual_latency)
+            
+            if actual_latency > limit:
+                out.write(f"⚠️  WARNING: High latency! {expected_str}, got {actual_latency:.0f}ms\n")
                 all_passed = False
             else:
-                print(f"✓ Latency OK: {actual_latency:.0f}ms (expected ~{expected_latency}ms)")
+                out.write(f"✓ Latency OK: {actual_latency:.0f}ms ({expected_str})\n")
             
             # Check if call ended
-            if check_hangup(response.text):
-                print("\n📞 Call ended (Hangup detected)")
+            if hung_up:
+                out.write("\n📞 Call ended (Hangup detected)\n")
                 break
             
         except Exception as e:
-            print(f"❌ Error on turn {turn_num}: {e}")
+            out.write(f"❌ Error on turn {turn_num}: {e}\n")
             all_passed = False
         
+        finally:
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+        
         turn_num += 1
         time.sleep(0.5)  # Brief pause between turns
     
@@ -254,7 +407,7 @@ def interactive_mode():
     # Start call
     print("📞 Starting call...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/voice/incoming",
             data={
                 "CallSid": call_sid,
@@ -264,7 +417,7 @@ def interactive_mode():
             timeout=10
         )
         
-        greeting = extract_response_from_twiml(response.text)
+        greeting, _ = parse_twiml(response.text)
         print(f"\n🤖 ASSISTANT: {greeting}\n")
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -288,32 +441,33 @@ def interactive_mode():
         if not user_input:
             print("⚠️  Empty input - simulating silence")
         
+        out = io.StringIO()
         try:
-            start_time = time.time()
-            response = requests.post(
+            start_ns = time.perf_counter_ns()
+            response = SESSION.post(
                 f"{BASE_URL}/voice/gather",
-                data={
-                    "CallSid": call_sid,
-                    "SpeechResult": user_input,
-                    "Confidence": "0.95" if user_input else "0.0"
-                },
+                data=gather_body(call_sid, user_input),
+                headers=FORM_HEADERS,
                 timeout=15
             )
-            latency = (time.time() - start_time) * 1000
+            latency = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             if response.status_code != 200:
-                print(f"❌ Error: HTTP {response.status_code}")
+                out.write(f"❌ Error: HTTP {response.status_code}\n")
                 continue
             
-            ai_response = extract_response_from_twiml(response.text)
-            print(f"\n🤖 ASSISTANT ({latency:.0f}ms): {ai_response}")
+            ai_response, hung_up = parse_twiml(response.text)
+            out.write(f"\n🤖 ASSISTANT ({latency:.0f}ms): {ai_response}\n")
             
-            if check_hangup(response.text):
-                print("\n📞 Call ended")
+            if hung_up:
+                out.write("\n📞 Call ended\n")
                 break
             
         except Exception as e:
-            print(f"❌ Error: {e}")
+            out.write(f"❌ Error: {e}\n")
+        
+        finally:
+            sys.stdout.write(out.getvalue())
         
         turn_num += 1
 
@@ -327,26 +481,20 @@ def main():
     
     # Check server
     try:
-        requests.get(f"{BASE_URL}/health", timeout=2)
+        SESSION.get(f"{BASE_URL}/health", timeout=2)
     except requests.exceptions.RequestException:
         print(f"❌ ERROR: Server not responding at {BASE_URL}")
         print(f"Make sure server is running: python server.py\n")
         sys.exit(1)
     
+    warmup()
+    
     print("\n" + "=" * 70)
     print("  TWILIO VOICE SERVER - MANUAL TEST SUITE")
     print("=" * 70)
     
     while True:
-        print("\n📋 MENU:")
-        print("\n  PREDEFINED SCENARIOS:")
-        for key, scenario in SCENARIOS.items():
-            print(f"    {key}. {scenario['name']}")
-        
-        print("\n  OTHER:")
-        print("    i. Interactive mode (free-form conversation)")
-        print("    a. Run ALL scenarios")
-        print("    q. Quit")
+        print(MENU_TEXT)
         
         choice = input("\n👉 Select an option: ").strip().lower()
         
@@ -358,17 +506,37 @@ def main():
             interactive_mode()
         
         elif choice == 'a':
-            print("\n🚀 Running ALL scenarios...\n")
-            results = []
-            for key in SCENARIOS.keys():
-                passed = run_scenario(key)
-                results.append((SCENARIOS[key]['name'], passed))
-                time.sleep(1)
+            print("\n🚀 Running ALL scenarios in parallel...\n")
+            # Re-warm: the menu may have sat idle since startup
+            warmup()
+            # Each scenario has its own CallSid, so they are independent;
+            # output of concurrent scenarios may interleave, see FINAL RESULTS
+            latencies = {key: [] for key in SCENARIO_KEYS}
+            with ThreadPoolExecutor(max_workers=len(SCENARIO_KEYS)) as pool:
+                futures = [
+                    pool.submit(
+                        run_scenario, key, session=SESSION,
+                        out_latencies=latencies[key], parallel=True
+                    )
+                    for key in SCENARIO_KEYS
+                ]
+                results = [None] * len(SCENARIO_KEYS)
+                for i, (key, future) in enumerate(zip(SCENARIO_KEYS, futures)):
+                    results[i] = (SCENARIOS[key]['name'], future.result(), latencies[key])
             
             print_header("FINAL RESULTS")
-            for name, passed in results:
+            for name, passed, scenario_latencies in results:
                 status = "✅ PASS" if passed else "⚠️  WARNINGS"
-                print(f"  {status}: {name}")
+                stats = ""
+                if scenario_latencies:
+                    p50, p95 = latency_percentiles(scenario_latencies)
+                    stats = f" (p50 {p50:.0f}ms, p95 {p95:.0f}ms)"
+                print(f"  {status}: {name}{stats}")
+            
+            all_latencies = [ms for *_, scenario_latencies in results for ms in scenario_latencies]
+            if all_latencies:
+                p50, p95 = latency_percentiles(all_latencies)
+                print(f"\n  📊 All turns: {len(all_latencies)} measured, p50 {p50:.0f}ms, p95 {p95:.0f}ms")
         
         elif choice in SCENARIOS:
             run_scenario(choice)